@@ -197,6 +197,14 @@ CACHES = {
     }
 }
 
+# Max memory (in MB) each process may use to keep recently used leagues in memory,
+# in front of the database cache.
+LOCAL_CACHE_MAX_MB = int(os.getenv("LOCAL_CACHE_MAX_MB", "256"))
+
+# Number of worker processes shared by all playoff odds simulations in this process.
+# With 1 (the default), simulations run in the request's own process.
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", "1"))
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
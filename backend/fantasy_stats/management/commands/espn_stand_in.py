@@ -0,0 +1,107 @@
+"""
+Management command to serve ESPN API responses from a local stand-in server,
+and to benchmark league builds against it
+"""
+
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.src.doritostats.espn_requests import configure_espn_session
+from backend.src.doritostats.espn_stand_in import (
+    ESPNStandIn,
+    FixtureResponder,
+    SyntheticLeague,
+)
+from backend.src.doritostats.fetch_utils import fetch_league
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve recorded (or synthetic) ESPN responses locally. "
+        "Set ESPN_STAND_IN_URL to the printed URL to send the app's ESPN requests to it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixtures",
+            default=None,
+            help="Directory of fixtures saved by `record_espn_fixtures`",
+        )
+        parser.add_argument(
+            "--synthetic",
+            action="store_true",
+            help="Serve a made-up league (league_id=1, league_year=2023) instead of fixtures",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0,
+            help="Seconds to wait before each response",
+        )
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--benchmark",
+            type=int,
+            default=0,
+            help="Instead of serving forever, build the league this many times and report timings",
+        )
+        parser.add_argument("--league-id", type=int, default=None)
+        parser.add_argument("--league-year", type=int, default=None)
+
+    def handle(self, *args, **options):
+        if options["synthetic"]:
+            responder = SyntheticLeague()
+            league_id = options["league_id"] or responder.league_id
+            league_year = options["league_year"] or responder.year
+        elif options["fixtures"]:
+            responder = FixtureResponder(options["fixtures"])
+            league_id = options["league_id"]
+            league_year = options["league_year"]
+        else:
+            raise CommandError("Either --fixtures or --synthetic is required")
+
+        stand_in = ESPNStandIn(
+            responder, latency=options["latency"], port=options["port"]
+        )
+        with stand_in:
+            self.stdout.write(f"Serving {responder} at {stand_in.url}")
+
+            if not options["benchmark"]:
+                self.stdout.write(f"Set ESPN_STAND_IN_URL={stand_in.url} to use it")
+                try:
+                    while True:
+                        time.sleep(1)
+                except KeyboardInterrupt:
+                    return
+
+            if league_id is None or league_year is None:
+                raise CommandError(
+                    "--league-id and --league-year are required to benchmark fixtures"
+                )
+            self.benchmark(stand_in, league_id, league_year, options["benchmark"])
+
+    def benchmark(
+        self, stand_in: ESPNStandIn, league_id: int, league_year: int, n: int
+    ) -> None:
+        configure_espn_session(stand_in_url=stand_in.url)
+        build_times, box_score_times = [], []
+        for _ in range(n):
+            start = time.perf_counter()
+            league = fetch_league(league_id=league_id, year=league_year)
+            build_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for week in range(1, league.current_week + 1):
+                league.box_scores(week)
+            box_score_times.append(time.perf_counter() - start)
+        configure_espn_session()
+
+        for name, times in [
+            ("League build", build_times),
+            (f"Box scores (weeks 1-{league.current_week})", box_score_times),
+        ]:
+            self.stdout.write(
+                f"{name}: median {np.median(times):.3f}s, min {np.min(times):.3f}s, max {np.max(times):.3f}s ({n} runs)"
+            )
@@ -0,0 +1,53 @@
+"""
+Management command to preload leagues into the cache, e.g. after every NFL game slot
+"""
+
+from django.core.management.base import BaseCommand
+
+from backend.fantasy_stats.models import LeagueInfo
+from backend.fantasy_stats.views import preload_leagues
+from backend.src.doritostats.django_utils import CURRENT_YEAR
+
+
+class Command(BaseCommand):
+    help = "Fetch leagues concurrently and cache them (and their snapshots), reporting the time taken by each"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, default=CURRENT_YEAR)
+        parser.add_argument(
+            "--league-id",
+            type=int,
+            action="append",
+            dest="league_ids",
+            help="League to preload (may be repeated). Defaults to every league of the year.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Refresh leagues even if their cached copy is fresh",
+        )
+
+    def handle(self, *args, **options):
+        league_infos = LeagueInfo.objects.filter(league_year=options["year"])
+        if options["league_ids"]:
+            league_infos = league_infos.filter(league_id__in=options["league_ids"])
+        leagues = list(
+            league_infos.values_list("league_id", "league_year")
+            .distinct()
+            .order_by("league_id")
+        )
+
+        self.stdout.write(f"Preloading {len(leagues)} leagues...")
+        results = preload_leagues(leagues, force=options["force"])
+        for result in results:
+            line = f"  - {result['league_id']} ({result['league_year']}): {result['status']} in {result['seconds']:.1f}s"
+            if result["status"] == "failed":
+                self.stdout.write(self.style.ERROR(f"{line}: {result['error']}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(line))
+
+        n_failed = sum(result["status"] == "failed" for result in results)
+        n_refreshed = sum(result["status"] == "refreshed" for result in results)
+        self.stdout.write(
+            f"Done: {n_refreshed} refreshed, {len(results) - n_refreshed - n_failed} already cached, {n_failed} failed"
+        )
@@ -0,0 +1,58 @@
+"""
+Management command to record the ESPN responses used to build a league, for
+replaying them offline with the `espn_stand_in` command
+"""
+
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.fantasy_stats.models import LeagueInfo
+from backend.src.doritostats.espn_requests import configure_espn_session
+from backend.src.doritostats.fetch_utils import fetch_league
+
+
+class Command(BaseCommand):
+    help = "Record the ESPN responses for a league (league build and box scores) as fixtures"
+
+    def add_arguments(self, parser):
+        parser.add_argument("league_id", type=int)
+        parser.add_argument("league_year", type=int)
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Directory to save the fixtures to (default: espn_fixtures/<league_id>_<league_year>)",
+        )
+
+    def handle(self, *args, **options):
+        league_id = options["league_id"]
+        league_year = options["league_year"]
+        output = options["output"] or os.path.join(
+            "espn_fixtures", f"{league_id}_{league_year}"
+        )
+
+        try:
+            league_info = LeagueInfo.objects.get(
+                league_id=league_id, league_year=league_year
+            )
+        except LeagueInfo.DoesNotExist:
+            raise CommandError(f"League {league_id} ({league_year}) does not exist")
+
+        configure_espn_session(record_dir=output)
+        try:
+            league = fetch_league(
+                league_id=league_id,
+                year=league_year,
+                swid=league_info.swid,
+                espn_s2=league_info.espn_s2,
+            )
+            for week in range(1, league.current_week + 1):
+                league.box_scores(week)
+        finally:
+            # Stop recording
+            configure_espn_session()
+
+        n_fixtures = len([f for f in os.listdir(output) if f.endswith(".json")])
+        self.stdout.write(
+            self.style.SUCCESS(f"Saved {n_fixtures} ESPN responses to {output}")
+        )
@@ -0,0 +1,71 @@
+"""
+Management command that keeps the cached leagues of the current season fresh,
+refreshing them after NFL games are played so that views never wait on ESPN
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from backend.fantasy_stats.models import LeagueInfo
+from backend.fantasy_stats.views import preload_leagues
+from backend.src.doritostats.django_utils import CURRENT_YEAR
+from backend.src.doritostats.nfl_calendar import IDLE_REFRESH_INTERVAL
+
+
+class Command(BaseCommand):
+    help = "Refresh cached leagues whenever NFL games have been played since they were fetched"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Refresh the stale leagues once and exit, instead of running forever",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=60,
+            help="Seconds between checks for stale leagues",
+        )
+        parser.add_argument("--year", type=int, default=CURRENT_YEAR)
+
+    def handle(self, *args, **options):
+        # Leagues that failed to refresh are retried after IDLE_REFRESH_INTERVAL
+        failed_at = {}
+
+        while True:
+            self.refresh_stale_leagues(options["year"], failed_at)
+            if options["once"]:
+                return
+            time.sleep(options["poll_interval"])
+
+    def refresh_stale_leagues(self, year: int, failed_at: dict) -> None:
+        now = time.time()
+        leagues = [
+            league
+            for league in LeagueInfo.objects.filter(league_year=year)
+            .values_list("league_id", "league_year")
+            .distinct()
+            if now - failed_at.get(league, 0) >= IDLE_REFRESH_INTERVAL
+        ]
+
+        # Leagues that are cached and fresh are skipped, and leagues that a request
+        # or background refresh is already refreshing share its lease instead of
+        # being fetched again
+        for result in preload_leagues(leagues):
+            league = (result["league_id"], result["league_year"])
+            if result["status"] == "failed":
+                failed_at[league] = now
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"  - {league[0]} ({league[1]}): {result['error']}"
+                    )
+                )
+            elif result["status"] == "refreshed":
+                failed_at.pop(league, None)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"  - {league[0]} ({league[1]}): refreshed in {result['seconds']:.1f}s"
+                    )
+                )
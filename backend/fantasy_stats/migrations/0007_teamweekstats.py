@@ -0,0 +1,63 @@
+# Generated by Django 5.1.7 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fantasy_stats", "0006_alter_leagueinfo_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamWeekStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("league_id", models.IntegerField()),
+                ("year", models.IntegerField()),
+                ("week", models.IntegerField()),
+                ("team_id", models.IntegerField()),
+                ("location", models.CharField(max_length=10)),
+                ("team_owner", models.CharField(max_length=200)),
+                ("team_name", models.CharField(max_length=200)),
+                (
+                    "team_division",
+                    models.CharField(blank=True, default="", max_length=200),
+                ),
+                ("team_score", models.FloatField()),
+                ("opp_owner", models.CharField(max_length=200)),
+                ("opp_name", models.CharField(max_length=200)),
+                (
+                    "opp_division",
+                    models.CharField(blank=True, default="", max_length=200),
+                ),
+                ("opp_score", models.FloatField()),
+                ("is_regular_season", models.BooleanField()),
+                ("is_playoff", models.BooleanField()),
+                ("stats", models.JSONField(default=dict)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["league_id", "year", "week"],
+                        name="team_week_stats_league_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("league_id", "year", "week", "team_id"),
+                        name="unique_team_week_stats",
+                    )
+                ],
+            },
+        ),
+    ]
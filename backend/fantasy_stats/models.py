@@ -43,3 +43,44 @@ class LeagueInfo(models.Model):
 
     def get_absolute_url(self):
         return f"/fantasy_stats/league/{self.league_year}/{self.league_id}/"
+
+
+class TeamWeekStats(models.Model):
+    """One team's result and lineup stats in one completed week (a row of `get_stats_by_matchup`)"""
+
+    league_id = models.IntegerField()
+    year = models.IntegerField()
+    week = models.IntegerField()
+    team_id = models.IntegerField()
+    location = models.CharField(max_length=10)
+    team_owner = models.CharField(max_length=200)
+    team_name = models.CharField(max_length=200)
+    team_division = models.CharField(max_length=200, blank=True, default="")
+    team_score = models.FloatField()
+    opp_owner = models.CharField(max_length=200)
+    opp_name = models.CharField(max_length=200)
+    opp_division = models.CharField(max_length=200, blank=True, default="")
+    opp_score = models.FloatField()
+    is_regular_season = models.BooleanField()
+    is_playoff = models.BooleanField()
+    # Lineup stats (lineup_efficiency, QB_pts, best_QB, ...), keyed by column name
+    stats = models.JSONField(default=dict)
+    updated_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["league_id", "year", "week", "team_id"],
+                name="unique_team_week_stats",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["league_id", "year", "week"], name="team_week_stats_league_idx"
+            )
+        ]
+
+    def __str__(self):
+        return "{} ({}) Week {}: {}".format(
+            self.league_id, self.year, self.week, self.team_name
+        )
@@ -18,6 +18,7 @@ urlpatterns = [
     path("api/distinct-leagues-previous/", views.get_distinct_leagues_previous_year),
     path("api/copy-old-league/<int:league_id>/", views.copy_old_league),
     path("api/league-input/", views.league_input),
+    path("api/preload-leagues/", views.preload_leagues_view),
     path(
         "api/box-scores/<int:league_year>/<int:league_id>/<int:week>/",
         views.box_scores_view,
@@ -1,10 +1,16 @@
 import datetime
 import json
 import logging
+import pickle
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
 from django.core.cache import cache
 
 import pytz
 from django.http import JsonResponse
+from django.db import connections
 from django.db.models import OuterRef, Subquery
 from django.shortcuts import render, get_object_or_404
 from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
@@ -25,8 +31,10 @@ from backend.src.doritostats.analytic_utils import (
     get_naughty_players,
     get_lineup,
 )
+from backend.src.doritostats.box_score_cache import get_box_scores
 from backend.src.doritostats.django_utils import (
     CURRENT_YEAR,
+    SINGLE_FLIGHT,
     django_luck_index,
     django_power_rankings,
     django_simulation,
@@ -37,16 +45,29 @@ from backend.src.doritostats.django_utils import (
     get_leagues_current_year,
     get_leagues_previous_year,
 )
+from backend.src.doritostats.espn_requests import fetch_concurrently
 from backend.src.doritostats.exceptions import InactiveLeagueError
 from backend.src.doritostats.fetch_utils import fetch_league
+from backend.src.doritostats.league_snapshot import LeagueSnapshot, SnapshotLeague
+from backend.src.doritostats.local_cache import LocalCache
+from backend.src.doritostats.nfl_calendar import is_stale
 
 logger = logging.getLogger(__name__)
 
 
 MIN_WEEK_TO_DISPLAY = 4  # Only run simulations after Week 4 has completed
-N_SIMULATIONS = 100  # Default number of simulations to run
-MAX_SIMULATIONS = 250  # Maximum number of simulations to run
+MAX_SIMULATIONS = 10000  # Maximum number of simulations to run
+SIMULATION_TOLERANCE = 0.5  # Default precision of the playoff odds (+/- pct points)
+SIMULATION_TIME_BUDGET = 5  # Max seconds to spend simulating in one request
 CACHE_DURATION = 10 * 60
+MAX_LEAGUES_TO_PRELOAD = 50  # Maximum number of leagues preloaded by one request
+# Stale leagues are served (while they are refreshed) for up to a week
+STALE_CACHE_DURATION = 7 * 24 * 60 * 60
+
+# Leagues recently served by this process, checked before the database cache
+LOCAL_CACHE = LocalCache(
+    max_bytes=settings.LOCAL_CACHE_MAX_MB * 1024 * 1024, ttl=STALE_CACHE_DURATION
+)
 
 
 def get_default_week(league_obj: League):
@@ -405,29 +426,199 @@ def copy_old_league(request, league_id: int):
     )
 
 
+def get_local_cache_entry(cache_key: str):
+    """
+    Returns this process's copy of a cache entry if it is still the latest version
+    in the shared cache, along with that version and when the entry was refreshed.
+    Only the small version and refresh stamps are read from the shared cache.
+    """
+    stamps = cache.get_many([f"{cache_key}_version", f"{cache_key}_refreshed_at"])
+    version = stamps.get(f"{cache_key}_version")
+    refreshed_at = stamps.get(f"{cache_key}_refreshed_at")
+    if version is None:
+        return None, None, None
+    return LOCAL_CACHE.get(cache_key, version), version, refreshed_at
+
+
+def set_cache_entry(cache_key: str, data: bytes, value) -> None:
+    """
+    Stores the serialized entry in the shared cache under a new version stamp,
+    and keeps the deserialized value in this process's cache.
+    """
+    version = uuid.uuid4().hex
+    cache.set_many(
+        {
+            cache_key: data,
+            f"{cache_key}_version": version,
+            f"{cache_key}_refreshed_at": datetime.datetime.now(pytz.utc),
+        },
+        timeout=STALE_CACHE_DURATION,
+    )
+    LOCAL_CACHE.set(cache_key, value, size=len(data), version=version)
+
+
+def get_cache_entry_refreshed_at(cache_key: str) -> Optional[datetime.datetime]:
+    """
+    Returns when a cache entry was last refreshed, or None if it isn't cached.
+    """
+    return cache.get(f"{cache_key}_refreshed_at")
+
+
+def revalidate_cache_entry(
+    cache_key: str, refreshed_at: Optional[datetime.datetime], refresh
+) -> None:
+    """
+    Starts refreshing a cache entry in the background if games have been played
+    since it was refreshed. The stale entry is served in the meantime.
+    """
+
+    def refresh_in_background():
+        try:
+            refresh()
+        finally:
+            # The refresh runs in a background thread, with its own database connections
+            connections.close_all()
+
+    if refreshed_at is None or is_stale(refreshed_at):
+        if SINGLE_FLIGHT.run_in_background(cache_key, refresh_in_background):
+            logger.info(f"Refreshing {cache_key} in the background")
+
+
+def get_league_cache_key(league_id: int, league_year: int) -> str:
+    return f"league_obj_{league_id}_{league_year}"
+
+
+def get_league_snapshot_cache_key(league_id: int, league_year: int) -> str:
+    return f"league_snapshot_{league_id}_{league_year}"
+
+
+def load_cached_league(cache_key: str, refresh=None) -> Optional[League]:
+    """
+    Loads the league object from the in-process cache or the database cache.
+    If `refresh` is given and the league is stale, it is refreshed in the background.
+    """
+    league_obj, version, refreshed_at = get_local_cache_entry(cache_key)
+    if league_obj is None:
+        data = cache.get(cache_key) if version else None
+        if not isinstance(data, bytes):
+            return None
+        league_obj = pickle.loads(data)
+        LOCAL_CACHE.set(cache_key, league_obj, size=len(data), version=version)
+
+    if refresh is not None:
+        revalidate_cache_entry(cache_key, refreshed_at, refresh)
+    return league_obj
+
+
+def refresh_cached_league(league_id: int, league_year: int) -> League:
+    """
+    Fetches the league from ESPN and replaces the cached league object and snapshot.
+    """
+    try:
+        league_info = LeagueInfo.objects.get(
+            league_id=league_id, league_year=league_year
+        )
+        league_obj = fetch_league(
+            league_id=league_id,
+            year=league_year,
+            swid=league_info.swid,
+            espn_s2=league_info.espn_s2,
+        )
+    except Exception as e:
+        raise InvalidLeagueError(f"League {league_id} ({league_year}) failed: {e}")
+    set_cache_entry(
+        get_league_cache_key(league_id, league_year),
+        pickle.dumps(league_obj),
+        league_obj,
+    )
+
+    # Rebuild the snapshot from the new league object
+    snapshot = LeagueSnapshot.from_league(league_obj)
+    set_cache_entry(
+        get_league_snapshot_cache_key(league_id, league_year),
+        snapshot.to_bytes(),
+        snapshot.to_league(),
+    )
+    return league_obj
+
+
 def get_cached_league(league_id: int, league_year: int) -> League:
     """
     Fetches the league object from the cache or creates a new one if it doesn't exist.
+    The in-process cache is checked before the database cache, and concurrent
+    requests for the same league wait on a single fetch. Once games have been
+    played, the cached league is still returned immediately while a fresh one is
+    fetched in the background.
     """
-    cache_key = f"league_obj_{league_id}_{league_year}"
-    league_obj = cache.get(cache_key)
+    cache_key = get_league_cache_key(league_id, league_year)
+
+    def refresh() -> League:
+        return refresh_cached_league(league_id=league_id, league_year=league_year)
+
+    return SINGLE_FLIGHT.run(
+        cache_key, refresh, load=lambda: load_cached_league(cache_key, refresh)
+    )
+
 
-    if not league_obj:
+def load_cached_league_snapshot(
+    cache_key: str, refresh=None, league_cache_key: Optional[str] = None
+) -> Optional[SnapshotLeague]:
+    """
+    Loads the league snapshot from the in-process cache or the database cache.
+    If `refresh` is given and the league (under `league_cache_key`) is stale, the
+    league is refreshed in the background. The refresh rewrites the league and its
+    snapshot together, so it shares its lease with `load_cached_league()`.
+    """
+    snapshot_league, version, _ = get_local_cache_entry(cache_key)
+    if snapshot_league is None:
+        data = cache.get(cache_key) if version else None
+        if not data:
+            return None
         try:
-            league_info = LeagueInfo.objects.get(
-                league_id=league_id, league_year=league_year
-            )
-            league_obj = fetch_league(
-                league_id=league_id,
-                year=league_year,
-                swid=league_info.swid,
-                espn_s2=league_info.espn_s2,
-            )
-            cache.set(cache_key, league_obj, timeout=CACHE_DURATION)
-        except Exception as e:
-            raise InvalidLeagueError(f"League {league_id} ({league_year}) failed: {e}")
+            snapshot_league = LeagueSnapshot.from_bytes(data).to_league()
+        except ValueError:
+            # Snapshot was written by a different version of the code
+            logger.info(f"Rebuilding league snapshot {cache_key}")
+            return None
+        LOCAL_CACHE.set(cache_key, snapshot_league, size=len(data), version=version)
+
+    if refresh is not None and league_cache_key is not None:
+        revalidate_cache_entry(
+            league_cache_key,
+            get_cache_entry_refreshed_at(league_cache_key),
+            refresh,
+        )
+    return snapshot_league
 
-    return league_obj
+
+def get_cached_league_snapshot(league_id: int, league_year: int) -> SnapshotLeague:
+    """
+    Fetches a lightweight snapshot of the league from the cache, creating it from
+    the full league object if it doesn't exist.
+
+    The snapshot only holds teams, settings, and weekly results, so it is much
+    cheaper to load than the full league object. Use it in views that don't need
+    player-level data.
+    """
+    cache_key = get_league_snapshot_cache_key(league_id, league_year)
+
+    def build() -> SnapshotLeague:
+        league_obj = get_cached_league(league_id=league_id, league_year=league_year)
+        snapshot = LeagueSnapshot.from_league(league_obj)
+        snapshot_league = snapshot.to_league()
+        set_cache_entry(cache_key, snapshot.to_bytes(), snapshot_league)
+        return snapshot_league
+
+    def refresh() -> League:
+        return refresh_cached_league(league_id=league_id, league_year=league_year)
+
+    return SINGLE_FLIGHT.run(
+        cache_key,
+        build,
+        load=lambda: load_cached_league_snapshot(
+            cache_key, refresh, get_league_cache_key(league_id, league_year)
+        ),
+    )
 
 
 def preload_league(request, league_id: int, league_year: int) -> JsonResponse:
@@ -435,9 +626,114 @@ def preload_league(request, league_id: int, league_year: int) -> JsonResponse:
     Preloads the league data and caches it for faster access.
     """
     get_cached_league(league_id=league_id, league_year=league_year)
+    get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     return JsonResponse({"status": "ready"})
 
 
+def refresh_league_if_stale(
+    league_id: int, league_year: int, force: bool = False
+) -> str:
+    """
+    Refreshes the cached league (and its snapshot) if it is stale, or if `force` is set.
+    The refresh shares its lease with requests and background refreshes of the league,
+    so if the league is already being refreshed elsewhere, this waits for that
+    refresh instead of fetching the league again.
+
+    Returns:
+        str: "refreshed" if the league was fetched here, otherwise "cached"
+    """
+    cache_key = get_league_cache_key(league_id, league_year)
+    started_at = datetime.datetime.now(pytz.utc)
+
+    def load() -> Optional[str]:
+        refreshed_at = get_cache_entry_refreshed_at(cache_key)
+        if refreshed_at is None:
+            return None
+        if force:
+            # Only a refresh that finished after this call started will do
+            return "cached" if refreshed_at >= started_at else None
+        return None if is_stale(refreshed_at) else "cached"
+
+    def refresh() -> str:
+        refresh_cached_league(league_id=league_id, league_year=league_year)
+        return "refreshed"
+
+    return SINGLE_FLIGHT.run(cache_key, refresh, load=load)
+
+
+def preload_leagues(
+    leagues: Iterable[Tuple[int, int]], force: bool = False
+) -> List[Dict]:
+    """
+    Fetches several leagues from ESPN concurrently and caches each league and its
+    snapshot. Leagues that are cached and fresh are skipped unless `force` is set,
+    and leagues that are being refreshed elsewhere are not fetched again (see
+    `refresh_league_if_stale()`). A league that fails does not stop the others.
+
+    Args:
+        leagues (Iterable[Tuple[int, int]]): (league_id, league_year) of each league
+        force (bool): Refresh leagues even if they are fresh. Defaults to False.
+
+    Returns:
+        List[Dict]: For each league, its status ("cached", "refreshed" or "failed"),
+            the seconds it took, and the error if it failed
+    """
+
+    def preload(league: Tuple[int, int]) -> Dict:
+        league_id, league_year = league
+        result = {"league_id": league_id, "league_year": league_year}
+        start = time.perf_counter()
+        try:
+            result["status"] = refresh_league_if_stale(
+                league_id=league_id, league_year=league_year, force=force
+            )
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+        finally:
+            # Each preload runs in its own thread, with its own database connections
+            connections.close_all()
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        return result
+
+    return fetch_concurrently(preload, leagues)
+
+
+@require_POST
+def preload_leagues_view(request) -> JsonResponse:
+    """
+    Preloads the given leagues (e.g. the leagues listed on the home page) so that
+    their pages load quickly, and reports how long each league took.
+    """
+    try:
+        data = json.loads(request.body)
+        leagues = [
+            (int(league["league_id"]), int(league["league_year"]))
+            for league in data.get("leagues", [])
+        ]
+    except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError):
+        return JsonResponse({"error": "Invalid parameters."}, status=400)
+
+    if len(leagues) > MAX_LEAGUES_TO_PRELOAD:
+        return JsonResponse(
+            {
+                "status": "error",
+                "code": JsonErrorCodes.UNKNOWN_ERROR.value,
+                "error": f"At most {MAX_LEAGUES_TO_PRELOAD} leagues can be preloaded at once.",
+            },
+            status=400,
+        )
+
+    results = preload_leagues(leagues)
+    return JsonResponse(
+        {
+            "status": "ready",
+            "n_failed": sum(result["status"] == "failed" for result in results),
+            "leagues": results,
+        }
+    )
+
+
 @require_GET
 def get_league_endpoint(
     request,
@@ -447,7 +743,7 @@ def get_league_endpoint(
     """
     Returns the endpoint for the given league.
     """
-    league = get_cached_league(league_id=league_id, league_year=league_year)
+    league = get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     return JsonResponse({"endpoint": league.endpoint})
 
 
@@ -460,7 +756,7 @@ def get_current_week(
     """
     Returns the current week for the given league.
     """
-    league = get_cached_league(league_id=league_id, league_year=league_year)
+    league = get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     return JsonResponse(
         {
             "current_week": league.current_week,
@@ -482,7 +778,7 @@ def box_scores_view(
     league = get_cached_league(league_id=league_id, league_year=league_year)
 
     # Load box scores for specified week
-    box_scores = league.box_scores(week)
+    box_scores = get_box_scores(league, week)
 
     # Get the scores for each team
     formatted_box_scores = []
@@ -534,7 +830,7 @@ def power_rankings_view(
     """
     Fetches the power rankings for the given week.
     """
-    league = get_cached_league(league_id=league_id, league_year=league_year)
+    league = get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     power_rankings = django_power_rankings(league, week)
 
     return JsonResponse(power_rankings, safe=False)
@@ -580,8 +876,9 @@ def naughty_list_view(
 
     # Identify all players that were started by their owners, but were inactive or on bye
     naughty_list = []
+    box_scores = get_box_scores(league, week)
     for team in league.teams:
-        lineup = get_lineup(league, team, week)
+        lineup = get_lineup(league, team, week, box_scores)
         naughty_players = get_naughty_players(lineup, week)
         for player in naughty_players:
             naughty_list.append(
@@ -605,7 +902,7 @@ def standings_view(
     """
     Fetches the standings for the given week.
     """
-    league = get_cached_league(league_id=league_id, league_year=league_year)
+    league = get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     standings = django_standings(league, week)
 
     return JsonResponse(standings, safe=False)
@@ -651,7 +948,7 @@ def league_settings(
     """
     Fetches the various settings for the league
     """
-    league = get_cached_league(league_id=league_id, league_year=league_year)
+    league = get_cached_league_snapshot(league_id=league_id, league_year=league_year)
     result = {
         "n_playoff_spots": league.settings.playoff_team_count,
         "n_teams": league.settings.team_count,
@@ -675,16 +972,29 @@ def simulate_playoff_odds_view(
     league_year: int,
 ) -> JsonResponse:
     # Validate and process the parameters
+    # If `n_simulations` is not specified, simulations run until the playoff odds
+    # are known within +/- `tolerance` percentage points (or the time budget runs out)
     try:
-        n_simulations = int(request.GET.get("n_simulations", N_SIMULATIONS))
+        n_simulations = request.GET.get("n_simulations", None)
+        tolerance = request.GET.get("tolerance", None)
+        if n_simulations is not None:
+            n_simulations = int(n_simulations)
+        if tolerance is not None:
+            tolerance = float(tolerance)
+        elif n_simulations is None:
+            tolerance = SIMULATION_TOLERANCE
         week = request.GET.get("week", None)
         if week is not None:
             week = int(week)
     except ValueError:
         return JsonResponse({"error": "Invalid parameters."}, status=400)
 
-    # Limit maximum number of simulations to protect server
+    # Limit maximum number of simulations (and the time spent on them) to protect server
+    # A fixed number of simulations may stop early too; the response reports how many ran
+    if n_simulations is None:
+        n_simulations = MAX_SIMULATIONS
     n_simulations = min(n_simulations, MAX_SIMULATIONS)
+    time_budget = SIMULATION_TIME_BUDGET
 
     # Fetch the league
     league = get_cached_league(league_id=league_id, league_year=league_year)
@@ -706,30 +1016,24 @@ def simulate_playoff_odds_view(
             status=409,
         )
 
-    # Generate a cache key based on league_id, league_year, week, and n_simulations
-    cache_key = (
-        f"playoff_odds_{league_id}_{league_year}_week_{week}_sim_{n_simulations}"
-    )
-    cached_result = cache.get(cache_key)
-
-    if cached_result:
-        return JsonResponse(cached_result, safe=False)
-
-    # Perform the simulation if no cached result is found
-    playoff_odds, rank_dist, seeding_outcomes = django_simulation(
-        league=league, n_simulations=n_simulations, week=week
+    # Perform the simulation (previous simulations of the same league state are reused)
+    playoff_odds, rank_dist, seeding_outcomes, n_simulations_run = django_simulation(
+        league=league,
+        n_simulations=n_simulations,
+        week=week,
+        tolerance=tolerance,
+        time_budget=time_budget,
     )
 
     result = {
         "playoff_odds": playoff_odds,
         "rank_distribution": rank_dist,
         "seeding_outcomes": seeding_outcomes,
-        "n_simulations": n_simulations,
+        "n_simulations": n_simulations_run,
+        "max_simulations": n_simulations,
+        "tolerance": tolerance,
     }
 
-    # Cache the result for 1 hour
-    cache.set(cache_key, result, timeout=CACHE_DURATION)
-
     return JsonResponse(result, safe=False)
 
 
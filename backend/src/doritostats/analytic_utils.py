@@ -7,6 +7,7 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 from espn_api.football import League, Team, Player
 from espn_api.football.box_score import BoxScore
 from sklearn import preprocessing
+from backend.src.doritostats.box_score_cache import get_box_scores
 from backend.src.doritostats.filter_utils import (
     get_any_records,
     exclude_most_recent_week,
@@ -23,7 +24,7 @@ def get_lineup(
     """Return the lineup of the given team during the given week"""
     # Get the lineup for the team during the specified week
     if box_scores is None:
-        box_scores = league.box_scores(week)
+        box_scores = get_box_scores(league, week)
 
     assert box_scores is not None
 
@@ -499,7 +500,7 @@ def sort_lineups_by_func(
     DOES NOT ACCOUNT FOR TIES
     """
     if box_scores is None:
-        box_scores = league.box_scores(week)
+        box_scores = get_box_scores(league, week)
     return sorted(
         league.teams,
         key=lambda x: func(league, get_lineup(league, x, week, box_scores), **kwargs),
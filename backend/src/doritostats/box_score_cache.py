@@ -0,0 +1,90 @@
+import pickle
+from copy import copy
+from typing import Dict, Iterable, List
+
+from espn_api.football import League
+from espn_api.football.box_score import BoxScore
+
+from backend.src.doritostats.espn_requests import fetch_concurrently
+from backend.src.doritostats.local_cache import LocalCache
+
+BOX_SCORE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+LIVE_BOX_SCORE_TTL = 60  # Seconds to keep the box scores of a week in progress
+
+# Box scores of completed weeks never change, so they are only evicted for space
+BOX_SCORE_CACHE = LocalCache(max_bytes=BOX_SCORE_CACHE_MAX_BYTES, ttl=float("inf"))
+
+
+def is_week_complete(league: League, week: int) -> bool:
+    """Check whether every matchup of the week has been played."""
+    return week <= getattr(league, "n_completed_weeks", 0)
+
+
+def detach_box_score(box_score: BoxScore) -> BoxScore:
+    """Copy a box score, replacing its teams with their team ids.
+
+    Cached box scores are shared by every copy of a league in this process,
+    so they must not reference any one League's Team objects.
+    """
+    detached = copy(box_score)
+    detached.home_team = getattr(box_score.home_team, "team_id", box_score.home_team)
+    detached.away_team = getattr(box_score.away_team, "team_id", box_score.away_team)
+    return detached
+
+
+def attach_box_score(box_score: BoxScore, league: League) -> BoxScore:
+    """Copy a detached box score, replacing its team ids with the league's teams."""
+    teams = {team.team_id: team for team in league.teams}
+    attached = copy(box_score)
+    attached.home_team = teams.get(box_score.home_team, box_score.home_team)
+    attached.away_team = teams.get(box_score.away_team, box_score.away_team)
+    return attached
+
+
+def get_box_scores(league: League, week: int) -> List[BoxScore]:
+    """Get the box scores of a week, from this process's cache if possible.
+
+    Box scores are keyed by (league, year, week, scoring period). Completed
+    weeks are kept until they are evicted for space, while the week in
+    progress expires after LIVE_BOX_SCORE_TTL seconds.
+
+    Args:
+        league (League): League
+        week (int): Week
+
+    Returns:
+        List[BoxScore]: Box scores of the week
+    """
+    scoring_period = min(week, league.current_week)
+    key = (league.league_id, league.year, week, scoring_period)
+
+    detached = BOX_SCORE_CACHE.get(key)
+    if detached is not None:
+        return [attach_box_score(box_score, league) for box_score in detached]
+
+    box_scores = league.box_scores(week)
+    detached = [detach_box_score(box_score) for box_score in box_scores]
+    BOX_SCORE_CACHE.set(
+        key,
+        detached,
+        size=len(pickle.dumps(detached)),
+        ttl=None if is_week_complete(league, week) else LIVE_BOX_SCORE_TTL,
+    )
+    return box_scores
+
+
+def get_box_scores_many(
+    league: League, weeks: Iterable[int]
+) -> Dict[int, List[BoxScore]]:
+    """Get the box scores of several weeks, fetching the uncached weeks concurrently.
+
+    Args:
+        league (League): League
+        weeks (Iterable[int]): Weeks
+
+    Returns:
+        Dict[int, List[BoxScore]]: Box scores of each week
+    """
+    weeks = list(weeks)
+    box_scores = fetch_concurrently(lambda week: get_box_scores(league, week), weeks)
+    return dict(zip(weeks, box_scores))
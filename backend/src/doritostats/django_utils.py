@@ -1,6 +1,8 @@
 import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
+from django.conf import settings
+from django.core.cache import cache
 from espn_api.football import League
 
 from backend.fantasy_stats.models import LeagueInfo
@@ -17,12 +19,16 @@ from backend.src.doritostats.analytic_utils import (
     sort_lineups_by_func,
     sum_bench_points,
 )
+from backend.src.doritostats.box_score_cache import get_box_scores
 from backend.src.doritostats.luck_index import get_weekly_luck_index
-from backend.src.doritostats.scrape_team_stats import (
-    append_streaks,
-    get_stats_by_matchup,
+from backend.src.doritostats.scrape_team_stats import append_streaks
+from backend.src.doritostats.simulation_utils import (
+    SimulationStore,
+    format_simulation_results,
+    prepare_simulation_inputs,
 )
-from backend.src.doritostats.simulation_utils import simulate_season
+from backend.src.doritostats.single_flight import SingleFlight
+from backend.src.doritostats.stats_history import get_season_stats
 
 CURRENT_YEAR = (
     datetime.datetime.now().year
@@ -31,6 +37,13 @@ CURRENT_YEAR = (
 )
 
 
+# Simulation counters are keyed by the state of the league, so they never go stale
+SIMULATION_STORE = SimulationStore(cache, timeout=24 * 60 * 60)
+
+# Concurrent cache misses for the same key (in any worker) wait on one computation
+SINGLE_FLIGHT = SingleFlight(cache)
+
+
 def get_leagues_current_year():
     return (
         LeagueInfo.objects.filter(league_year=CURRENT_YEAR)
@@ -49,7 +62,7 @@ def get_leagues_previous_year():
 
 def django_weekly_stats(league: League, week: int):
     # Load box scores for specified week
-    box_scores = league.box_scores(week)
+    box_scores = get_box_scores(league, week)
 
     # Get the scores for each team
     team_scores = []
@@ -224,8 +237,8 @@ def django_weekly_stats(league: League, week: int):
 
 
 def django_season_stats(league: League):
-    # Get the season stats
-    df_year = get_stats_by_matchup(league=league)
+    # Get the season stats (completed weeks are stored after they are first built)
+    df_year = get_season_stats(league)
 
     # Get win streak data for each owner
     df_year = append_streaks(df_year)
@@ -434,14 +447,33 @@ def django_strength_of_schedule(
     return django_sos, schedule_period
 
 
-def django_simulation(league: League, n_simulations: int, week: Optional[int] = None):
+def django_simulation(
+    league: League,
+    n_simulations: int,
+    week: Optional[int] = None,
+    tolerance: Optional[float] = None,
+    time_budget: Optional[float] = None,
+):
     # Disallow simulations after the regular season has ended
     # if league.current_week > league.settings.reg_season_count:
     #     n_simulations = 1
 
-    # Get power rankings for the current week
-    playoff_odds, rank_dist, seeding_outcomes = simulate_season(
-        league, n=n_simulations, first_week_to_simulate=week
+    # Simulate the rest of the season (stopping early if `tolerance` or `time_budget` are set)
+    # Previous simulations of the same league state are reused, and only topped up if needed
+    inputs = prepare_simulation_inputs(league, first_week_to_simulate=week)
+    accumulator = SINGLE_FLIGHT.run(
+        SIMULATION_STORE.get_key(inputs, random_state=42),
+        lambda: SIMULATION_STORE.run(
+            inputs,
+            n=n_simulations,
+            random_state=42,
+            tolerance=tolerance,
+            time_budget=time_budget,
+            n_jobs=settings.SIMULATION_WORKERS,
+        ),
+    )
+    playoff_odds, rank_dist, seeding_outcomes = format_simulation_results(
+        accumulator, league
     )
 
     # Add the playoff offs and final rank distribution for each team
@@ -459,6 +491,11 @@ def django_simulation(league: League, n_simulations: int, week: Optional[int] =
                 "projected_ties": playoff_odds.iloc[i].ties,
                 "projected_points_for": playoff_odds.iloc[i].points_for,
                 "playoff_odds": playoff_odds.iloc[i].playoff_odds / 100,
+                "playoff_odds_ci": [
+                    playoff_odds.iloc[i].playoff_odds_lower / 100,
+                    playoff_odds.iloc[i].playoff_odds_upper / 100,
+                ],
+                "playoff_status": playoff_odds.iloc[i].playoff_status,
             }
         )
 
@@ -486,4 +523,9 @@ def django_simulation(league: League, n_simulations: int, week: Optional[int] =
             }
         )
 
-    return django_playoff_odds, django_rank_dist, django_seeding_outcomes
+    return (
+        django_playoff_odds,
+        django_rank_dist,
+        django_seeding_outcomes,
+        accumulator.n,
+    )
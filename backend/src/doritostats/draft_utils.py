@@ -3,12 +3,24 @@ import logging
 import numpy as np
 import pandas as pd
 from typing import Optional
-from .fetch_utils import fetch_league, OWNER_MAP
+from .fetch_utils import fetch_leagues, OWNER_MAP
+from .row_builder import RowBuilder
 from espn_api.football import League
 
 
 logger = logging.getLogger(__name__)
 
+# dtypes of the leading columns of the draft dataframe
+DRAFT_DTYPES = {
+    "year": "int64",
+    "team_owner": "object",
+    "team_id": "int64",
+    "player_name": "object",
+    "player_id": "object",
+    "round_num": "int64",
+    "round_pick": "int64",
+}
+
 
 def get_draft_details(league: League) -> pd.DataFrame:
     """For a given league, get details about the draft that year.
@@ -21,7 +33,8 @@ def get_draft_details(league: League) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Draft dataframe
     """
-    draft = pd.DataFrame()
+    # Collect one row per pick
+    rows = RowBuilder(DRAFT_DTYPES)
 
     # Get a dictionary of the starting roster slots and number of each for the League (Week 1 must have passed already)
     primary_slots = [
@@ -31,31 +44,36 @@ def get_draft_details(league: League) -> pd.DataFrame:
     ]
 
     for i, player in enumerate(league.draft):
-        draft.loc[i, "year"] = league.year
-        draft.loc[i, "team_owner"] = player.team.owner.title()
-        draft.loc[i, "team_id"] = player.team.team_id
-        draft.loc[i, "player_name"] = player.playerName
-        draft.loc[i, "player_id"] = player.playerId
-        draft.loc[i, "round_num"] = player.round_num
-        draft.loc[i, "round_pick"] = player.round_pick
+        row = {
+            "year": league.year,
+            "team_owner": player.team.owner.title(),
+            "team_id": player.team.team_id,
+            "player_name": player.playerName,
+            "player_id": player.playerId,
+            "round_num": player.round_num,
+            "round_pick": player.round_pick,
+        }
         try:
             # Get more player details (can take 1.5 min)
-            player = league.player_info(playerId=draft.loc[i, "player_id"])
-            draft.loc[i, "pro_team"] = player.proTeam
-            draft.loc[i, "proj_points"] = player.projected_total_points
-            draft.loc[i, "total_points"] = player.total_points
-            draft.loc[i, "position"] = [
+            player = league.player_info(playerId=row["player_id"])
+            row["pro_team"] = player.proTeam
+            row["proj_points"] = player.projected_total_points
+            row["total_points"] = player.total_points
+            row["position"] = [
                 slot for slot in player.eligibleSlots if slot in primary_slots
             ][0]
         except AttributeError:
             print("Pick {} missing.".format(i + 1))
-            draft.loc[i, "player_name"] = ""
-            draft.loc[i, "player_id"] = ""
-            draft.loc[i, "round_num"] = 99
-            draft.loc[i, "round_pick"] = 99
+            row["player_name"] = ""
+            row["player_id"] = ""
+            row["round_num"] = 99
+            row["round_pick"] = 99
         except Exception:
             print(i, player, league.draft[i - 2 : i + 2])
-            draft.loc[i, "position"] = player.eligibleSlots[0]
+            row["position"] = player.eligibleSlots[0]
+        rows.append(row)
+
+    draft = rows.to_frame()
 
     # Map owners of previous/co-owned teams to current owners to preserve "franchise"
     draft.replace({"team_owner": OWNER_MAP, "opp_owner": OWNER_MAP}, inplace=True)
@@ -95,16 +113,17 @@ def get_multiple_drafts(
     Returns:
         pd.DataFrame: Draft dataframe
     """
-    draft = pd.DataFrame()
-    for year in range(start_year, end_year + 1):
-        print("Fetching {} draft...".format(year), end="")
-        try:
-            draft_league = fetch_league(
-                league_id=league_id, year=year, swid=swid, espn_s2=espn_s2
-            )
-        except Exception:
-            continue
+    print("Fetching {}-{} drafts...".format(start_year, end_year))
+    draft_leagues = fetch_leagues(
+        league_id,
+        range(start_year, end_year + 1),
+        swid=swid,
+        espn_s2=espn_s2,
+        ignore_errors=True,
+    )
 
+    draft = pd.DataFrame()
+    for draft_league in draft_leagues.values():
         draft = pd.concat([draft, get_draft_details(draft_league)])
 
     return draft
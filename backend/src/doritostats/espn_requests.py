@@ -0,0 +1,200 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+from espn_api.requests.espn_requests import EspnFantasyRequests, checkRequestStatus
+
+from backend.src.doritostats.espn_stand_in import RecordingAdapter, StandInAdapter
+
+# Every league view needed to build a League (and its draft), fetched in one request
+LEAGUE_VIEWS = [
+    "mTeam",
+    "mRoster",
+    "mMatchup",
+    "mMatchupScore",
+    "mSettings",
+    "mStandings",
+    "mDraftDetail",
+]
+
+# Maximum number of ESPN requests in flight at once (across all threads of this process)
+ESPN_MAX_CONCURRENCY = int(os.getenv("ESPN_MAX_CONCURRENCY", "8"))
+ESPN_REQUEST_SEMAPHORE = threading.BoundedSemaphore(ESPN_MAX_CONCURRENCY)
+
+# Retry rate-limited and failed requests, backing off 0.5s, 1s, 2s (and honoring Retry-After)
+ESPN_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+
+ESPN_SESSION = None
+ESPN_SESSION_LOCK = threading.RLock()
+
+
+def get_espn_session() -> requests.Session:
+    """Get the requests.Session shared by all ESPN requests in this process.
+
+    Reusing the session keeps connections to ESPN open between requests.
+    If the ESPN_STAND_IN_URL environment variable is set, requests are sent to
+    that ESPN stand-in server instead. If ESPN_RECORD_DIR is set, every
+    response is saved there as a fixture.
+
+    Returns:
+        requests.Session: Shared session
+    """
+    with ESPN_SESSION_LOCK:
+        if ESPN_SESSION is None:
+            configure_espn_session(
+                stand_in_url=os.getenv("ESPN_STAND_IN_URL"),
+                record_dir=os.getenv("ESPN_RECORD_DIR"),
+            )
+        return ESPN_SESSION
+
+
+def configure_espn_session(
+    stand_in_url: Optional[str] = None, record_dir: Optional[str] = None
+) -> requests.Session:
+    """Replace the shared ESPN session.
+
+    Args:
+        stand_in_url (Optional[str]): URL of an ESPN stand-in server to send requests to. Defaults to None (ESPN).
+        record_dir (Optional[str]): Directory to save every response to. Defaults to None (don't record).
+
+    Returns:
+        requests.Session: The new shared session
+    """
+    global ESPN_SESSION
+    adapter_kwargs = {"pool_maxsize": ESPN_MAX_CONCURRENCY, "max_retries": ESPN_RETRIES}
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(**adapter_kwargs))
+    if stand_in_url:
+        session.mount(
+            FANTASY_BASE_ENDPOINT, StandInAdapter(stand_in_url, **adapter_kwargs)
+        )
+    elif record_dir:
+        session.mount(
+            FANTASY_BASE_ENDPOINT, RecordingAdapter(record_dir, **adapter_kwargs)
+        )
+    ESPN_SESSION = session
+    return session
+
+
+def espn_get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request over the shared ESPN session.
+
+    At most ESPN_MAX_CONCURRENCY requests are sent at once; other callers
+    wait for a free slot.
+
+    Args:
+        url (str): URL to request
+        **kwargs: Passed to requests.Session.get (params, headers, cookies, ...)
+
+    Returns:
+        requests.Response: Response
+    """
+    with ESPN_REQUEST_SEMAPHORE:
+        return get_espn_session().get(url, **kwargs)
+
+
+def fetch_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    return_exceptions: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Call `func` on every item in a pool of threads and return the results in order.
+
+    The calls are expected to be dominated by ESPN requests, which share the
+    pooled session and are bounded by ESPN_MAX_CONCURRENCY, so calls may
+    themselves fetch concurrently (e.g. every week of every season).
+
+    Args:
+        func (Callable[[Any], Any]): Function to call on each item
+        items (Iterable): Items
+        return_exceptions (bool): Return the exception raised for an item instead of raising it. Defaults to False.
+        max_workers (Optional[int]): Maximum number of concurrent calls. Defaults to None (ESPN_MAX_CONCURRENCY).
+
+    Returns:
+        List[Any]: Result for each item
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers or ESPN_MAX_CONCURRENCY, len(items)),
+        thread_name_prefix="espn",
+    ) as pool:
+        futures = [pool.submit(func, item) for item in items]
+
+    results = []
+    for future in futures:
+        error = future.exception()
+        if error is not None and not return_exceptions:
+            raise error
+        results.append(future.result() if error is None else error)
+    return results
+
+
+class SessionEspnRequests(EspnFantasyRequests):
+    """EspnFantasyRequests that sends every request over the shared session (see `espn_get()`).
+
+    `get_league()` requests all of LEAGUE_VIEWS at once and keeps the payload,
+    so the draft and any settings derived by `fetch_league()` are read from it
+    instead of being requested again. Call `clear()` once the league is built.
+    """
+
+    league_data: Optional[dict] = None
+
+    @classmethod
+    def from_requests(cls, espn_request: EspnFantasyRequests) -> "SessionEspnRequests":
+        session_request = cls.__new__(cls)
+        session_request.__dict__.update(espn_request.__dict__)
+        return session_request
+
+    def league_get(self, params: dict = None, headers: dict = None, extend: str = ""):
+        endpoint = self.LEAGUE_ENDPOINT + extend
+        r = espn_get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        checkRequestStatus(
+            r.status_code, cookies=self.cookies, league_id=self.league_id
+        )
+
+        if self.logger:
+            self.logger.log_request(
+                endpoint=endpoint, params=params, headers=headers, response=r.json()
+            )
+        return r.json() if self.year > 2017 else r.json()[0]
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = ""):
+        endpoint = self.ENDPOINT + extend
+        r = espn_get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        checkRequestStatus(r.status_code)
+
+        if self.logger:
+            self.logger.log_request(
+                endpoint=endpoint, params=params, headers=headers, response=r.json()
+            )
+        return r.json()
+
+    def get_league(self) -> dict:
+        """Gets all of the league's data (teams, rosters, matchups, settings, draft)"""
+        if self.league_data is None:
+            self.league_data = self.league_get(params={"view": LEAGUE_VIEWS})
+        return self.league_data
+
+    def get_league_draft(self) -> dict:
+        if self.league_data is not None:
+            return self.league_data
+        return super().get_league_draft()
+
+    def clear(self) -> None:
+        """Drop the stored league payload (so it isn't cached with the League)"""
+        self.league_data = None
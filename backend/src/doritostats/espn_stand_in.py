@@ -0,0 +1,556 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, urlsplit
+
+import numpy as np
+from requests.adapters import HTTPAdapter
+from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+# A responder maps (path, query, x-fantasy-filter header) to (status code, JSON body)
+Responder = Callable[[str, str, Optional[str]], Optional[Tuple[int, bytes]]]
+
+
+def get_fixture_key(path: str, query: str, fantasy_filter: Optional[str]) -> str:
+    """Identify a request to ESPN, independent of parameter order and cookies.
+
+    Args:
+        path (str): Request path, relative to FANTASY_BASE_ENDPOINT
+        query (str): Query string
+        fantasy_filter (Optional[str]): Value of the x-fantasy-filter header
+
+    Returns:
+        str: Fixture key
+    """
+    if fantasy_filter:
+        fantasy_filter = json.dumps(json.loads(fantasy_filter), sort_keys=True)
+    request = [
+        path.strip("/"),
+        sorted(parse_qsl(query, keep_blank_values=True)),
+        fantasy_filter,
+    ]
+    return hashlib.sha1(json.dumps(request).encode()).hexdigest()[:20]
+
+
+def split_espn_url(url: str, base_url: str = FANTASY_BASE_ENDPOINT) -> Tuple[str, str]:
+    """Split a request URL into its path (relative to `base_url`) and query string."""
+    relative_url = urlsplit(url[len(base_url) :] if url.startswith(base_url) else url)
+    return relative_url.path, relative_url.query
+
+
+def save_fixture(
+    fixtures_dir: str,
+    path: str,
+    query: str,
+    fantasy_filter: Optional[str],
+    status_code: int,
+    body: bytes,
+) -> str:
+    """Write one ESPN response to `fixtures_dir`.
+
+    Returns:
+        str: Path of the fixture file
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    key = get_fixture_key(path, query, fantasy_filter)
+    filename = os.path.join(fixtures_dir, f"{key}.json")
+    with open(filename, "w") as f:
+        json.dump(
+            {
+                "path": path,
+                "query": query,
+                "filter": fantasy_filter,
+                "status_code": status_code,
+                "body": json.loads(body) if body else None,
+            },
+            f,
+        )
+    return filename
+
+
+class FixtureResponder:
+    """Serve the responses saved by `save_fixture()`."""
+
+    def __init__(self, fixtures_dir: str):
+        self.fixtures_dir = fixtures_dir
+        self.fixtures: Dict[str, Tuple[int, bytes]] = {}
+        for filename in sorted(os.listdir(fixtures_dir)):
+            if not filename.endswith(".json"):
+                continue
+            with open(os.path.join(fixtures_dir, filename)) as f:
+                fixture = json.load(f)
+            key = get_fixture_key(fixture["path"], fixture["query"], fixture["filter"])
+            self.fixtures[key] = (
+                fixture["status_code"],
+                json.dumps(fixture["body"]).encode(),
+            )
+
+    def __repr__(self):
+        return f"FixtureResponder({self.fixtures_dir}, {len(self.fixtures)} fixtures)"
+
+    def __call__(
+        self, path: str, query: str, fantasy_filter: Optional[str]
+    ) -> Optional[Tuple[int, bytes]]:
+        return self.fixtures.get(get_fixture_key(path, query, fantasy_filter))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that saves every ESPN response it receives as a fixture."""
+
+    def __init__(
+        self, fixtures_dir: str, base_url: str = FANTASY_BASE_ENDPOINT, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.fixtures_dir = fixtures_dir
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        path, query = split_espn_url(request.url, self.base_url)
+        save_fixture(
+            self.fixtures_dir,
+            path,
+            query,
+            request.headers.get("x-fantasy-filter"),
+            response.status_code,
+            response.content,
+        )
+        return response
+
+
+class StandInAdapter(HTTPAdapter):
+    """Transport adapter that sends requests for ESPN to a stand-in server instead."""
+
+    def __init__(self, stand_in_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.stand_in_url = stand_in_url.rstrip("/") + "/"
+
+    def send(self, request, **kwargs):
+        request = request.copy()
+        request.url = request.url.replace(FANTASY_BASE_ENDPOINT, self.stand_in_url, 1)
+        return super().send(request, **kwargs)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        path, query = split_espn_url(self.path, "/")
+        response = self.server.responder(
+            path, query, self.headers.get("x-fantasy-filter")
+        )
+        if response is None:
+            logger.warning(f"No ESPN stand-in response for {self.path}")
+            response = (404, json.dumps({"messages": ["Not Found"]}).encode())
+
+        status_code, body = response
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class ESPNStandIn:
+    """A local HTTP server that answers ESPN API requests.
+
+    Point the shared ESPN session at it with
+    `configure_espn_session(stand_in_url=stand_in.url)` (or the
+    ESPN_STAND_IN_URL environment variable).
+
+    Args:
+        responder (Responder): Recorded fixtures (FixtureResponder) or a SyntheticLeague
+        latency (float): Seconds to wait before each response. Defaults to 0.
+        host (str): Host to bind. Defaults to "127.0.0.1".
+        port (int): Port to bind. Defaults to 0 (any free port).
+    """
+
+    def __init__(
+        self,
+        responder: Responder,
+        latency: float = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.server = ThreadingHTTPServer((host, port), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.responder = responder
+        self.server.latency = latency
+        self.thread = None
+
+    def __repr__(self):
+        return f"ESPNStandIn({self.url})"
+
+    def __enter__(self) -> "ESPNStandIn":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "ESPNStandIn":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# Starting lineup of the synthetic league: (position, slot id, eligible slots, default position id)
+SYNTHETIC_ROSTER = [
+    ("QB", 0, [0, 7, 20, 21], 1),
+    ("RB", 2, [2, 3, 23, 7, 20, 21], 2),
+    ("RB", 2, [2, 3, 23, 7, 20, 21], 2),
+    ("WR", 4, [3, 4, 5, 23, 7, 20, 21], 3),
+    ("WR", 4, [3, 4, 5, 23, 7, 20, 21], 3),
+    ("TE", 6, [5, 6, 23, 7, 20, 21], 4),
+    ("RB", 23, [2, 3, 23, 7, 20, 21], 2),
+    ("D/ST", 16, [16, 20, 21], 16),
+    ("K", 17, [17, 20, 21], 5),
+    ("QB", 20, [0, 7, 20, 21], 1),
+    ("RB", 20, [2, 3, 23, 7, 20, 21], 2),
+    ("RB", 20, [2, 3, 23, 7, 20, 21], 2),
+    ("WR", 20, [3, 4, 5, 23, 7, 20, 21], 3),
+    ("WR", 20, [3, 4, 5, 23, 7, 20, 21], 3),
+    ("TE", 20, [5, 6, 23, 7, 20, 21], 4),
+    ("WR", 21, [3, 4, 5, 23, 7, 20, 21], 3),
+]
+SYNTHETIC_LINEUP_SLOT_COUNTS = {
+    "0": 1,
+    "2": 2,
+    "4": 2,
+    "6": 1,
+    "16": 1,
+    "17": 1,
+    "20": 6,
+    "21": 1,
+    "23": 1,
+}
+# Stat ids of passing, rushing and receiving touchdowns
+SYNTHETIC_TD_STATS = {"QB": "4", "RB": "25", "WR": "43", "TE": "43"}
+
+
+class SyntheticLeague:
+    """Answers ESPN API requests for a made-up league with a round-robin schedule.
+
+    Every value is drawn from a seeded random generator, so the league can be
+    used for deterministic, offline benchmarks of the whole fetch pipeline
+    (league build, rosters, box scores and draft) when no recorded fixtures
+    are available.
+
+    Args:
+        league_id (int): League id. Defaults to 1.
+        year (int): Season. Defaults to 2023.
+        n_teams (int): Number of teams (even). Defaults to 10.
+        n_weeks (int): Number of regular season weeks. Defaults to 14.
+        n_completed_weeks (int): Number of weeks that have been played. Defaults to 10.
+        seed (int): Random seed. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        league_id: int = 1,
+        year: int = 2023,
+        n_teams: int = 10,
+        n_weeks: int = 14,
+        n_completed_weeks: int = 10,
+        seed: int = 0,
+    ):
+        self.league_id = league_id
+        self.year = year
+        self.n_teams = n_teams
+        self.n_weeks = n_weeks
+        self.n_completed_weeks = n_completed_weeks
+        self.current_week = min(n_completed_weeks + 1, n_weeks)
+
+        rng = np.random.default_rng(seed)
+        n_players = len(SYNTHETIC_ROSTER)
+        self.player_ids = 1000 + np.arange(n_teams * n_players).reshape(
+            n_teams, n_players
+        )
+        self.pro_team_ids = rng.integers(1, 31, size=(n_teams, n_players))
+        self.points = rng.gamma(2, 5, size=(n_teams, n_players, n_weeks)).round(1)
+        self.projected_points = self.points.mean(axis=2, keepdims=True).round(1)
+        self.touchdowns = rng.poisson(0.4, size=(n_teams, n_players, n_weeks))
+        self.points[:, :, n_completed_weeks:] = 0
+
+        # Round-robin (circle method) schedule of (home, away) team indices
+        self.schedule = []
+        rotation = list(range(n_teams))
+        for week in range(n_weeks):
+            self.schedule.append(
+                [(rotation[i], rotation[n_teams - 1 - i]) for i in range(n_teams // 2)]
+            )
+            rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+
+    def __repr__(self):
+        return f"SyntheticLeague({self.league_id}, {self.year})"
+
+    @property
+    def league_path(self) -> str:
+        if self.year < 2018:
+            return f"ffl/leagueHistory/{self.league_id}"
+        return f"ffl/seasons/{self.year}/segments/0/leagues/{self.league_id}"
+
+    def __call__(
+        self, path: str, query: str, fantasy_filter: Optional[str]
+    ) -> Optional[Tuple[int, bytes]]:
+        params = parse_qs(query)
+        views = set(params.get("view", []))
+
+        if path.strip("/") == self.league_path:
+            if "mScoreboard" in views:
+                matchup_periods = json.loads(fantasy_filter)["schedule"][
+                    "filterMatchupPeriodIds"
+                ]["value"]
+                body = self.get_box_scores([int(period) for period in matchup_periods])
+            elif views == {"mPositionalRatings"}:
+                body = {}
+            elif views == {"mRoster"}:
+                body = {"teams": self.get_teams()}
+            elif views == {"mDraftDetail"}:
+                body = {"draftDetail": self.get_draft()}
+            else:
+                body = self.get_league()
+            if self.year < 2018:
+                body = [body]
+        elif path.strip("/") == f"ffl/seasons/{self.year}/players":
+            body = [
+                {"id": int(player_id), "fullName": f"Player {player_id}"}
+                for player_id in self.player_ids.flatten()
+            ]
+        elif path.strip("/") == f"ffl/seasons/{self.year}":
+            body = {"settings": {"proTeams": []}}
+        else:
+            return None
+        return 200, json.dumps(body).encode()
+
+    def get_score(self, team_idx: int, week: int) -> float:
+        starters = [
+            i for i, (_, slot, _, _) in enumerate(SYNTHETIC_ROSTER) if slot < 20
+        ]
+        return round(float(self.points[team_idx, starters, week - 1].sum()), 2)
+
+    def get_roster_entry(self, team_idx: int, player_idx: int) -> dict:
+        position, slot, eligible_slots, position_id = SYNTHETIC_ROSTER[player_idx]
+        player_id = int(self.player_ids[team_idx, player_idx])
+        stats = []
+        for w in range(1, self.n_weeks + 1):
+            stats.append(
+                {
+                    "seasonId": self.year,
+                    "scoringPeriodId": w,
+                    "statSourceId": 1,
+                    "statSplitTypeId": 1,
+                    "appliedTotal": float(
+                        self.projected_points[team_idx, player_idx, 0]
+                    ),
+                    "stats": {},
+                }
+            )
+            if w <= self.n_completed_weeks:
+                stats.append(
+                    {
+                        "seasonId": self.year,
+                        "scoringPeriodId": w,
+                        "statSourceId": 0,
+                        "statSplitTypeId": 1,
+                        "appliedTotal": float(self.points[team_idx, player_idx, w - 1]),
+                        "stats": {
+                            SYNTHETIC_TD_STATS.get(position, "105"): int(
+                                self.touchdowns[team_idx, player_idx, w - 1]
+                            )
+                        },
+                    }
+                )
+        return {
+            "playerId": player_id,
+            "lineupSlotId": slot,
+            "playerPoolEntry": {
+                "id": player_id,
+                "onTeamId": team_idx + 1,
+                "player": {
+                    "id": player_id,
+                    "fullName": f"Player {player_id}",
+                    "defaultPositionId": position_id,
+                    "eligibleSlots": eligible_slots,
+                    "proTeamId": int(self.pro_team_ids[team_idx, player_idx]),
+                    "injuryStatus": "ACTIVE",
+                    "stats": stats,
+                },
+            },
+        }
+
+    def get_roster(self, team_idx: int) -> dict:
+        return {
+            "entries": [
+                self.get_roster_entry(team_idx, player_idx)
+                for player_idx in range(len(SYNTHETIC_ROSTER))
+            ]
+        }
+
+    def get_teams(self) -> List[dict]:
+        return [
+            {"id": team_idx + 1, "roster": self.get_roster(team_idx)}
+            for team_idx in range(self.n_teams)
+        ]
+
+    def get_matchups(self) -> List[dict]:
+        matchups = []
+        for week, pairs in enumerate(self.schedule, start=1):
+            for home, away in pairs:
+                home_score = self.get_score(home, week)
+                away_score = self.get_score(away, week)
+                if week > self.n_completed_weeks:
+                    winner = "UNDECIDED"
+                elif home_score == away_score:
+                    winner = "TIE"
+                else:
+                    winner = "HOME" if home_score > away_score else "AWAY"
+                matchups.append(
+                    {
+                        "matchupPeriodId": week,
+                        "playoffTierType": "NONE",
+                        "home": {"teamId": home + 1, "totalPoints": home_score},
+                        "away": {"teamId": away + 1, "totalPoints": away_score},
+                        "winner": winner,
+                    }
+                )
+        return matchups
+
+    def get_box_scores(self, matchup_periods: List[int]) -> dict:
+        schedule = []
+        for matchup in self.get_matchups():
+            if matchup["matchupPeriodId"] not in matchup_periods:
+                continue
+            for side in ["home", "away"]:
+                team_idx = matchup[side]["teamId"] - 1
+                matchup[side]["rosterForCurrentScoringPeriod"] = self.get_roster(
+                    team_idx
+                )
+            schedule.append(matchup)
+        return {"schedule": schedule}
+
+    def get_draft(self) -> dict:
+        picks = []
+        n_players = len(SYNTHETIC_ROSTER)
+        for round_id in range(1, n_players + 1):
+            for team_idx in range(self.n_teams):
+                picks.append(
+                    {
+                        "teamId": team_idx + 1,
+                        "playerId": int(self.player_ids[team_idx, round_id - 1]),
+                        "roundId": round_id,
+                        "roundPickNumber": team_idx + 1,
+                        "bidAmount": 0,
+                        "keeper": False,
+                        "nominatingTeamId": 0,
+                    }
+                )
+        return {"drafted": True, "picks": picks}
+
+    def get_league(self) -> dict:
+        members = [
+            {"id": f"{{MEMBER-{i + 1}}}", "firstName": "Owner", "lastName": str(i + 1)}
+            for i in range(self.n_teams)
+        ]
+        matchups = self.get_matchups()
+        teams = []
+        for team_idx in range(self.n_teams):
+            team_id = team_idx + 1
+            results = [
+                (
+                    m["winner"],
+                    m["home"]["teamId"] == team_id,
+                    m["home" if m["home"]["teamId"] == team_id else "away"],
+                    m["away" if m["home"]["teamId"] == team_id else "home"],
+                )
+                for m in matchups
+                if team_id in (m["home"]["teamId"], m["away"]["teamId"])
+            ]
+            wins = sum(
+                1
+                for winner, home, _, _ in results
+                if winner == ("HOME" if home else "AWAY")
+            )
+            ties = sum(1 for winner, _, _, _ in results if winner == "TIE")
+            played = sum(1 for winner, _, _, _ in results if winner != "UNDECIDED")
+            teams.append(
+                {
+                    "id": team_id,
+                    "abbrev": f"T{team_id}",
+                    "name": f"Team {team_id}",
+                    "divisionId": team_idx % 2,
+                    "owners": [members[team_idx]["id"]],
+                    "playoffSeed": team_id,
+                    "rankCalculatedFinal": 0,
+                    "record": {
+                        "overall": {
+                            "wins": wins,
+                            "losses": played - wins - ties,
+                            "ties": ties,
+                            "pointsFor": sum(r[2]["totalPoints"] for r in results),
+                            "pointsAgainst": sum(r[3]["totalPoints"] for r in results),
+                            "streakLength": 1,
+                            "streakType": "WIN",
+                        }
+                    },
+                    "roster": self.get_roster(team_idx),
+                }
+            )
+
+        return {
+            "id": self.league_id,
+            "seasonId": self.year,
+            "scoringPeriodId": self.current_week,
+            "status": {
+                "isActive": True,
+                "currentMatchupPeriod": self.current_week,
+                "latestScoringPeriod": self.current_week,
+                "firstScoringPeriod": 1,
+                "finalScoringPeriod": self.n_weeks,
+                "previousSeasons": [self.year - 1],
+            },
+            "settings": {
+                "name": f"Synthetic League {self.league_id}",
+                "size": self.n_teams,
+                "scheduleSettings": {
+                    "matchupPeriodCount": self.n_weeks,
+                    "matchupPeriods": {str(w): [w] for w in range(1, self.n_weeks + 1)},
+                    "playoffTeamCount": 4,
+                    "playoffSeedingRule": "TOTAL_POINTS_SCORED",
+                    "divisions": [
+                        {"id": 0, "name": "East"},
+                        {"id": 1, "name": "West"},
+                    ],
+                },
+                "tradeSettings": {"vetoVotesRequired": 4},
+                "draftSettings": {"keeperCount": 0},
+                "scoringSettings": {
+                    "matchupTieRule": "NONE",
+                    "playoffMatchupTieRule": "NONE",
+                    "scoringItems": [],
+                },
+                "acquisitionSettings": {"isUsingAcquisitionBudget": False},
+                "rosterSettings": {"lineupSlotCounts": SYNTHETIC_LINEUP_SLOT_COUNTS},
+            },
+            "members": members,
+            "teams": teams,
+            "schedule": matchups,
+            "draftDetail": self.get_draft(),
+        }
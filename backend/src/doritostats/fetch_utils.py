@@ -2,10 +2,10 @@ import datetime
 import logging
 import os
 import re
-import requests
+import threading
 import warnings
 from contextlib import contextmanager
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
 import sqlalchemy
@@ -14,6 +14,12 @@ from espn_api.football import League
 from espn_api.requests.constant import FANTASY_BASE_ENDPOINT
 from espn_api.requests.espn_requests import ESPNInvalidLeague, ESPNUnknownError
 
+from backend.src.doritostats.espn_requests import (
+    SessionEspnRequests,
+    espn_get,
+    fetch_concurrently,
+)
+
 # TEMPORARY IMPORTS
 from espn_api.football import Team
 from espn_api.football.helper import (
@@ -39,27 +45,109 @@ OWNER_MAP = {
 }
 
 
+# Connection pool shared by every database query in this process
+POSTGRES_ENGINE = None
+POSTGRES_ENGINE_LOCK = threading.Lock()
+POSTGRES_POOL_SIZE = int(os.getenv("POSTGRES_POOL_SIZE", "5"))
+POSTGRES_MAX_OVERFLOW = int(os.getenv("POSTGRES_MAX_OVERFLOW", "5"))
+
+LEAGUE_CREDS_SQL = sqlalchemy.text(
+    """
+    SELECT league_id, league_year, swid, espn_s2
+    FROM public.fantasy_stats_leagueinfo
+    WHERE league_id IN :league_ids
+    """
+).bindparams(sqlalchemy.bindparam("league_ids", expanding=True))
+
+LEAGUE_CREDS_FOR_YEAR_SQL = sqlalchemy.text(
+    """
+    SELECT league_id, league_year, swid, espn_s2
+    FROM public.fantasy_stats_leagueinfo
+    WHERE league_id IN :league_ids AND league_year = :year
+    """
+).bindparams(sqlalchemy.bindparam("league_ids", expanding=True))
+
+
+def get_postgres_engine() -> sqlalchemy.engine.Engine:
+    """Get the SQLAlchemy engine shared by this process, creating it on first use.
+
+    The engine is created from the DATABASE_URL environment variable, with a
+    bounded connection pool (POSTGRES_POOL_SIZE + POSTGRES_MAX_OVERFLOW
+    connections). Pooled connections are checked before use, so connections
+    closed by the server are replaced transparently.
+
+    Returns:
+        sqlalchemy.engine.Engine: Shared engine
+    """
+    global POSTGRES_ENGINE
+    with POSTGRES_ENGINE_LOCK:
+        if POSTGRES_ENGINE is None:
+            # Load environment variables
+            load_dotenv("../.env", override=True)
+
+            conn_str = os.path.expandvars(os.environ.get("DATABASE_URL")).replace(
+                "postgres://", "postgresql://"
+            )
+            POSTGRES_ENGINE = sqlalchemy.create_engine(
+                conn_str,
+                pool_size=POSTGRES_POOL_SIZE,
+                max_overflow=POSTGRES_MAX_OVERFLOW,
+                pool_pre_ping=True,
+            )
+    return POSTGRES_ENGINE
+
+
 @contextmanager
 def get_postgres_conn() -> sqlalchemy.engine.base.Connection:
-    """Create a postrges connection using the DATABASE_URL environment variable.
+    """Check out a postgres connection from the shared engine's pool (see `get_postgres_engine()`).
 
     Returns:
         sqlalchemy.engine.base.Connection: A connection to the database.
     """
-    # Load environment variables
-    load_dotenv("../.env", override=True)
-
-    # Create a connection to the database
-    conn_str = os.path.expandvars(os.environ.get("DATABASE_URL")).replace(
-        "postgres://", "postgresql://"
-    )
-    engine = sqlalchemy.create_engine(conn_str, pool_pre_ping=True)
-    conn = engine.connect()
+    conn = get_postgres_engine().connect()
     try:
         yield conn
     finally:
+        # Return the connection to the pool
         conn.close()
-        engine.dispose()
+
+
+def get_league_creds_many(
+    league_ids: Iterable[int], year: Optional[int] = None
+) -> Dict[int, Tuple[int, int, str, str]]:
+    """Retrieves the credentials of several leagues from the database in a single query.
+
+    Args:
+        league_ids (Iterable[int]): League IDs
+        year (Optional[int], optional): The year of the league season. If not provided, retrieves the most recent entry of each league.
+
+    Returns:
+        Dict[int, Tuple[int, int, str, str]]: (league_id, league_year, swid, espn_s2) of each league that was found
+    """
+    league_ids = [int(league_id) for league_id in league_ids]
+    if not league_ids:
+        return {}
+
+    with get_postgres_conn() as conn:
+        if year:
+            league_info_df = pd.read_sql(
+                LEAGUE_CREDS_FOR_YEAR_SQL,
+                conn,
+                params={"league_ids": league_ids, "year": int(year)},
+            )
+        else:
+            league_info_df = pd.read_sql(
+                LEAGUE_CREDS_SQL, conn, params={"league_ids": league_ids}
+            )
+
+    # Keep the most recent entry of each league
+    league_info_df = league_info_df.sort_values(
+        by="league_year", ascending=False
+    ).drop_duplicates(subset="league_id")
+    return {
+        row.league_id: (row.league_id, row.league_year, row.swid, row.espn_s2)
+        for row in league_info_df.itertuples(index=False)
+    }
 
 
 def get_league_creds(
@@ -84,27 +172,14 @@ def get_league_creds(
         Exception: If no credentials are found for the given league_id and year.
     league_id: int, year: Optional[int] = None
     """
-    with get_postgres_conn() as conn:
-        # Query all the league info data
-        sql = f"""
-        SELECT league_id, league_year, swid, espn_s2
-        FROM public.fantasy_stats_leagueinfo
-        WHERE league_id = {league_id}
-        """
-        if year:
-            sql += f" AND league_year = {year}"
-        league_info_df = pd.read_sql(sql, conn)
-
-    if league_info_df.empty:
+    league_creds = get_league_creds_many([league_id], year).get(int(league_id))
+    if league_creds is None:
         raise Exception(
             "No league credentials found for league_id {} and year {}".format(
                 league_id, year
             )
         )
-    league_id, league_year, swid, espn_s2 = (
-        league_info_df.sort_values(by="league_year", ascending=False).iloc[0].values
-    )
-    return league_id, league_year, swid, espn_s2
+    return league_creds
 
 
 def set_league_endpoint(league: League) -> None:
@@ -129,14 +204,18 @@ def set_league_endpoint(league: League) -> None:
     print("[BUILDING LEAGUE] League endpoint set to: {}".format(league.endpoint))
 
 
-def verify_league_is_active(league: League) -> None:
+def verify_league_is_active(league: League, data: Optional[dict] = None) -> None:
     """Verify that the league is active and not in the offseason.
 
     Args:
         league (League): ESPN League object
+        data (Optional[dict]): League payload that was already fetched. Defaults to None (fetch it).
     """
     # Check if the league is active
-    r = requests.get(league.endpoint, cookies=league.cookies).json()
+    if data is None:
+        r = espn_get(league.endpoint, cookies=league.cookies).json()
+    else:
+        r = data
 
     if type(r) == list:
         r = r[0]
@@ -172,12 +251,16 @@ def verify_league_is_active(league: League) -> None:
         )
 
 
-def get_roster_settings(league: League) -> None:
+def get_roster_settings(league: League, data: Optional[dict] = None) -> None:
     """This grabs the roster and starting lineup settings for the league
     - Grabs the dictionary containing the number of players of each position a roster contains
     - Creates a dictionary roster_slots{} that only inlcludes slotIds that have a non-zero number of players on the roster
     - Creates a dictionary starting_roster_slots{} that is a subset of roster_slots{} and only includes slotIds that are on the starting roster
     - Add roster_slots{} and starting_roster_slots{} to the League attribute League.rosterSettings
+
+    Args:
+        league (League): ESPN League object
+        data (Optional[dict]): League payload (with the mSettings and mMatchupScore views) that was already fetched. Defaults to None (fetch it).
     """
     print("[BUILDING LEAGUE] Gathering roster settings information...")
 
@@ -210,8 +293,13 @@ def get_roster_settings(league: League) -> None:
         24: " ",
     }
 
-    endpoint = "{}view=mMatchupScore&view=mTeam&view=mSettings".format(league.endpoint)
-    r = requests.get(endpoint, cookies=league.cookies).json()
+    if data is None:
+        endpoint = "{}view=mMatchupScore&view=mTeam&view=mSettings".format(
+            league.endpoint
+        )
+        r = espn_get(endpoint, cookies=league.cookies).json()
+    else:
+        r = data
     if type(r) == list:
         r = r[0]
     settings = r["settings"]
@@ -399,20 +487,31 @@ def fetch_league(
         - league.settings.roster_slots
         - league.settings.starting_roster_slots
         - Set the roster for the current week
+
+    All of the league's views are fetched in a single request over a shared
+    requests.Session, and the extra details are derived from that payload.
     """
 
     print("[BUILDING LEAGUE] Fetching league data...")
-    league = League(league_id=league_id, year=year, swid=swid, espn_s2=espn_s2)
+    league = League(
+        league_id=league_id, year=year, swid=swid, espn_s2=espn_s2, fetch_league=False
+    )
+    league.espn_request = SessionEspnRequests.from_requests(league.espn_request)
 
     # Set cookies
     league.cookies = {"swid": swid, "espn_s2": espn_s2}
 
     # Set league endpoint
     set_league_endpoint(league)
-    verify_league_is_active(league)
+    data = league.espn_request.get_league()
+    verify_league_is_active(league, data)
+
+    # Build the league from the same payload
+    league.fetch_league()
 
     # Get roster information
-    get_roster_settings(league)
+    get_roster_settings(league, data)
+    league.espn_request.clear()
 
     # Set additinoal settings
     set_additional_settings(league)
@@ -435,3 +534,40 @@ def fetch_league(
     league.load_roster_week(current_matchup_period)
 
     return league
+
+
+def fetch_leagues(
+    league_id: int,
+    years: Iterable[int],
+    swid: Optional[str] = None,
+    espn_s2: Optional[str] = None,
+    ignore_errors: bool = False,
+) -> Dict[int, League]:
+    """Fetch several seasons of a league concurrently (see `fetch_league()`).
+
+    Args:
+        league_id (int): League ID
+        years (Iterable[int]): Seasons to fetch
+        swid (Optional[str]): User credential. Defaults to None.
+        espn_s2 (Optional[str]): User credential. Defaults to None.
+        ignore_errors (bool): Leave out seasons that could not be fetched instead of raising. Defaults to False.
+
+    Returns:
+        Dict[int, League]: League of each season
+    """
+    years = list(years)
+    leagues = fetch_concurrently(
+        lambda year: fetch_league(
+            league_id=league_id, year=year, swid=swid, espn_s2=espn_s2
+        ),
+        years,
+        return_exceptions=ignore_errors,
+    )
+
+    fetched = {}
+    for year, league in zip(years, leagues):
+        if isinstance(league, Exception):
+            logger.warning(f"Could not fetch league {league_id} ({year}): {league}")
+            continue
+        fetched[year] = league
+    return fetched
@@ -0,0 +1,442 @@
+import io
+import json
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from espn_api.football import League
+from espn_api.football.utils import power_points, two_step_dominance
+
+from backend.src.doritostats.box_score_cache import get_box_scores_many
+from backend.src.doritostats.fetch_utils import standings_weekly
+
+SNAPSHOT_FORMAT = "doritostats.league_snapshot"
+SNAPSHOT_VERSION = 1
+
+# Outcomes are stored as small integer codes
+OUTCOME_CODES = ["U", "W", "L", "T"]
+
+TEAM_COLUMNS = [
+    "team_id",
+    "team_name",
+    "owner",
+    "division_id",
+    "division_name",
+    "standing",
+    "final_standing",
+]
+WEEKLY_COLUMNS = ["scores", "outcomes", "opponents"]
+LINEUP_COLUMNS = [
+    "week",
+    "team_idx",
+    "name",
+    "position",
+    "slot_position",
+    "points",
+    "projected_points",
+    "active_status",
+    "eligible_slots",
+]
+
+
+class LeagueSnapshot:
+    """A compact, columnar copy of the parts of a League that the views need.
+
+    Team attributes are stored as one array per attribute (ordered like
+    `league.teams`), weekly results as (teams, weeks) arrays, and starting
+    lineups (optional) as one row per player per week.
+
+    Snapshots serialize to a versioned binary blob (`to_bytes()`) that is a
+    fraction of the size of the pickled League and can be loaded without the
+    lineups when only standings-type data is needed.
+    """
+
+    def __init__(self, meta: Dict, columns: Dict[str, np.ndarray]):
+        self.meta = meta
+        self.columns = columns
+
+    def __repr__(self):
+        return f"LeagueSnapshot({self.meta['league_id']}, {self.meta['year']})"
+
+    @property
+    def has_lineups(self) -> bool:
+        return "lineup_week" in self.columns
+
+    @classmethod
+    def from_league(
+        cls, league: League, lineup_weeks: Iterable[int] = ()
+    ) -> "LeagueSnapshot":
+        """Build a snapshot from a League created by `fetch_league()`.
+
+        Args:
+            league (League): League
+            lineup_weeks (Iterable[int]): Weeks whose box score lineups should be captured. Defaults to none.
+
+        Returns:
+            LeagueSnapshot: Snapshot of the league
+        """
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "league_id": league.league_id,
+            "year": league.year,
+            "current_week": league.current_week,
+            "current_matchup_period": league.currentMatchupPeriod,
+            "n_completed_weeks": getattr(league, "n_completed_weeks", 0),
+            "endpoint": getattr(league, "endpoint", None),
+            "roster_settings": getattr(league, "roster_settings", None),
+            "settings": {
+                "name": getattr(league.settings, "name", ""),
+                "reg_season_count": league.settings.reg_season_count,
+                "playoff_team_count": league.settings.playoff_team_count,
+                "playoff_seed_tie_rule": league.settings.playoff_seed_tie_rule,
+                "team_count": league.settings.team_count,
+                "matchup_periods": league.settings.matchup_periods,
+                "week_to_matchup_period": league.settings.week_to_matchup_period,
+                "division_map": league.settings.division_map,
+            },
+        }
+
+        teams = league.teams
+        team_idx = {team.team_id: i for i, team in enumerate(teams)}
+        n_weeks = max([len(team.schedule) for team in teams] + [0])
+
+        # Team columns
+        columns = {
+            "team_id": np.array([team.team_id for team in teams], dtype=np.int32),
+            "team_name": np.array([team.team_name for team in teams], dtype=str),
+            "owner": np.array([team.owner for team in teams], dtype=str),
+            "division_id": np.array(
+                [team.division_id for team in teams], dtype=np.int32
+            ),
+            "division_name": np.array(
+                [team.division_name for team in teams], dtype=str
+            ),
+            "standing": np.array([team.standing for team in teams], dtype=np.int32),
+            "final_standing": np.array(
+                [team.final_standing for team in teams], dtype=np.int32
+            ),
+        }
+
+        # Weekly columns (opponents are team indices, a bye is the team itself)
+        scores = np.zeros((len(teams), n_weeks))
+        outcomes = np.zeros((len(teams), n_weeks), dtype=np.int8)
+        opponents = np.tile(np.arange(len(teams), dtype=np.int32)[:, None], n_weeks)
+        for i, team in enumerate(teams):
+            scores[i, : len(team.scores)] = team.scores
+            outcomes[i, : len(team.outcomes)] = [
+                OUTCOME_CODES.index(outcome) for outcome in team.outcomes
+            ]
+            opponents[i, : len(team.schedule)] = [
+                team_idx.get(opponent.team_id, i) for opponent in team.schedule
+            ]
+        columns.update({"scores": scores, "outcomes": outcomes, "opponents": opponents})
+
+        # Lineup columns
+        lineups = {column: [] for column in LINEUP_COLUMNS}
+        box_scores_by_week = get_box_scores_many(league, lineup_weeks)
+        for week, box_scores in box_scores_by_week.items():
+            for box_score in box_scores:
+                for team, lineup in [
+                    (box_score.home_team, box_score.home_lineup),
+                    (box_score.away_team, box_score.away_lineup),
+                ]:
+                    # Skip byes
+                    if getattr(team, "team_id", None) not in team_idx:
+                        continue
+                    for player in lineup:
+                        lineups["week"].append(week)
+                        lineups["team_idx"].append(team_idx[team.team_id])
+                        lineups["name"].append(player.name)
+                        lineups["position"].append(player.position)
+                        lineups["slot_position"].append(player.slot_position)
+                        lineups["points"].append(player.points)
+                        lineups["projected_points"].append(player.projected_points)
+                        lineups["active_status"].append(player.active_status)
+                        lineups["eligible_slots"].append("|".join(player.eligibleSlots))
+        if lineup_weeks:
+            columns.update(
+                {
+                    "lineup_week": np.array(lineups["week"], dtype=np.int16),
+                    "lineup_team_idx": np.array(lineups["team_idx"], dtype=np.int16),
+                    "lineup_name": np.array(lineups["name"], dtype=str),
+                    "lineup_position": np.array(lineups["position"], dtype=str),
+                    "lineup_slot_position": np.array(
+                        lineups["slot_position"], dtype=str
+                    ),
+                    "lineup_points": np.array(lineups["points"], dtype=float),
+                    "lineup_projected_points": np.array(
+                        lineups["projected_points"], dtype=float
+                    ),
+                    "lineup_active_status": np.array(
+                        lineups["active_status"], dtype=str
+                    ),
+                    "lineup_eligible_slots": np.array(
+                        lineups["eligible_slots"], dtype=str
+                    ),
+                }
+            )
+        return cls(meta, columns)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the snapshot.
+
+        The blob is an uncompressed .npz archive: one member per column plus a
+        JSON "meta" member holding the format name and version.
+
+        Returns:
+            bytes: Serialized snapshot
+        """
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            meta=np.array(json.dumps(self.meta)),
+            **self.columns,
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, include_lineups: bool = False) -> "LeagueSnapshot":
+        """Load a snapshot created by `to_bytes()`.
+
+        Only the requested columns are read from the blob.
+
+        Args:
+            data (bytes): Serialized snapshot
+            include_lineups (bool): Whether to load the lineup columns. Defaults to False.
+
+        Raises:
+            ValueError: If the blob is not a snapshot of the current version
+
+        Returns:
+            LeagueSnapshot: Snapshot of the league
+        """
+        try:
+            archive = np.load(io.BytesIO(data), allow_pickle=False)
+            meta = json.loads(str(archive["meta"]))
+        except Exception as e:
+            raise ValueError(f"Invalid league snapshot: {e}")
+        if meta.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError("Invalid league snapshot: unknown format")
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"League snapshot version {meta.get('version')} is not supported (expected {SNAPSHOT_VERSION})"
+            )
+
+        # JSON object keys are always strings
+        settings = meta["settings"]
+        settings["week_to_matchup_period"] = {
+            int(week): matchup_period
+            for week, matchup_period in settings["week_to_matchup_period"].items()
+        }
+        settings["division_map"] = {
+            int(division_id): name
+            for division_id, name in settings["division_map"].items()
+        }
+
+        columns = {
+            name: archive[name]
+            for name in archive.files
+            if name != "meta" and (include_lineups or not name.startswith("lineup_"))
+        }
+        return cls(meta, columns)
+
+    def to_league(self) -> "SnapshotLeague":
+        """Create a lightweight League stand-in from the snapshot.
+
+        Returns:
+            SnapshotLeague: League stand-in
+        """
+        return SnapshotLeague(self)
+
+
+class SnapshotSettings:
+    """A skeleton of the Settings class"""
+
+    def __init__(self, settings: Dict):
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+
+class SnapshotTeam:
+    """A skeleton of the Team class, built from a LeagueSnapshot"""
+
+    def __init__(self, snapshot: LeagueSnapshot, idx: int):
+        columns = snapshot.columns
+        self.team_id = int(columns["team_id"][idx])
+        self.team_name = str(columns["team_name"][idx])
+        self.owner = str(columns["owner"][idx])
+        self.division_id = int(columns["division_id"][idx])
+        self.division_name = str(columns["division_name"][idx])
+        self.standing = int(columns["standing"][idx])
+        self.final_standing = int(columns["final_standing"][idx])
+        self.scores = columns["scores"][idx].tolist()
+        self.outcomes = [OUTCOME_CODES[code] for code in columns["outcomes"][idx]]
+        self.wins = self.outcomes.count("W")
+        self.losses = self.outcomes.count("L")
+        self.ties = self.outcomes.count("T")
+        self.points_for = round(sum(self.scores), 2)
+
+        # Set by SnapshotLeague once every team exists
+        self.schedule = []
+        self.mov = []
+        self.points_against = 0
+
+    def __repr__(self):
+        return f"Team({self.team_name})"
+
+
+class SnapshotPlayer:
+    """A skeleton of the BoxPlayer class, built from a LeagueSnapshot"""
+
+    def __init__(self, snapshot: LeagueSnapshot, row: int):
+        columns = snapshot.columns
+        self.name = str(columns["lineup_name"][row])
+        self.position = str(columns["lineup_position"][row])
+        self.slot_position = str(columns["lineup_slot_position"][row])
+        self.points = float(columns["lineup_points"][row])
+        self.projected_points = float(columns["lineup_projected_points"][row])
+        self.active_status = str(columns["lineup_active_status"][row])
+        eligible_slots = str(columns["lineup_eligible_slots"][row])
+        self.eligibleSlots = eligible_slots.split("|") if eligible_slots else []
+
+    def __repr__(self):
+        return f"Player({self.name}, points:{self.points})"
+
+
+class SnapshotBoxScore:
+    """A skeleton of the BoxScore class, built from a LeagueSnapshot"""
+
+    def __init__(
+        self,
+        home_team: SnapshotTeam,
+        home_lineup: List[SnapshotPlayer],
+        away_team: Optional[SnapshotTeam],
+        away_lineup: List[SnapshotPlayer],
+        week: int,
+    ):
+        self.home_team = home_team
+        self.home_lineup = home_lineup
+        self.home_score = home_team.scores[week - 1]
+        self.home_projected = sum(
+            player.projected_points
+            for player in home_lineup
+            if player.slot_position not in ["BE", "IR"]
+        )
+        self.away_team = away_team or 0
+        self.away_lineup = away_lineup
+        self.away_score = away_team.scores[week - 1] if away_team else 0
+        self.away_projected = sum(
+            player.projected_points
+            for player in away_lineup
+            if player.slot_position not in ["BE", "IR"]
+        )
+
+    def __repr__(self):
+        return f"Box Score({self.away_team or 'BYE'} at {self.home_team})"
+
+
+class SnapshotLeague:
+    """A League stand-in backed by a LeagueSnapshot.
+
+    Provides the attributes and methods used by the standings, power rankings
+    and settings views. Player-level stats are not part of the snapshot, so
+    analytics that need `player.stats` still require the full League.
+    """
+
+    def __init__(self, snapshot: LeagueSnapshot):
+        meta = snapshot.meta
+        self.snapshot = snapshot
+        self.league_id = meta["league_id"]
+        self.year = meta["year"]
+        self.current_week = meta["current_week"]
+        self.currentMatchupPeriod = meta["current_matchup_period"]
+        self.n_completed_weeks = meta["n_completed_weeks"]
+        self.endpoint = meta["endpoint"]
+        self.roster_settings = meta["roster_settings"]
+        self.settings = SnapshotSettings(meta["settings"])
+
+        self.teams = [
+            SnapshotTeam(snapshot, i) for i in range(len(snapshot.columns["team_id"]))
+        ]
+        scores = snapshot.columns["scores"]
+        opponents = snapshot.columns["opponents"]
+        for i, team in enumerate(self.teams):
+            team.schedule = [self.teams[j] for j in opponents[i]]
+            team.mov = scores[i] - scores[opponents[i], np.arange(scores.shape[1])]
+            team.mov = team.mov.tolist()
+            played = np.array(team.outcomes) != "U"
+            team.points_against = round(
+                float(scores[opponents[i], np.arange(scores.shape[1])][played].sum()),
+                2,
+            )
+
+    def __repr__(self):
+        return f"SnapshotLeague({self.league_id}, {self.year})"
+
+    def standings(self) -> List[SnapshotTeam]:
+        return sorted(
+            self.teams,
+            key=lambda x: x.final_standing if x.final_standing != 0 else x.standing,
+        )
+
+    def standings_weekly(self, week: int) -> List[SnapshotTeam]:
+        return standings_weekly(self, week)
+
+    def power_rankings(self, week: Optional[int] = None) -> List:
+        """Same as League.power_rankings(), using the snapshot's schedule."""
+        if not week or week <= 0 or week > self.current_week:
+            week = self.current_week
+
+        # Calculate wins against every opponent
+        teams_sorted = sorted(self.teams, key=lambda x: x.team_id)
+        win_matrix = []
+        for team in teams_sorted:
+            wins = [0] * len(teams_sorted)
+            for mov, opponent in zip(team.mov[:week], team.schedule[:week]):
+                if mov > 0:
+                    wins[teams_sorted.index(opponent)] += 1
+            win_matrix.append(wins)
+        dominance_matrix = two_step_dominance(win_matrix)
+        return power_points(dominance_matrix, teams_sorted, week)
+
+    def box_scores(self, week: int) -> List[SnapshotBoxScore]:
+        """Rebuild the box scores of a week from the captured lineups.
+
+        Args:
+            week (int): Week
+
+        Raises:
+            ValueError: If the lineups of the week were not captured
+
+        Returns:
+            List[SnapshotBoxScore]: Box scores of the week
+        """
+        columns = self.snapshot.columns
+        if not self.snapshot.has_lineups or week not in columns["lineup_week"]:
+            raise ValueError(f"Lineups for week {week} are not in the snapshot")
+
+        rows = np.flatnonzero(columns["lineup_week"] == week)
+        lineups = {i: [] for i in range(len(self.teams))}
+        for row in rows:
+            lineups[int(columns["lineup_team_idx"][row])].append(
+                SnapshotPlayer(self.snapshot, row)
+            )
+
+        box_scores = []
+        seen = set()
+        for i, team in enumerate(self.teams):
+            if i in seen:
+                continue
+            j = int(columns["opponents"][i, week - 1])
+            seen.update([i, j])
+            opponent = self.teams[j] if j != i else None
+            box_scores.append(
+                SnapshotBoxScore(
+                    team,
+                    lineups[i],
+                    opponent,
+                    lineups.get(j, []) if opponent else [],
+                    week,
+                )
+            )
+        return box_scores
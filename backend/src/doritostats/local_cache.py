@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LocalCache:
+    """An in-process LRU cache bounded by the total size (in bytes) of its values.
+
+    Entries expire `ttl` seconds after they are set. Each entry also carries a
+    version stamp; `get()` only returns the entry if the caller's version
+    matches, so a process can check a small version key in a shared cache
+    before trusting its own copy of a large object.
+
+    The size of a value is supplied by the caller (e.g. the length of its
+    serialized form), since measuring a Python object graph is unreliable.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"LocalCache({len(self)} entries, {self.n_bytes}/{self.max_bytes} bytes)"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, version: Optional[Any] = None) -> Optional[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key (Hashable): Cache key
+            version (Optional[Any]): Expected version of the entry. Defaults to None (any version).
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is missing, expired, or a different version
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, entry_version, expires_at = entry
+            if time.monotonic() >= expires_at or (
+                version is not None and version != entry_version
+            ):
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        version: Optional[Any] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add a value to the cache, evicting the least recently used entries to make room.
+
+        Values larger than the whole cache are not stored.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to cache
+            size (int): Size of the value in bytes
+            version (Optional[Any]): Version stamp of the value. Defaults to None.
+            ttl (Optional[float]): Seconds until the entry expires. Defaults to None (the cache's ttl).
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            while self.n_bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (value, size, version, expires_at)
+            self.n_bytes += size
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.n_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self.n_bytes -= size
@@ -12,6 +12,7 @@ from backend.src.doritostats.analytic_utils import (
     get_weekly_finish,
 )
 from backend.src.doritostats.analytic_utils import make_ordinal
+from backend.src.doritostats.box_score_cache import get_box_scores
 
 
 def calculate_scheduling_factor(league: League, team: Team, week: int) -> float:
@@ -375,7 +376,7 @@ def get_weekly_luck_index(
 
     # Get factors for metrics that require the team's lineup
     if box_scores is None:
-        box_scores = league.box_scores(week)
+        box_scores = get_box_scores(league, week)
     team_lineup = get_lineup(league=league, team=team, week=week, box_scores=box_scores)
     opp_lineup = get_lineup(league=league, team=opp, week=week, box_scores=box_scores)
 
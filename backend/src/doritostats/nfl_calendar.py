@@ -0,0 +1,112 @@
+import datetime
+from typing import List, Optional, Tuple
+
+import pytz
+
+EASTERN = pytz.timezone("US/Eastern")
+
+# Months with NFL games that count for fantasy (September through early January)
+SEASON_MONTHS = [9, 10, 11, 12, 1]
+
+# Windows (US/Eastern) in which NFL games are played: weekday -> [(start, end), ...]
+# Monday = 0. Each window ends once its last game is usually final.
+GAME_WINDOWS = {
+    0: [(datetime.time(19, 15), datetime.time(23, 59))],  # Monday night
+    3: [(datetime.time(20, 15), datetime.time(23, 59))],  # Thursday night
+    6: [(datetime.time(9, 30), datetime.time(23, 59))],  # International, 1pm, 4pm, SNF
+}
+THANKSGIVING_WINDOW = (datetime.time(12, 30), datetime.time(23, 59))
+LATE_SEASON_SATURDAY_WINDOW = (datetime.time(13, 0), datetime.time(23, 59))
+
+# Seconds between refreshes while games are on, and otherwise (waivers, trades)
+LIVE_REFRESH_INTERVAL = 10 * 60
+IDLE_REFRESH_INTERVAL = 12 * 60 * 60
+
+
+def get_game_windows(
+    day: datetime.date,
+) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+    """Get the windows in which NFL games are played on a given day.
+
+    Args:
+        day (datetime.date): Day
+
+    Returns:
+        List[Tuple[datetime.datetime, datetime.datetime]]: (start, end) of each window, in US/Eastern
+    """
+    if day.month not in SEASON_MONTHS:
+        return []
+
+    windows = list(GAME_WINDOWS.get(day.weekday(), []))
+
+    # Thanksgiving (the fourth Thursday of November) has games all day
+    if day.month == 11 and day.weekday() == 3 and 22 <= day.day <= 28:
+        windows = [THANKSGIVING_WINDOW]
+
+    # Saturday games are played from mid-December on
+    if day.weekday() == 5 and (day.month == 1 or (day.month == 12 and day.day >= 14)):
+        windows.append(LATE_SEASON_SATURDAY_WINDOW)
+
+    return [
+        (
+            EASTERN.localize(datetime.datetime.combine(day, start)),
+            EASTERN.localize(datetime.datetime.combine(day, end)),
+        )
+        for start, end in windows
+    ]
+
+
+def is_game_in_progress(now: datetime.datetime) -> bool:
+    """Check whether `now` falls in an NFL game window."""
+    now = now.astimezone(EASTERN)
+    return any(start <= now < end for start, end in get_game_windows(now.date()))
+
+
+def get_last_game_end(now: datetime.datetime) -> Optional[datetime.datetime]:
+    """Get the end of the most recent game window that has finished (within the last week).
+
+    Args:
+        now (datetime.datetime): Current time (timezone-aware)
+
+    Returns:
+        Optional[datetime.datetime]: End of the last game window, or None if no games were played in the last week
+    """
+    now = now.astimezone(EASTERN)
+    for days_ago in range(8):
+        day = now.date() - datetime.timedelta(days=days_ago)
+        ends = [end for _, end in get_game_windows(day) if end <= now]
+        if ends:
+            return max(ends)
+    return None
+
+
+def is_stale(
+    refreshed_at: datetime.datetime, now: Optional[datetime.datetime] = None
+) -> bool:
+    """Check whether league data fetched at `refreshed_at` may have changed since.
+
+    League data only changes when games are played (and, less urgently, when
+    waivers and trades process). Data is stale if:
+        - Games are in progress and it is older than LIVE_REFRESH_INTERVAL
+        - A game window has finished since it was fetched
+        - It is older than IDLE_REFRESH_INTERVAL
+
+    Args:
+        refreshed_at (datetime.datetime): When the data was fetched (timezone-aware)
+        now (Optional[datetime.datetime]): Current time. Defaults to None (now).
+
+    Returns:
+        bool: Whether the data should be refreshed
+    """
+    if now is None:
+        now = datetime.datetime.now(pytz.utc)
+    age = (now - refreshed_at).total_seconds()
+
+    if is_game_in_progress(now):
+        return age >= LIVE_REFRESH_INTERVAL
+
+    last_game_end = get_last_game_end(now)
+    if last_game_end is not None and refreshed_at < last_game_end:
+        return True
+
+    return age >= IDLE_REFRESH_INTERVAL
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+
+class RowBuilder:
+    """Collect the rows of a DataFrame as plain dicts, then build the DataFrame once.
+
+    Writing a frame cell by cell (`df.loc[i, col] = value`) reindexes it, and
+    often upcasts its columns, every time a new row or column is added.
+    Collecting dicts and constructing the frame at the end avoids that.
+
+    Columns listed in `dtypes` come first, in that order, and are cast to their
+    dtype. Other columns follow in the order they first appear, with their
+    dtypes inferred. A column missing from a row is NaN in that row.
+
+    Args:
+        dtypes (Optional[Dict[str, Any]]): dtype of each column. Defaults to None.
+    """
+
+    def __init__(self, dtypes: Optional[Dict[str, Any]] = None):
+        self.dtypes = dtypes or {}
+        self.rows: List[Dict[str, Any]] = []
+
+    def __repr__(self):
+        return f"RowBuilder({len(self)} rows)"
+
+    def __len__(self):
+        return len(self.rows)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self.rows.append(row)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self.rows.extend(rows)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build the DataFrame.
+
+        Returns:
+            pd.DataFrame: One row per appended dict
+        """
+        df = pd.DataFrame.from_records(self.rows)
+        columns = list(self.dtypes) + [
+            column for column in df.columns if column not in self.dtypes
+        ]
+        return df.reindex(columns=columns).astype(self.dtypes)
@@ -0,0 +1,131 @@
+from typing import List, Optional
+
+import numpy as np
+from espn_api.football import League
+
+from backend.src.doritostats.box_score_cache import get_box_scores
+
+
+class ScoreModel:
+    """Distribution of each team's weekly score, used by the simulation engine.
+
+    A model is fit once per (league, week) and then sampled in batches.
+    Teams are referred to by their position in `league.teams`.
+
+    Subclasses implement `fit()` and `sample()`.
+    """
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def fit(self, league: League, week: Optional[int] = None) -> "ScoreModel":
+        """Fit the per-team parameters of the model.
+
+        Args:
+            league (League): League
+            week (Optional[int]): Last completed week to use. Defaults to None (all scores).
+
+        Returns:
+            ScoreModel: self
+        """
+        raise NotImplementedError
+
+    def sample(self, team_idx: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Draw one score for every entry of `team_idx`.
+
+        Args:
+            team_idx (np.ndarray): Integer array of team indices (any shape)
+            rng (np.random.Generator): Random number generator
+
+        Returns:
+            np.ndarray: Simulated scores, same shape as `team_idx`
+        """
+        raise NotImplementedError
+
+
+def get_past_scores(league: League, week: Optional[int] = None) -> List[np.ndarray]:
+    """Get the non-zero scores of each team (ordered like league.teams).
+
+    Args:
+        league (League): League
+        week (Optional[int]): Last week to include. Defaults to None (all weeks).
+
+    Returns:
+        List[np.ndarray]: Scores of each team
+    """
+    past_scores = []
+    for team in league.teams:
+        scores = np.array(team.scores[:week], dtype=float)
+        past_scores.append(scores[scores > 0])
+    return past_scores
+
+
+class NormalScoreModel(ScoreModel):
+    """Scores are drawn from a normal distribution defined by:
+        mean = average score over the last 6 weeks
+        std = standard deviation over the entire season * 2
+
+    The standard deviation is artificially inflated since scores are highly unpredictable.
+    """
+
+    def __init__(self, n_recent_weeks: int = 6, std_multiplier: float = 2):
+        self.n_recent_weeks = n_recent_weeks
+        self.std_multiplier = std_multiplier
+
+    def fit(self, league: League, week: Optional[int] = None) -> "NormalScoreModel":
+        past_scores = get_past_scores(league, week)
+        self.score_mean = np.array(
+            [scores[-self.n_recent_weeks :].mean() for scores in past_scores]
+        )
+        self.score_std = np.array(
+            [scores.std() * self.std_multiplier for scores in past_scores]
+        )
+        return self
+
+    def sample(self, team_idx: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        return rng.normal(loc=self.score_mean[team_idx], scale=self.score_std[team_idx])
+
+
+class EmpiricalScoreModel(ScoreModel):
+    """Scores are resampled (with replacement) from each team's past scores."""
+
+    def fit(self, league: League, week: Optional[int] = None) -> "EmpiricalScoreModel":
+        past_scores = get_past_scores(league, week)
+
+        # Store the scores as a padded (teams, weeks) array
+        self.n_scores = np.array([len(scores) for scores in past_scores])
+        self.scores = np.zeros((len(past_scores), max(self.n_scores.max(), 1)))
+        for i, scores in enumerate(past_scores):
+            self.scores[i, : len(scores)] = scores
+        return self
+
+    def sample(self, team_idx: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        week_idx = rng.integers(0, np.maximum(self.n_scores[team_idx], 1))
+        return self.scores[team_idx, week_idx]
+
+
+class ProjectionScoreModel(NormalScoreModel):
+    """Scores are drawn from a normal distribution centered on ESPN's projection
+    of each team's lineup for the next week (from its box scores).
+
+    The standard deviation is the same as in NormalScoreModel.
+    Teams without a projection fall back to NormalScoreModel's mean.
+    """
+
+    def fit(self, league: League, week: Optional[int] = None) -> "ProjectionScoreModel":
+        super().fit(league, week)
+
+        # Get the projected score of each team's lineup for the next week
+        next_week = week + 1 if week is not None else league.current_week
+        team_idx = {team.team_id: i for i, team in enumerate(league.teams)}
+        for box_score in get_box_scores(league, next_week):
+            for team, projected in [
+                (box_score.home_team, box_score.home_projected),
+                (box_score.away_team, box_score.away_projected),
+            ]:
+                # Skip byes
+                if getattr(team, "team_id", None) not in team_idx:
+                    continue
+                if projected > 0:
+                    self.score_mean[team_idx[team.team_id]] = projected
+        return self
@@ -3,6 +3,7 @@ from typing import List
 
 import pandas as pd
 from espn_api.football import League, Team, Player
+from backend.src.doritostats.box_score_cache import get_box_scores_many
 from backend.src.doritostats.fetch_utils import fetch_league
 
 logger = logging.getLogger(__name__)
@@ -86,11 +87,16 @@ def get_stats_by_matchup(
     # Instantiate data frame
     df = pd.DataFrame()
 
-    # Loop through each week that has happened
+    # Fetch the box scores of every week that has happened at once
     current_matchup_period = league.settings.week_to_matchup_period[league.current_week]
+    box_scores_by_week = get_box_scores_many(
+        league, range(1, current_matchup_period + 1)
+    )
+
+    # Loop through each week that has happened
     for week in range(current_matchup_period):
         league.load_roster_week(week + 1)
-        box_scores = league.box_scores(week + 1)
+        box_scores = box_scores_by_week[week + 1]
 
         # Instantiate week data frame
         df_week = pd.DataFrame()
@@ -1,10 +1,17 @@
 import logging
+import os
+import tempfile
+import threading
 import numpy as np
 import pandas as pd
 from espn_api.football import League, Team, Matchup
-from typing import Optional
+from espn_api.football.box_score import BoxScore
+from typing import Any, Dict, List, Optional
+from backend.src.doritostats.box_score_cache import get_box_scores_many
+from backend.src.doritostats.espn_requests import fetch_concurrently
 from backend.src.doritostats.fetch_utils import fetch_league, OWNER_MAP
 from backend.src.doritostats.PseudoMatchup import PseudoMatchup
+from backend.src.doritostats.row_builder import RowBuilder
 from backend.src.doritostats.analytic_utils import (
     get_num_bye,
     get_num_inactive,
@@ -21,6 +28,38 @@ from backend.src.doritostats.analytic_utils import (
 
 logger = logging.getLogger(__name__)
 
+# dtypes of the leading columns of the historical stats dataframe
+TEAM_STATS_DTYPES = {
+    "year": "int64",
+    "week": "int64",
+    "location": "object",
+    "team_owner": "object",
+    "team_name": "object",
+    "team_division": "object",
+    "team_score": "float64",
+    "opp_owner": "object",
+    "opp_name": "object",
+    "opp_division": "object",
+    "opp_score": "float64",
+    "is_regular_season": "bool",
+    "is_playoff": "bool",
+}
+
+# Lineup slots with their own columns in the historical stats dataframe
+LINEUP_SLOTS = ["QB", "RB", "WR", "TE", "RB/WR/TE", "D/ST", "K"]
+
+# Number of seasons built at once by `scrape_team_stats()`
+MAX_CONCURRENT_SEASONS = int(os.getenv("MAX_CONCURRENT_SEASONS", "4"))
+
+# Where `scrape_team_stats()` saves finished years when no checkpoint directory is given
+SEASON_CHECKPOINT_DIR = os.getenv(
+    "SEASON_CHECKPOINT_DIR", os.path.join(tempfile.gettempdir(), "doritostats_seasons")
+)
+
+# Streaks restart every season
+# Remove "year" if you want win streaks to roll into the next season
+STREAK_GROUPS = ["team_owner", "year"]
+
 
 def is_playoff_game(league: League, matchup: Matchup, week: int) -> bool:
     """Accepts a League and Matchup object and determines if the matchup was a playoff game"""
@@ -68,7 +107,11 @@ def is_playoff_game(league: League, matchup: Matchup, week: int) -> bool:
 
 
 def get_stats_by_week(
-    league_id: int, year: int, swid: str, espn_s2: str
+    league_id: int,
+    year: int,
+    swid: str,
+    espn_s2: str,
+    league: Optional[League] = None,
 ) -> pd.DataFrame:
     """This function creates a historical dataframe for the league in a given year.
 
@@ -84,58 +127,58 @@ def get_stats_by_week(
         year (int): Year of the league
         swid (str): User credential
         espn_s2 (str): User credential
+        league (League, optional): League object, if it has already been fetched. Defaults to None.
 
     Returns:
         pd.DataFrame: Historical stats dataframe
     """
 
     # Fetch league for year
-    league = fetch_league(league_id=league_id, year=year, swid=swid, espn_s2=espn_s2)
+    if league is None:
+        league = fetch_league(
+            league_id=league_id, year=year, swid=swid, espn_s2=espn_s2
+        )
 
-    # Instantiate data frame
-    df = pd.DataFrame()
+    # Collect one row per team per week
+    rows = RowBuilder(TEAM_STATS_DTYPES)
 
     # Loop through every game in the team's schedule
     for week in range(
         min(len(league.settings.matchup_periods), league.currentMatchupPeriod)
     ):
-        # Instantiate week data frame
-        df_week = pd.DataFrame()
-
         # Loop through every team
         for i, team in enumerate(league.teams):
             # Skip byes
             if team.schedule[i] == team:
                 continue
 
-            # Add observation for home team
-            df_week.loc[i, "year"] = year
-            df_week.loc[i, "week"] = week + 1
-            df_week.loc[i, "location"] = "unknown"
-            df_week.loc[i, "team_owner"] = team.owner
-            df_week.loc[i, "team_name"] = team.team_name
-            df_week.loc[i, "team_division"] = team.division_name
-            df_week.loc[i, "team_score"] = team.scores[week]
-
-            df_week.loc[i, "opp_owner"] = team.schedule[week].owner
-            df_week.loc[i, "opp_name"] = team.schedule[week].team_name
-            df_week.loc[i, "opp_division"] = team.schedule[week].division_name
-            df_week.loc[i, "opp_score"] = team.schedule[week].scores[week]
-
-            # Is the game in the regular season?
-            df_week.loc[i, "is_regular_season"] = (
-                week < league.settings.reg_season_count
-            )
-
             # Is the game a playoff game? (not including consolation)
             # Home team is the lower seed
             matchup_teams = sorted(
                 [team, team.schedule[week]], key=lambda x: x.standing
             )
             matchup = PseudoMatchup(matchup_teams[0], matchup_teams[1])
-            df_week.loc[i, "is_playoff"] = is_playoff_game(league, matchup, week + 1)
 
-        df = pd.concat([df, df_week])
+            rows.append(
+                {
+                    "year": year,
+                    "week": week + 1,
+                    "location": "unknown",
+                    "team_owner": team.owner,
+                    "team_name": team.team_name,
+                    "team_division": team.division_name,
+                    "team_score": team.scores[week],
+                    "opp_owner": team.schedule[week].owner,
+                    "opp_name": team.schedule[week].team_name,
+                    "opp_division": team.schedule[week].division_name,
+                    "opp_score": team.schedule[week].scores[week],
+                    # Is the game in the regular season?
+                    "is_regular_season": week < league.settings.reg_season_count,
+                    "is_playoff": is_playoff_game(league, matchup, week + 1),
+                }
+            )
+
+    df = rows.to_frame()
 
     # Calculated fields
     df["score_dif"] = df["team_score"] - df["opp_score"]
@@ -171,6 +214,84 @@ def get_stats_by_week(
     return df
 
 
+def get_matchup_stats(
+    league: League, matchup: Matchup, week: int, home: bool
+) -> Dict[str, Any]:
+    """Get the stats of one team in a matchup (one row of the historical stats dataframe).
+
+    Args:
+        league (League): League object
+        matchup (Matchup): BoxScore of the matchup
+        week (int): Week of the matchup
+        home (bool): Get the stats of the home team (True) or the away team (False)
+
+    Returns:
+        Dict[str, Any]: Stats of the team
+    """
+    if home:
+        team, team_score, lineup = (
+            matchup.home_team,
+            matchup.home_score,
+            matchup.home_lineup,
+        )
+        opp, opp_score = matchup.away_team, matchup.away_score
+    else:
+        team, team_score, lineup = (
+            matchup.away_team,
+            matchup.away_score,
+            matchup.away_lineup,
+        )
+        opp, opp_score = matchup.home_team, matchup.home_score
+
+    row = {
+        "year": league.year,
+        "week": week,
+        "location": "HOME" if home else "AWAY",
+        "team_owner": team.owner,
+        "team_name": team.team_name,
+        "team_division": team.division_name,
+        "team_score": team_score,
+        "opp_owner": opp.owner,
+        "opp_name": opp.team_name,
+        "opp_division": opp.division_name,
+        "opp_score": opp_score,
+        "is_regular_season": week <= league.settings.reg_season_count,
+        "is_playoff": is_playoff_game(league, matchup, week),
+        "weekly_finish": get_weekly_finish(league, team, week),
+        "lineup_efficiency": get_lineup_efficiency(league, lineup),
+        "best_trio": get_best_trio(league, lineup),
+        "bench_points": sum_bench_points(league, lineup),
+        "team_projection_beat": get_score_surprise(league, lineup),
+        "n_bye": get_num_bye(league, lineup),
+        "n_inactive": get_num_inactive(league, lineup),
+        "n_touchdowns": get_total_tds(league, lineup),
+    }
+
+    for slot in LINEUP_SLOTS:
+        column = slot.replace("/", "_")
+        row[f"{column}_pts"] = avg_slot_score(league, lineup, slot=slot)
+
+        # Get the best player for each slot
+        top_players = get_top_players(lineup, slot, 1)
+        # If no player for this position is rostered, the best score is 0
+        row[f"best_{column}"] = top_players[0].points if top_players else 0
+
+        # The worst starter for each slot is only recorded for the home team
+        if home:
+            try:
+                row[f"worst_{column}"] = np.min(
+                    [
+                        player.points
+                        for player in get_top_players(lineup, slot, 10)
+                        if player.slot_position not in ("BE", "IR")
+                    ]
+                )
+            except Exception:
+                row[f"worst_{column}"] = 0
+
+    return row
+
+
 def get_stats_by_matchup(
     league: Optional[League] = None,
     league_id: Optional[int] = None,
@@ -210,145 +331,55 @@ def get_stats_by_matchup(
         league_id = league.league_id
         year = league.year
 
-    # Instantiate data frame
-    df = pd.DataFrame()
-
-    # Loop through each week that has happened
+    # Fetch the box scores of every week that has happened at once
     current_matchup_period = league.settings.week_to_matchup_period[league.current_week]
-    for week in range(current_matchup_period):
-        box_scores = league.box_scores(week + 1)
+    box_scores_by_week = get_box_scores_many(
+        league, range(1, current_matchup_period + 1)
+    )
 
-        # Instantiate week data frame
-        df_week = pd.DataFrame()
-        for i, matchup in enumerate(box_scores):
-            # Skip byes
-            if (type(matchup.home_team) != Team) or (type(matchup.away_team) != Team):
-                continue
+    # Collect one row per team per week
+    rows = RowBuilder(TEAM_STATS_DTYPES)
+    for week, box_scores in box_scores_by_week.items():
+        rows.extend(get_week_stats(league, box_scores, week))
 
-            # Add observation for home team
-            df_week.loc[i * 2, "year"] = year
-            df_week.loc[i * 2, "week"] = week + 1
-            df_week.loc[i * 2, "location"] = "HOME"
-            df_week.loc[i * 2, "team_owner"] = matchup.home_team.owner
-            df_week.loc[i * 2, "team_name"] = matchup.home_team.team_name
-            df_week.loc[i * 2, "team_division"] = matchup.home_team.division_name
-            df_week.loc[i * 2, "team_score"] = matchup.home_score
-            df_week.loc[i * 2, "opp_owner"] = matchup.away_team.owner
-            df_week.loc[i * 2, "opp_name"] = matchup.away_team.team_name
-            df_week.loc[i * 2, "opp_division"] = matchup.away_team.division_name
-            df_week.loc[i * 2, "opp_score"] = matchup.away_score
-            df_week.loc[i * 2, "is_regular_season"] = (
-                week < league.settings.reg_season_count
-            )
-            df_week.loc[i * 2, "is_playoff"] = is_playoff_game(
-                league, matchup, week + 1
-            )
+    return add_matchup_stats_fields(rows.to_frame())
 
-            home_lineup = matchup.home_lineup
-            df_week.loc[i * 2, "weekly_finish"] = get_weekly_finish(
-                league, matchup.home_team, week + 1
-            )
-            df_week.loc[i * 2, "lineup_efficiency"] = get_lineup_efficiency(
-                league, home_lineup
-            )
-            df_week.loc[i * 2, "best_trio"] = get_best_trio(league, home_lineup)
-            df_week.loc[i * 2, "bench_points"] = sum_bench_points(league, home_lineup)
-            df_week.loc[i * 2, "team_projection_beat"] = get_score_surprise(
-                league, home_lineup
-            )
-            df_week.loc[i * 2, "n_bye"] = get_num_bye(league, home_lineup)
-            df_week.loc[i * 2, "n_inactive"] = get_num_inactive(league, home_lineup)
-            df_week.loc[i * 2, "n_touchdowns"] = get_total_tds(league, home_lineup)
-
-            for slot in ["QB", "RB", "WR", "TE", "RB/WR/TE", "D/ST", "K"]:
-                df_week.loc[  # type: ignore
-                    i * 2, "{}_pts".format(slot.replace("/", "_"))
-                ] = avg_slot_score(league, home_lineup, slot=slot)
-
-                # Get the best player for each slot
-                top_players = get_top_players(home_lineup, slot, 1)
-                if not top_players:
-                    # If no player for this position is rostered
-                    df_week.loc[i * 2, "best_{}".format(slot.replace("/", "_"))] = 0
-                else:
-                    df_week.loc[  # type: ignore
-                        i * 2, "best_{}".format(slot.replace("/", "_"))
-                    ] = top_players[0].points
-                try:
-                    df_week.loc[  # type: ignore
-                        i * 2, "worst_{}".format(slot.replace("/", "_"))
-                    ] = np.min(
-                        [
-                            player.points
-                            for player in get_top_players(home_lineup, slot, 10)
-                            if player.slot_position not in ("BE", "IR")
-                        ]
-                    )
-                except Exception:
-                    df_week.loc[i * 2, "worst_{}".format(slot.replace("/", "_"))] = 0
-
-            # Add observation for away team
-            df_week.loc[i * 2 + 1, "year"] = year
-            df_week.loc[i * 2 + 1, "week"] = week + 1
-            df_week.loc[i * 2 + 1, "location"] = "AWAY"
-            df_week.loc[i * 2 + 1, "team_owner"] = matchup.away_team.owner
-            df_week.loc[i * 2 + 1, "team_name"] = matchup.away_team.team_name
-            df_week.loc[i * 2 + 1, "team_division"] = matchup.away_team.division_name
-            df_week.loc[i * 2 + 1, "team_score"] = matchup.away_score
-            df_week.loc[i * 2 + 1, "opp_owner"] = matchup.home_team.owner
-            df_week.loc[i * 2 + 1, "opp_name"] = matchup.home_team.team_name
-            df_week.loc[i * 2 + 1, "opp_division"] = matchup.home_team.division_name
-            df_week.loc[i * 2 + 1, "opp_score"] = matchup.home_score
-            df_week.loc[i * 2 + 1, "is_regular_season"] = (
-                week < league.settings.reg_season_count
-            )
-            df_week.loc[i * 2 + 1, "is_playoff"] = is_playoff_game(
-                league, matchup, week + 1
-            )
 
-            away_lineup = matchup.away_lineup
-            df_week.loc[i * 2 + 1, "weekly_finish"] = get_weekly_finish(
-                league, matchup.away_team, week + 1
-            )
-            df_week.loc[i * 2 + 1, "lineup_efficiency"] = get_lineup_efficiency(
-                league, away_lineup
-            )
-            df_week.loc[i * 2 + 1, "best_trio"] = get_best_trio(league, away_lineup)
-            df_week.loc[i * 2 + 1, "bench_points"] = sum_bench_points(
-                league, away_lineup
-            )
-            df_week.loc[i * 2 + 1, "team_projection_beat"] = get_score_surprise(
-                league, away_lineup
-            )
-            df_week.loc[i * 2 + 1, "n_bye"] = get_num_bye(league, away_lineup)
-            df_week.loc[i * 2 + 1, "n_inactive"] = get_num_inactive(league, away_lineup)
-            df_week.loc[i * 2 + 1, "n_touchdowns"] = get_total_tds(league, away_lineup)
-
-            for slot in ["QB", "RB", "WR", "TE", "RB/WR/TE", "D/ST", "K"]:
-                df_week.loc[  # type: ignore
-                    i * 2 + 1, "{}_pts".format(slot.replace("/", "_"))
-                ] = avg_slot_score(league, away_lineup, slot=slot)
-
-                # Get the best player for each slot
-                top_players = get_top_players(away_lineup, slot, 1)
-                if not top_players:
-                    # If no player for this position is rostered
-                    df_week.loc[i * 2 + 1, "best_{}".format(slot.replace("/", "_"))] = 0
-                else:
-                    df_week.loc[  # type: ignore
-                        i * 2 + 1, "best_{}".format(slot.replace("/", "_"))
-                    ] = top_players[0].points
-            #                 df_week.loc[i*2+1, 'worst_{}'.format(slot.replace('/', '_'))] = np.min([player.points for player in get_top_players(home_lineup, slot, 10) if player.slot_position not in ('BE', 'IR')])
-
-            #         df_week.loc[i*2, 'team_record'] = "{}-{}-{}".format(matchup.home_team.wins, matchup.home_team.losses, matchup.home_team.ties)
-            #         df_week.loc[i*2, 'team_season_points_for'] = matchup.home_team.points_for
-            #         df_week.loc[i*2, 'team_season_standing'] = matchup.home_team.standing
-            #         df_week.loc[i*2, 'team_season_streak'] = "{}-{}".format(matchup.home_team.streak_type, matchup.home_team.streak_length)
-            #         df_week.loc[i*2, 'team_projected'] = matchup.home_projected
-
-        # Concatenate week's data
-        df_week["special_teams_pts"] = df_week["D_ST_pts"] + df_week["K_pts"]
-        df = pd.concat([df, df_week])
+def get_week_stats(
+    league: League, box_scores: List[BoxScore], week: int
+) -> List[Dict[str, Any]]:
+    """Get the stats of every team that played in a week (see `get_matchup_stats()`).
+
+    Args:
+        league (League): League object
+        box_scores (List[BoxScore]): Box scores of the week
+        week (int): Week
+
+    Returns:
+        List[Dict[str, Any]]: Stats of each team, home team first in each matchup
+    """
+    rows = []
+    for matchup in box_scores:
+        # Skip byes
+        if (type(matchup.home_team) != Team) or (type(matchup.away_team) != Team):
+            continue
+
+        # Add observations for the home and away teams
+        rows.append(get_matchup_stats(league, matchup, week, home=True))
+        rows.append(get_matchup_stats(league, matchup, week, home=False))
+    return rows
+
+
+def add_matchup_stats_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the calculated fields (outcomes, season records, etc.) to the stats of a season.
+
+    Args:
+        df (pd.DataFrame): Stats of each team in each week of a season (see `get_matchup_stats()`)
+
+    Returns:
+        pd.DataFrame: Historical stats dataframe
+    """
+    df["special_teams_pts"] = df["D_ST_pts"] + df["K_pts"]
 
     # Calculated fields
     df["score_dif"] = df["team_score"] - df["opp_score"]
@@ -385,6 +416,58 @@ def get_stats_by_matchup(
     return df
 
 
+def get_streaks(
+    df: pd.DataFrame, last_games: Optional[pd.DataFrame] = None
+) -> pd.Series:
+    """Get the win (positive) or losing (negative) streak of each team after each game.
+
+    A streak counts the consecutive wins or losses of a team within a season.
+    A tie is a streak of 0 and ends the previous streak; a tie in a team's first
+    game of a season counts as a streak of -1.
+
+    Args:
+        df (pd.DataFrame): Historical stats, sorted by `STREAK_GROUPS` and week
+        last_games (Optional[pd.DataFrame]): `STREAK_GROUPS`, `score_dif` and `streak` of the
+            last game before `df` of each team, to continue their streaks. Defaults to None.
+
+    Returns:
+        pd.Series: Streak after each game, aligned with `df`
+    """
+    sign = np.sign(df.score_dif)
+    is_first_game = ~df.duplicated(STREAK_GROUPS)
+
+    # A run of results starts at each team's first game, and whenever the result changes
+    is_new_run = is_first_game | (sign != sign.shift())
+    run_id = is_new_run.cumsum()
+    run_length = df.groupby(run_id).cumcount() + 1
+
+    if last_games is None:
+        is_continued = pd.Series(False, index=df.index)
+        offset = pd.Series(0, index=df.index)
+    else:
+        # Runs that repeat the result of the team's last game continue its streak
+        last_game = df[STREAK_GROUPS].merge(
+            last_games[STREAK_GROUPS + ["score_dif", "streak"]],
+            how="left",
+            on=STREAK_GROUPS,
+        )
+        last_game.index = df.index
+        is_continued = last_game.streak.notna()
+        offset = (
+            last_game.streak.abs()
+            .where(is_first_game & (sign == np.sign(last_game.score_dif)), 0)
+            .groupby(run_id)
+            .transform("first")
+        )
+
+    streaks = sign * (run_length + offset)
+
+    # A tie in the first game of a season counts as a loss
+    streaks[is_first_game & ~is_continued & (sign == 0)] = -1
+
+    return streaks.astype("int64")
+
+
 def append_streaks(df: pd.DataFrame) -> pd.DataFrame:
     """Add the win streak for a team to the Historical stats dataframe
 
@@ -394,44 +477,67 @@ def append_streaks(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Historical stats with `streaks` column appended
     """
-    df = df.sort_values(["team_owner", "year", "week"])
+    df = df.sort_values(STREAK_GROUPS + ["week"])
+    df["streak"] = get_streaks(df)
+    return df
 
-    streaks = [1 if df.score_dif.tolist()[0] > 0 else -1]
-    for i in range(1, len(df)):
-        # New team: did the team win or lose their first game? (ties handled at the end)
-        if df.team_owner.tolist()[i] != df.team_owner.tolist()[i - 1]:
-            streaks.append(1 if df.score_dif.tolist()[i] > 0 else -1)
 
-        # COMMENT OUT IF YOU WANT WIN STREAKS TO ROLL INTO THE NEXT SEASON
-        # New year
-        elif df.year.tolist()[i] != df.year.tolist()[i - 1]:
-            streaks.append(1 if df.score_dif.tolist()[i] > 0 else -1)
+def extend_streaks(df_prev: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
+    """Add the win streak for a team to new weeks of the Historical stats dataframe,
+    continuing the streaks of the weeks that already have them.
 
-        # Begin new streak: won this week, lost/tie last week
-        elif (df.score_dif.tolist()[i] > 0) and (df.score_dif.tolist()[i - 1] <= 0):
-            streaks.append(1)
+    Args:
+        df_prev (pd.DataFrame): Historical stats with a `streak` column
+        df_new (pd.DataFrame): Historical stats of the weeks after `df_prev`
 
-        # Add to win streak: won this week, won last week
-        elif df.score_dif.tolist()[i] > 0:
-            streaks.append(streaks[-1] + 1)
+    Returns:
+        pd.DataFrame: `df_new` with `streaks` column appended
+    """
+    last_games = (
+        df_prev.sort_values(STREAK_GROUPS + ["week"]).groupby(STREAK_GROUPS).tail(1)
+    )
 
-        # Begin losing streak: lost this week, won/tie last week
-        elif (df.score_dif.tolist()[i] < 0) and (df.score_dif.tolist()[i - 1] >= 0):
-            streaks.append(-1)
+    df_new = df_new.sort_values(STREAK_GROUPS + ["week"])
+    df_new["streak"] = get_streaks(df_new, last_games)
+    return df_new
 
-        # Add to losing streak: lost this week, lost last week
-        elif df.score_dif.tolist()[i] < 0:
-            streaks.append(streaks[-1] - 1)
 
-        # Tie
-        elif df.score_dif.tolist()[i] == 0:
-            streaks.append(0)
+def scrape_season_stats(
+    league_id: int, year: int, swid: Optional[str], espn_s2: Optional[str]
+) -> pd.DataFrame:
+    """Generate a table with weekly matchup statistics for every owner and every week of one year.
 
-        else:
-            streaks.append("error")  # type: ignore
+    Args:
+        league_id (int): League ID
+        year (int): Year of the league
+        swid (str): ESPN SWID credential
+        espn_s2 (str): ESPN_S2 credential
+
+    Returns:
+        pd.DataFrame: Weekly historical stats for the given year
+    """
+    league = fetch_league(league_id=league_id, year=year, swid=swid, espn_s2=espn_s2)
+
+    if year < 2019:
+        # BoxScore information is not available for years prior to 2019
+        # Build the data from Team information
+        df_year = get_stats_by_week(league_id, year, swid, espn_s2, league=league)
+        df_year["box_score_available"] = False
+    else:
+        # Build the data from BoxScore information
+        df_year = get_stats_by_matchup(league=league)
+        df_year["box_score_available"] = True
+
+    # Properly cast boolean columns to bool
+    bool_cols = {
+        col: bool for col in df_year.columns[df_year.columns.str.contains("is_")]
+    }
+    return df_year.astype(bool_cols)
 
-    df["streak"] = streaks
-    return df
+
+def get_season_checkpoint_path(checkpoint_dir: str, league_id: int, year: int) -> str:
+    """Get the path where `scrape_team_stats()` saves the stats of one year."""
+    return os.path.join(checkpoint_dir, f"{league_id}_{year}.csv")
 
 
 def scrape_team_stats(
@@ -441,9 +547,17 @@ def scrape_team_stats(
     swid: str,
     espn_s2: str,
     df_prev: Optional[pd.DataFrame] = None,
+    checkpoint_dir: Optional[str] = None,
 ) -> pd.DataFrame:
     """Generate a table with weekly matchup statistics for every owner and every week over multiple years.
 
+    Years are built concurrently, up to MAX_CONCURRENT_SEASONS at a time. Each year
+    is saved to the checkpoint directory as soon as it is built, and years that
+    were already saved are loaded instead of fetched, so a failed run can be
+    resumed without fetching the years that succeeded again. If no checkpoint
+    directory is given, SEASON_CHECKPOINT_DIR is used and its files are removed
+    once every year has been built.
+
     Args:
         league_id (int): League ID
         start_year (int): Oldest year to get data from
@@ -451,58 +565,142 @@ def scrape_team_stats(
         swid (str): ESPN SWID credential
         espn_s2 (str): ESPN_S2 credential
         df_prev (pd.DataFrame, optional): Historical stats dataframe to append to. Defaults to None.
+        checkpoint_dir (str, optional): Directory to save the stats of each year to. Defaults to None (SEASON_CHECKPOINT_DIR).
 
     Returns:
         pandas dataframe: Weekly historical stats for the given league
+
+    Raises:
+        RuntimeError: If any year could not be built (the other years stay saved)
     """
     if df_prev is None:
         df = pd.DataFrame()
     else:
         df = df_prev
 
-    # Fetch data for each year and append it to the dataframe
-    for year in range(start_year, end_year + 1):
-        print("\n[BUILDING LEAGUE] Fetching historical stats for {}...".format(year))
-        if year < 2019:
-            # BoxScore information is not available for years prior to 2019
-            # Build the data from Team information
-            df_year = get_stats_by_week(league_id, year, swid, espn_s2)
-            df_year["box_score_available"] = False
+    years = list(range(start_year, end_year + 1))
+    keep_checkpoints = checkpoint_dir is not None
+    if checkpoint_dir is None:
+        checkpoint_dir = SEASON_CHECKPOINT_DIR
+    os.makedirs(checkpoint_dir, exist_ok=True)
+
+    n_built = 0
+    progress_lock = threading.Lock()
+
+    def build_season(year: int) -> pd.DataFrame:
+        nonlocal n_built
+        checkpoint_path = get_season_checkpoint_path(checkpoint_dir, league_id, year)
+
+        if os.path.exists(checkpoint_path):
+            print(
+                "\n[BUILDING LEAGUE] Loading historical stats for {} from {}...".format(
+                    year, checkpoint_path
+                )
+            )
+            df_year = pd.read_csv(checkpoint_path)
         else:
-            # Build the data from BoxScore information
-            df_year = get_stats_by_matchup(
-                league_id=league_id, year=year, swid=swid, espn_s2=espn_s2
+            print(
+                "\n[BUILDING LEAGUE] Fetching historical stats for {}...".format(year)
             )
-            df_year["box_score_available"] = True
+            df_year = scrape_season_stats(league_id, year, swid, espn_s2)
+            df_year.to_csv(checkpoint_path, index=False)
+
+        with progress_lock:
+            n_built += 1
+            print(
+                "[BUILDING LEAGUE] Built historical stats for {} ({}/{} years)".format(
+                    year, n_built, len(years)
+                )
+            )
+        return df_year
+
+    # Build the data for each year
+    results = fetch_concurrently(
+        build_season,
+        years,
+        return_exceptions=True,
+        max_workers=MAX_CONCURRENT_SEASONS,
+    )
 
-        # Properly cast boolean columns to bool
-        bool_cols = {
-            col: bool for col in df_year.columns[df_year.columns.str.contains("is_")]
-        }
-        df_year = df_year.astype(bool_cols)
+    failed = {}
+    for year, df_year in zip(years, results):
+        if isinstance(df_year, Exception):
+            logger.error(
+                f"Could not build historical stats for {league_id} ({year}): {df_year}"
+            )
+            failed[year] = df_year
+            continue
 
-        # Concatenate week's data
+        # Concatenate year's data
         df = pd.concat([df, df_year])
 
-    # Get adjusted score
-    # The score multiplier is defined as the median score of the league in a given year
-    # divided by the median score of the league in the most recent completed year.
-    year_multiplier_map = (
-        df[df.is_meaningful_game][["year", "team_score"]]
-        .groupby("year")
-        .median()
-        .team_score
-        / df[(df.is_meaningful_game) & (df.year == end_year)].team_score.median()
-    ).to_dict()
+    if failed:
+        raise RuntimeError(
+            f"Could not build historical stats for {league_id} in {sorted(failed)} "
+            f"(the other years are saved in {checkpoint_dir})"
+        ) from failed[min(failed)]
+
+    # Don't leave default checkpoints behind to be loaded by later runs
+    if not keep_checkpoints:
+        for year in years:
+            checkpoint_path = get_season_checkpoint_path(
+                checkpoint_dir, league_id, year
+            )
+            if os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
+
+    return add_history_fields(df, reference_year=end_year)
+
+
+def get_median_scores(df: pd.DataFrame) -> pd.Series:
+    """Get the median score of meaningful games in each year.
+
+    The medians are not stored; they are recomputed from the raw scores of every
+    year on each call (a single groupby over the historical stats).
+
+    Args:
+        df (pd.DataFrame): Historical stats dataframe
+
+    Returns:
+        pd.Series: Median score, indexed by year
+    """
+    return df[df.is_meaningful_game].groupby("year").team_score.median()
+
+
+def add_adjusted_scores(
+    df: pd.DataFrame, median_scores: pd.Series, reference_year: int
+) -> pd.DataFrame:
+    """Add scores adjusted for the scoring environment of each year.
+
+    The score multiplier of a year is the median score of the league in that year
+    divided by the median score of the league in the reference year.
+
+    Args:
+        df (pd.DataFrame): Historical stats dataframe
+        median_scores (pd.Series): Median score of each year (see `get_median_scores()`)
+        reference_year (int): Year whose scores are left unadjusted
+
+    Returns:
+        pd.DataFrame: Historical stats with `team_score_adj` and `opp_score_adj` columns
+    """
+    multipliers = df.year.map(median_scores / median_scores[reference_year])
+    df["team_score_adj"] = df.team_score / multipliers
+    df["opp_score_adj"] = df.opp_score / multipliers
+    return df
 
-    def get_adjusted_score(s):
-        return s.team_score / year_multiplier_map[s.year]
 
-    def get_opp_adjusted_score(s):
-        return s.opp_score / year_multiplier_map[s.year]
+def add_history_fields(df: pd.DataFrame, reference_year: int) -> pd.DataFrame:
+    """Add the fields that span seasons (adjusted scores, win streaks) to the historical stats.
 
-    df["team_score_adj"] = df.apply(get_adjusted_score, axis=1)
-    df["opp_score_adj"] = df.apply(get_opp_adjusted_score, axis=1)
+    Args:
+        df (pd.DataFrame): Historical stats dataframe
+        reference_year (int): Year whose scores are left unadjusted (the most recent year)
+
+    Returns:
+        pd.DataFrame: Historical stats dataframe
+    """
+    # Get adjusted score
+    df = add_adjusted_scores(df, get_median_scores(df), reference_year)
 
     # Correct capitalization of team owners
     df["team_owner"] = df.team_owner.str.title()
@@ -521,7 +719,11 @@ def update_current_season_stats(
     espn_s2: Optional[str] = None,
 ):
     """Update the current season of the historical stats dataframe.
-    Note: the entire season must be overwritten because the adjusted stats will change for all weeks.
+
+    Only the weeks since the last stored week (which may have been in progress
+    when it was stored) are fetched. The season records, the median score of
+    every year and the adjusted scores are then recalculated from the raw stats
+    of the dataframe; nothing besides the dataframe itself is stored.
 
     Args:
         league_id (int): the league id
@@ -546,9 +748,49 @@ def update_current_season_stats(
     # Keep data from previous seasons
     df_prev_season = df[df.year != cur_season]
 
+    # BoxScore information is not available for years prior to 2019
     # Re-build the dataframe for the current season
-    return scrape_team_stats(
-        league_id, cur_season, cur_season, swid, espn_s2, df_prev=df_prev_season
+    if cur_season < 2019:
+        return scrape_team_stats(
+            league_id, cur_season, cur_season, swid, espn_s2, df_prev=df_prev_season
+        )
+
+    # Keep the weeks of the current season before the last stored week
+    df_cur_season = df[df.year == cur_season]
+    last_week = df_cur_season.week.max().astype(int)
+    rows = RowBuilder(TEAM_STATS_DTYPES)
+    rows.extend(df_cur_season[df_cur_season.week < last_week].to_dict("records"))
+
+    # Fetch the box scores of the weeks since then
+    print(
+        "\n[BUILDING LEAGUE] Fetching historical stats for {} (weeks {}+)...".format(
+            cur_season, last_week
+        )
+    )
+    league = fetch_league(
+        league_id=league_id, year=cur_season, swid=swid, espn_s2=espn_s2
+    )
+    current_matchup_period = league.settings.week_to_matchup_period[league.current_week]
+    box_scores_by_week = get_box_scores_many(
+        league, range(last_week, current_matchup_period + 1)
+    )
+    for week, box_scores in box_scores_by_week.items():
+        rows.extend(get_week_stats(league, box_scores, week))
+
+    # Stored owners are already capitalized; match them before grouping by owner
+    df_year = rows.to_frame()
+    df_year["team_owner"] = df_year.team_owner.str.title()
+    df_year = add_matchup_stats_fields(df_year)
+    df_year["box_score_available"] = True
+
+    # Properly cast boolean columns to bool
+    bool_cols = {
+        col: bool for col in df_year.columns[df_year.columns.str.contains("is_")]
+    }
+    df_year = df_year.astype(bool_cols)
+
+    return add_history_fields(
+        pd.concat([df_prev_season, df_year]), reference_year=cur_season
     )
 
 
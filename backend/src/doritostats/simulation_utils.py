@@ -1,17 +1,85 @@
+import atexit
+import hashlib
 import logging
-from joblib import Parallel, delayed
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from backend.src.doritostats.analytic_utils import get_team
 from espn_api.football import League, Team, Matchup
 from backend.src.doritostats.PseudoMatchup import PseudoMatchup
 from backend.src.doritostats.PseudoTeam import PseudoTeam
+from backend.src.doritostats.score_models import NormalScoreModel, ScoreModel
 
 
 logger = logging.getLogger(__name__)
 
+# Columns of the standings arrays used by the vectorized simulation engine
+STANDINGS_COLUMNS = ["wins", "ties", "losses", "points_for", "points_against"]
+
+# Number of seasons that share one random stream. Simulation i always belongs to block
+# i // SIMULATION_BLOCK_SIZE, so results do not depend on the chunk size or number of workers.
+SIMULATION_BLOCK_SIZE = 250
+
+# Maximum number of seasons simulated at once (bounds the memory used by the engine)
+SIMULATION_CHUNK_SIZE = 1000
+
+# Number of seasons simulated between convergence checks in "anytime" mode
+ANYTIME_CHUNK_SIZE = 250
+
+# Worker processes shared by all simulations (see get_simulation_pool())
+SIMULATION_POOL = None  # type: Optional[ProcessPoolExecutor]
+SIMULATION_POOL_LOCK = threading.Lock()
+
+# Playoff status of a team (see get_playoff_status())
+PLAYOFF_CLINCHED = 1
+PLAYOFF_ALIVE = 0
+PLAYOFF_ELIMINATED = -1
+PLAYOFF_STATUS_LABELS = {
+    PLAYOFF_CLINCHED: "clinched",
+    PLAYOFF_ALIVE: "alive",
+    PLAYOFF_ELIMINATED: "eliminated",
+}
+
+# Maximum number of remaining matchups for which every outcome is enumerated (2^18 outcomes)
+MAX_ENUMERATED_MATCHUPS = 18
+
+# z-score of the confidence intervals reported for the playoff odds (95%)
+CONFIDENCE_Z = 1.96
+
+# Tiebreakers used to seed teams, in order, for each `playoff_seed_tie_rule`
+# (mirrors the hierarchies in fetch_utils.standings_weekly())
+TIEBREAKER_HIERARCHIES = {
+    "TOTAL_POINTS_SCORED": [
+        "win_pct",
+        "points_for",
+        "h2h_wins",
+        "division_record",
+        "points_against",
+        "coin_flip",
+    ],
+    "H2H_RECORD": [
+        "win_pct",
+        "h2h_wins",
+        "points_for",
+        "division_record",
+        "points_against",
+        "coin_flip",
+    ],
+    "INTRA_DIVISION_RECORD": [
+        "division_record",
+        "h2h_wins",
+        "win_pct",
+        "points_for",
+        "points_against",
+        "coin_flip",
+    ],
+}
+
 
 def sort_standings(
     standings: pd.DataFrame, tie_breaker_rule: Optional[str] = None
@@ -50,6 +118,7 @@ def build_standings(league: League) -> pd.DataFrame:
     standings["ties"] = [team.ties for team in league.teams]
     standings["losses"] = [team.losses for team in league.teams]
     standings["points_for"] = [team.points_for for team in league.teams]
+    standings["points_against"] = [team.points_against for team in league.teams]
     standings.set_index("team_id", inplace=True)
 
     return sort_standings(standings)
@@ -82,9 +151,472 @@ def build_standings_for_week(league: League, week: int) -> pd.DataFrame:
         sum([o == "L" for o in team.outcomes[:week]]) for team in standings_list
     ]
     standings["points_for"] = [sum(team.scores[:week]) for team in standings_list]
+    standings["points_against"] = [
+        sum([team.schedule[w].scores[w] for w in range(week)])
+        for team in standings_list
+    ]
     return standings.set_index("team_id")
 
 
+def get_score_params(league: League) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the parameters of the normal distribution used to generate each team's scores.
+    These are the same parameters used by `simulate_score()`:
+        mean = average score over the last 6 weeks
+        std = standard deviation over the entire season * 2
+
+    Args:
+        league (League): League
+
+    Returns:
+        np.ndarray: Mean score of each team (ordered like league.teams)
+        np.ndarray: Standard deviation of each team's score (ordered like league.teams)
+    """
+    score_model = NormalScoreModel().fit(league)
+    return score_model.score_mean, score_model.score_std
+
+
+def build_remaining_schedule(
+    league: League,
+    first_week_to_simulate: int,
+    matchups_to_exclude: Dict[int, List[PseudoMatchup]] = {},
+) -> np.ndarray:
+    """Encode the remaining regular season matchups as an array of team indices.
+    Each team is referred to by its position in `league.teams`.
+
+    Weeks with fewer matchups than the busiest week (byes, matchups in `matchups_to_exclude`)
+    are padded with -1.
+
+    Args:
+        league (League): League
+        first_week_to_simulate (int): First week to include in the schedule
+        matchups_to_exclude (Dict[int, List[PseudoMatchup]]): Matchups that already have an outcome. Defaults to {}.
+
+    Returns:
+        np.ndarray: Integer array of shape (n_weeks, n_matchups, 2) containing the (home, away) team indices
+    """
+    team_idx = {team.team_id: i for i, team in enumerate(league.teams)}
+
+    schedule = []
+    for week in range(first_week_to_simulate, league.settings.reg_season_count + 1):
+        week_matchups = set()
+        for team in league.teams:
+            (home_team, away_team) = sorted(
+                [team, team.schedule[week - 1]], key=lambda x: x.team_id
+            )
+
+            # Skip byes
+            if home_team.team_id == away_team.team_id:
+                continue
+
+            # Only add matchup if it the team doesn't already have an outcome for it
+            if PseudoMatchup(home_team, away_team) in matchups_to_exclude.get(week, []):
+                continue
+
+            week_matchups.add(
+                (team_idx[home_team.team_id], team_idx[away_team.team_id])
+            )
+        schedule.append(sorted(week_matchups))
+
+    n_matchups = max([len(week_matchups) for week_matchups in schedule] + [0])
+    schedule_arr = np.full((len(schedule), n_matchups, 2), -1, dtype=np.int64)
+    for i, week_matchups in enumerate(schedule):
+        if week_matchups:
+            schedule_arr[i, : len(week_matchups)] = week_matchups
+
+    return schedule_arr
+
+
+def get_head_to_head(league: League, week: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the head-to-head record between every pair of teams through a given week.
+    Ties count as half a win, like in the espn_api tiebreakers.
+
+    Args:
+        league (League): League
+        week (int): Last week to include in the records
+
+    Returns:
+        np.ndarray: h2h_wins[i, j] is the number of wins team i has against team j (ordered like league.teams)
+        np.ndarray: h2h_games[i, j] is the number of games played between team i and team j
+    """
+    team_idx = {team.team_id: i for i, team in enumerate(league.teams)}
+    h2h_wins = np.zeros((len(league.teams), len(league.teams)))
+    h2h_games = np.zeros((len(league.teams), len(league.teams)))
+    for i, team in enumerate(league.teams):
+        for opp, outcome in zip(team.schedule[:week], team.outcomes[:week]):
+            # Skip byes and unplayed games
+            if (opp.team_id == team.team_id) or (outcome not in ["W", "T", "L"]):
+                continue
+
+            j = team_idx[opp.team_id]
+            h2h_wins[i, j] += {"W": 1, "T": 0.5, "L": 0}[outcome]
+            h2h_games[i, j] += 1
+
+    return h2h_wins, h2h_games
+
+
+def count_head_to_head_games(schedule: np.ndarray, n_teams: int) -> np.ndarray:
+    """Count the number of games between every pair of teams in a schedule.
+
+    Args:
+        schedule (np.ndarray): Schedule from build_remaining_schedule()
+        n_teams (int): Number of teams in the league
+
+    Returns:
+        np.ndarray: h2h_games[i, j] is the number of games between team i and team j
+    """
+    matchups = schedule.reshape(-1, 2)
+    matchups = matchups[matchups[:, 0] >= 0]
+    h2h_games = np.zeros((n_teams, n_teams))
+    np.add.at(h2h_games, (matchups[:, 0], matchups[:, 1]), 1)
+    return h2h_games + h2h_games.T
+
+
+def simulate_seasons(
+    schedule: np.ndarray,
+    score_model: ScoreModel,
+    standings: np.ndarray,
+    h2h_wins: np.ndarray,
+    n: int,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate the remaining schedule n times at once.
+
+    All n x matchups scores are drawn in a single call to `score_model.sample()`, and the outcomes are
+    accumulated into an (n x teams) array for each standings column.
+
+    Args:
+        schedule (np.ndarray): Remaining schedule from build_remaining_schedule()
+        score_model (ScoreModel): Fitted model of each team's score
+        standings (np.ndarray): Current standings of shape (teams, 5) or (n, teams, 5), columns are STANDINGS_COLUMNS
+        h2h_wins (np.ndarray): Current head-to-head wins from get_head_to_head(), shape (teams, teams) or (n, teams, teams)
+        n (int): Number of seasons to simulate
+        rng (np.random.Generator): Random number generator
+
+    Returns:
+        np.ndarray: Simulated final standings of shape (n, teams, 5)
+        np.ndarray: Simulated final head-to-head wins of shape (n, teams, teams)
+    """
+    n_teams = standings.shape[-2]
+
+    # Flatten the schedule and drop the padding
+    matchups = schedule.reshape(-1, 2)
+    matchups = matchups[matchups[:, 0] >= 0]
+
+    # Simulate every score of every matchup in every season
+    scores = score_model.sample(np.broadcast_to(matchups, (n, len(matchups), 2)), rng)
+    home_score, away_score = scores[:, :, 0], scores[:, :, 1]
+    wins = np.stack([home_score > away_score, away_score > home_score], axis=-1)
+    ties = np.stack([home_score == away_score] * 2, axis=-1)
+    outcomes = np.stack(
+        [
+            wins,
+            ties,
+            np.stack([home_score < away_score, away_score < home_score], axis=-1),
+            scores,
+            scores[:, :, ::-1],  # Points against
+        ]
+    )
+
+    # Accumulate the outcomes for each (simulation, team) pair
+    sim_idx = np.arange(n)[:, None, None]
+    idx = (sim_idx * n_teams + matchups[None, :, :]).ravel()
+    results = np.stack(
+        [
+            np.bincount(idx, weights=outcome.ravel(), minlength=n * n_teams)
+            for outcome in outcomes
+        ],
+        axis=-1,
+    ).reshape(n, n_teams, len(STANDINGS_COLUMNS))
+
+    # Accumulate the head-to-head wins for each (simulation, team, opponent) triple
+    h2h_idx = (
+        sim_idx * n_teams * n_teams
+        + matchups[None, :, :] * n_teams
+        + matchups[None, :, ::-1]
+    ).ravel()
+    h2h_results = np.bincount(
+        h2h_idx, weights=(wins + ties / 2).ravel(), minlength=n * n_teams * n_teams
+    ).reshape(n, n_teams, n_teams)
+
+    return standings + results, h2h_wins + h2h_results
+
+
+def get_head_to_head_tiebreaker(
+    h2h_wins: np.ndarray, h2h_games: np.ndarray, tied: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of espn_api's sort_by_head_to_head().
+    Each team's tiebreaker value is its number of head-to-head wins against the teams it is tied with.
+    If more than two teams are tied and they have not all played each other the same number of times,
+    the tiebreaker is invalid and every tied team gets a value of 0.
+
+    Args:
+        h2h_wins (np.ndarray): Head-to-head wins of shape (n, teams, teams)
+        h2h_games (np.ndarray): Head-to-head games of shape (teams, teams)
+        tied (np.ndarray): Boolean array of shape (n, teams, teams) indicating which teams are tied (including with themselves)
+
+    Returns:
+        np.ndarray: Head-to-head tiebreaker value of shape (n, teams)
+    """
+    opponents = tied & ~np.eye(tied.shape[-1], dtype=bool)
+    group_size = tied.sum(axis=-1)
+    tied_h2h_wins = (h2h_wins * opponents).sum(axis=-1)
+
+    # Check if all tied teams have played each other an equal number of times
+    min_games = np.where(opponents, h2h_games, np.inf).min(axis=-1)
+    max_games = np.where(opponents, h2h_games, -np.inf).max(axis=-1)
+    group_min_games = np.where(tied, min_games[:, None, :], np.inf).min(axis=-1)
+    group_max_games = np.where(tied, max_games[:, None, :], -np.inf).max(axis=-1)
+    is_valid = (group_size <= 2) | (group_min_games == group_max_games)
+
+    return np.where(is_valid, tied_h2h_wins, 0)
+
+
+def get_tiebreaker_keys(
+    tiebreakers: Dict[str, np.ndarray],
+    h2h_wins: np.ndarray,
+    h2h_games: np.ndarray,
+    tiebreaker_hierarchy: List[str],
+    peers: np.ndarray,
+) -> List[np.ndarray]:
+    """Vectorized version of espn_api's sort_team_data_list().
+    Get the value of each tiebreaker in the hierarchy for each team. Higher values are better.
+
+    The head-to-head tiebreaker is only evaluated against teams that are still tied after the
+    previous tiebreakers and that are in the same group of teams being sorted (`peers`).
+
+    Args:
+        tiebreakers (Dict[str, np.ndarray]): Value of each (non-H2H) tiebreaker, each of shape (n, teams)
+        h2h_wins (np.ndarray): Head-to-head wins of shape (n, teams, teams)
+        h2h_games (np.ndarray): Head-to-head games of shape (teams, teams)
+        tiebreaker_hierarchy (List[str]): Tiebreakers to apply, in order
+        peers (np.ndarray): Boolean array of shape (n, teams, teams) indicating which teams are sorted together
+
+    Returns:
+        List[np.ndarray]: Value of each tiebreaker (in hierarchy order), each of shape (n, teams)
+    """
+    keys = []
+    tied = peers.copy()
+    for tiebreaker in tiebreaker_hierarchy:
+        if tiebreaker == "h2h_wins":
+            key = get_head_to_head_tiebreaker(h2h_wins, h2h_games, tied)
+        else:
+            key = tiebreakers[tiebreaker]
+        keys.append(key)
+        tied &= key[:, :, None] == key[:, None, :]
+
+    return keys
+
+
+def resolve_seeding(
+    standings: np.ndarray,
+    h2h_wins: np.ndarray,
+    h2h_games: np.ndarray,
+    division_ids: np.ndarray,
+    tie_breaker_rule: str,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Rank the teams in every simulated season at once, following the same rules as fetch_utils.standings_weekly():
+        1. Division winners are seeded first, then the rest of the league
+        2. Within each group, teams are sorted by the tiebreaker hierarchy of the league's `playoff_seed_tie_rule`
+
+    Args:
+        standings (np.ndarray): Simulated standings from simulate_seasons(), shape (n, teams, 5)
+        h2h_wins (np.ndarray): Head-to-head wins from simulate_seasons(), shape (n, teams, teams)
+        h2h_games (np.ndarray): Head-to-head games played, shape (teams, teams)
+        division_ids (np.ndarray): Division ID of each team, shape (teams,)
+        tie_breaker_rule (str): league.settings.playoff_seed_tie_rule
+        rng (np.random.Generator): Random number generator used for coin flips
+
+    Raises:
+        ValueError: If the tiebreaker rule is unknown
+
+    Returns:
+        np.ndarray: Final rank (1 = first seed) of each team in each season, shape (n, teams)
+    """
+    if tie_breaker_rule not in TIEBREAKER_HIERARCHIES:
+        raise ValueError(
+            "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED', 'H2H_RECORD', or 'INTRA_DIVISION_RECORD'"
+        )
+    tiebreaker_hierarchy = TIEBREAKER_HIERARCHIES[tie_breaker_rule]
+
+    n, n_teams, _ = standings.shape
+    wins, ties, losses, points_for, points_against = np.moveaxis(standings, -1, 0)
+
+    # Calculate each team's tiebreakers
+    same_division = division_ids[:, None] == division_ids[None, :]
+    tiebreakers = {
+        "win_pct": (wins + ties / 2) / np.maximum(wins + ties + losses, 1),
+        "points_for": points_for,
+        "points_against": points_against,
+        "division_record": (h2h_wins * same_division).sum(axis=-1)
+        / np.maximum((h2h_games * same_division).sum(axis=-1), 1),
+        "coin_flip": rng.random((n, n_teams)),
+    }
+
+    def get_positions(keys: List[np.ndarray]) -> np.ndarray:
+        """Sort each season by the keys (descending, first key is the primary key) and return each team's position"""
+        order = np.lexsort([-key for key in keys[::-1]], axis=-1)
+        positions = np.empty((n, n_teams), dtype=np.int64)
+        np.put_along_axis(
+            positions, order, np.broadcast_to(np.arange(n_teams), (n, n_teams)), -1
+        )
+        return positions
+
+    # First assign the division winners
+    division_keys = get_tiebreaker_keys(
+        tiebreakers,
+        h2h_wins,
+        h2h_games,
+        tiebreaker_hierarchy,
+        np.broadcast_to(same_division, (n, n_teams, n_teams)),
+    )
+    division_positions = get_positions(division_keys)
+    is_division_winner = np.zeros((n, n_teams), dtype=bool)
+    for division_id in np.unique(division_ids):
+        division_winner = np.where(
+            division_ids == division_id, division_positions, n_teams
+        ).argmin(axis=-1)
+        is_division_winner[np.arange(n), division_winner] = True
+
+    # Sort the division winners, then sort the rest of the teams
+    seeding_keys = get_tiebreaker_keys(
+        tiebreakers,
+        h2h_wins,
+        h2h_games,
+        tiebreaker_hierarchy,
+        is_division_winner[:, :, None] == is_division_winner[:, None, :],
+    )
+    return get_positions([is_division_winner.astype(float)] + seeding_keys) + 1
+
+
+def get_playoff_bounds(
+    win_totals: np.ndarray, division_ids: np.ndarray, playoff_team_count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Determine which teams make the playoffs in the worst and best case for each set of final win totals.
+
+    Seeding ties are resolved against (worst case) or in favor of (best case) each team,
+    so the results hold no matter how the points scored or head-to-head tiebreakers play out.
+    Division winners are seeded ahead of all other teams (see resolve_seeding()).
+
+    Args:
+        win_totals (np.ndarray): Final win totals (ties count as half a win), shape (n, teams)
+        division_ids (np.ndarray): Division of each team
+        playoff_team_count (int): Number of playoff teams
+
+    Returns:
+        np.ndarray: made_playoffs_worst[i, t] is True if team t makes the playoffs even if every tie is broken against them
+        np.ndarray: made_playoffs_best[i, t] is True if team t makes the playoffs if every tie is broken in their favor
+    """
+    n_teams = win_totals.shape[1]
+    divisions = np.unique(division_ids)
+    wild_cards = playoff_team_count - len(divisions)
+
+    made_playoffs_worst = np.zeros(win_totals.shape, dtype=bool)
+    made_playoffs_best = np.zeros(win_totals.shape, dtype=bool)
+    for t in range(n_teams):
+        team_wins = win_totals[:, t : t + 1]
+        rivals = np.arange(n_teams) != t
+        division_rivals = rivals & (division_ids == division_ids[t])
+
+        # Count the teams that finish ahead of this team in the wild card race
+        # (every division's winner is someone else, unless this team wins its division)
+        n_ahead_worst = np.zeros(len(win_totals), dtype=np.int64)
+        n_ahead_best = np.zeros(len(win_totals), dtype=np.int64)
+        for division_id in divisions:
+            n_tied_or_ahead = (
+                win_totals[:, rivals & (division_ids == division_id)] >= team_wins
+            ).sum(axis=1)
+            n_ahead = (
+                win_totals[:, rivals & (division_ids == division_id)] > team_wins
+            ).sum(axis=1)
+            n_ahead_worst += n_tied_or_ahead - (n_tied_or_ahead > 0)
+            n_ahead_best += n_ahead - (n_ahead > 0)
+
+        made_playoffs_worst[:, t] = (win_totals[:, division_rivals] < team_wins).all(
+            axis=1
+        ) | (n_ahead_worst < wild_cards)
+        made_playoffs_best[:, t] = (win_totals[:, division_rivals] <= team_wins).all(
+            axis=1
+        ) | (n_ahead_best < wild_cards)
+
+    return made_playoffs_worst, made_playoffs_best
+
+
+def get_playoff_status(
+    schedule: np.ndarray,
+    standings: np.ndarray,
+    division_ids: np.ndarray,
+    playoff_team_count: int,
+    tie_breaker_rule: str,
+) -> np.ndarray:
+    """Determine which teams have clinched a playoff spot, have been eliminated, or are still alive.
+
+    If there are at most MAX_ENUMERATED_MATCHUPS remaining matchups, every combination of
+    winners is enumerated and the result is exact. Otherwise, each team is checked against its
+    most extreme scenarios (win out while everyone else loses out, and vice versa), which only
+    detects the clearer cases.
+
+    Ties in the remaining matchups are not considered. Teams are never marked as decided
+    for tiebreaker rules that do not rank teams by record first (INTRA_DIVISION_RECORD).
+
+    Args:
+        schedule (np.ndarray): Remaining schedule from build_remaining_schedule()
+        standings (np.ndarray): Current standings of shape (teams, 5), columns are STANDINGS_COLUMNS
+        division_ids (np.ndarray): Division of each team
+        playoff_team_count (int): Number of playoff teams
+        tie_breaker_rule (str): The league's `playoff_seed_tie_rule`
+
+    Returns:
+        np.ndarray: PLAYOFF_CLINCHED, PLAYOFF_ELIMINATED, or PLAYOFF_ALIVE for each team
+    """
+    n_teams = len(standings)
+    status = np.full(n_teams, PLAYOFF_ALIVE)
+    if TIEBREAKER_HIERARCHIES.get(tie_breaker_rule, [None])[0] != "win_pct":
+        return status
+
+    # Flatten the schedule and drop the padding
+    matchups = schedule.reshape(-1, 2)
+    matchups = matchups[matchups[:, 0] >= 0]
+    current_wins = standings[:, 0] + standings[:, 1] / 2
+
+    if len(matchups) <= MAX_ENUMERATED_MATCHUPS:
+        # Enumerate every combination of winners (in batches to bound the memory used)
+        home_team = np.eye(n_teams)[matchups[:, 0]]
+        away_team = np.eye(n_teams)[matchups[:, 1]]
+        clinched = np.ones(n_teams, dtype=bool)
+        eliminated = np.ones(n_teams, dtype=bool)
+        for start in range(0, 2 ** len(matchups), 2**16):
+            outcome = np.arange(start, min(start + 2**16, 2 ** len(matchups)))
+            home_wins = (outcome[:, None] >> np.arange(len(matchups))) & 1
+            win_totals = (
+                current_wins + home_wins @ home_team + (1 - home_wins) @ away_team
+            )
+            made_playoffs_worst, made_playoffs_best = get_playoff_bounds(
+                win_totals, division_ids, playoff_team_count
+            )
+            clinched &= made_playoffs_worst.all(axis=0)
+            eliminated &= ~made_playoffs_best.any(axis=0)
+    else:
+        # Check each team's worst case (lose out, everyone else wins out) and best case
+        remaining_games = np.bincount(matchups.ravel(), minlength=n_teams)
+        worst_case = np.where(
+            np.eye(n_teams, dtype=bool), current_wins, current_wins + remaining_games
+        )
+        best_case = np.where(
+            np.eye(n_teams, dtype=bool), current_wins + remaining_games, current_wins
+        )
+        clinched = np.diag(
+            get_playoff_bounds(worst_case, division_ids, playoff_team_count)[0]
+        )
+        eliminated = ~np.diag(
+            get_playoff_bounds(best_case, division_ids, playoff_team_count)[1]
+        )
+
+    status[clinched] = PLAYOFF_CLINCHED
+    status[eliminated] = PLAYOFF_ELIMINATED
+    return status
+
+
 def simulate_score(team: Team) -> float:
     """Generate a team score.
     The score is randomly selected from a normal distribution defined by:
@@ -319,52 +851,162 @@ def input_outcomes(
     return standings, matchups_to_exclude
 
 
-def get_playoff_odds_df(final_standings: pd.DataFrame) -> pd.DataFrame:
-    """This function accepts a dataframe of simulated final standings (pd.concat of simulate_season())
-    and uses it to calculate the odds of making the playoffs for each team.
+class SimulationAccumulator:
+    """Fixed-size counters that summarize any number of simulated seasons.
+
+    Memory usage is O(teams^2) regardless of how many seasons are added.
+    Teams are ordered like league.teams.
+    """
+
+    def __init__(self, division_ids: np.ndarray, playoff_team_count: int):
+        self.division_ids = np.asarray(division_ids)
+        self.playoff_team_count = playoff_team_count
+        n_teams = len(self.division_ids)
+
+        self.n = 0
+        self.standings_sum = np.zeros((n_teams, len(STANDINGS_COLUMNS)))
+        self.playoff_counts = np.zeros(n_teams, dtype=np.int64)
+        self.rank_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+        self.first_in_division_counts = np.zeros(n_teams, dtype=np.int64)
+        self.last_in_division_counts = np.zeros(n_teams, dtype=np.int64)
+
+        # Teams whose playoff fate is already decided (see get_playoff_status())
+        self.playoff_status = np.full(n_teams, PLAYOFF_ALIVE)
+
+    def __repr__(self):
+        return f"SimulationAccumulator(n={self.n})"
+
+    def update(self, simulated_standings: np.ndarray, final_rank: np.ndarray) -> None:
+        """Add a batch of simulated seasons to the counters.
+
+        Args:
+            simulated_standings (np.ndarray): Simulated standings from simulate_seasons(), shape (n, teams, 5)
+            final_rank (np.ndarray): Final ranks from resolve_seeding(), shape (n, teams)
+        """
+        n, n_teams = final_rank.shape
+
+        self.n += n
+        self.standings_sum += simulated_standings.sum(axis=0)
+        self.playoff_counts += (final_rank <= self.playoff_team_count).sum(axis=0)
+        self.rank_counts += np.bincount(
+            (np.arange(n_teams)[None, :] * n_teams + final_rank - 1).ravel(),
+            minlength=n_teams * n_teams,
+        ).reshape(n_teams, n_teams)
+
+        for division_id in np.unique(self.division_ids):
+            in_division = self.division_ids == division_id
+            division_ranks = final_rank[:, in_division]
+            self.first_in_division_counts[in_division] += (
+                division_ranks == division_ranks.min(axis=-1, keepdims=True)
+            ).sum(axis=0)
+            self.last_in_division_counts[in_division] += (
+                division_ranks == division_ranks.max(axis=-1, keepdims=True)
+            ).sum(axis=0)
+
+    def merge(self, other: "SimulationAccumulator") -> "SimulationAccumulator":
+        """Add the counters of another accumulator (for the same league) to this one.
+
+        Args:
+            other (SimulationAccumulator): Accumulator to merge in
+
+        Returns:
+            SimulationAccumulator: self
+        """
+        self.n += other.n
+        self.standings_sum += other.standings_sum
+        self.playoff_counts += other.playoff_counts
+        self.rank_counts += other.rank_counts
+        self.first_in_division_counts += other.first_in_division_counts
+        self.last_in_division_counts += other.last_in_division_counts
+        return self
+
+    @property
+    def standings_mean(self) -> np.ndarray:
+        """Average simulated standings of each team, columns are STANDINGS_COLUMNS"""
+        return self.standings_sum / max(self.n, 1)
+
+    @property
+    def playoff_odds(self) -> np.ndarray:
+        """Fraction of simulations in which each team made the playoffs"""
+        return self.playoff_counts / max(self.n, 1)
+
+    def playoff_odds_interval(
+        self, z: float = CONFIDENCE_Z
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Wilson score interval of each team's playoff odds.
+        Unlike the normal approximation, the interval does not collapse to a single point
+        when a team made (or missed) the playoffs in every simulation.
+        It only does so for teams that have clinched a playoff spot or have been eliminated.
+
+        Args:
+            z (float, optional): z-score of the interval. Defaults to CONFIDENCE_Z (95%).
+
+        Returns:
+            np.ndarray: Lower bound of each team's playoff odds (fraction)
+            np.ndarray: Upper bound of each team's playoff odds (fraction)
+        """
+        if self.n == 0:
+            lower, upper = np.zeros(len(self.playoff_counts)), np.ones(
+                len(self.playoff_counts)
+            )
+        else:
+            p = self.playoff_odds
+            denominator = 1 + z**2 / self.n
+            center = (p + z**2 / (2 * self.n)) / denominator
+            half_width = (
+                z * np.sqrt(p * (1 - p) / self.n + z**2 / (4 * self.n**2)) / denominator
+            )
+            lower = np.clip(center - half_width, 0, 1)
+            upper = np.clip(center + half_width, 0, 1)
+
+        # The odds of decided teams are known exactly
+        lower[self.playoff_status == PLAYOFF_CLINCHED] = 1
+        upper[self.playoff_status == PLAYOFF_ELIMINATED] = 0
+        return lower, upper
+
+    def is_converged(self, tolerance: float) -> bool:
+        """Check if every team's playoff odds are known within +/- `tolerance` percentage points.
+
+        Args:
+            tolerance (float): Maximum half-width of the confidence intervals, in percentage points
+
+        Returns:
+            bool: True if all confidence intervals are narrow enough
+        """
+        if self.n == 0:
+            return False
+
+        # Teams that have clinched or been eliminated have intervals of width 0
+        lower, upper = self.playoff_odds_interval()
+        return bool(((upper - lower) / 2 * 100 <= tolerance).all())
+
+
+def get_playoff_odds_df(
+    accumulator: SimulationAccumulator, league: League
+) -> pd.DataFrame:
+    """This function uses the counters of a SimulationAccumulator
+    to calculate the odds of making the playoffs for each team.
 
     Args:
-        final_standings (pd.DataFrame): Dataframe of simulated final standings
+        accumulator (SimulationAccumulator): Counters of the simulated seasons
+        league (League): League
 
     Returns:
         pd.DataFrame: Dataframe containing the playoff odds for each team
     """
-    # Extract the number of simulations in the dataframe
-    n = final_standings.groupby(["team_name", "team_id"]).count().max().max()
-
-    # Initialize a dictionary to keep track of how many times each team made the playoffs
-    playoff_count = {
-        team_id: {
-            "wins": 0,
-            "ties": 0,
-            "losses": 0,
-            "points_for": 0,
-            "playoff_odds": 0,
-        }
-        for team_id in final_standings.index.unique().values
-    }
-
-    # Record those who made the playoffs in the simulated season
-    for team_id, stats in final_standings.iterrows():
-        playoff_count[team_id]["wins"] += stats["wins"]
-        playoff_count[team_id]["ties"] += stats["ties"]
-        playoff_count[team_id]["losses"] += stats["losses"]
-        playoff_count[team_id]["points_for"] += stats["points_for"]
-        playoff_count[team_id]["playoff_odds"] += stats["made_playoffs"]
-
-    # Aggregate playoff odds
-    playoff_odds = (
-        pd.DataFrame.from_dict(data=playoff_count)
-        .T.reset_index()
-        .rename(columns={"index": "team_id"})
+    playoff_odds = pd.DataFrame(
+        accumulator.standings_mean[:, :4], columns=STANDINGS_COLUMNS[:4]
     )
-    playoff_odds["playoff_odds"] *= 100 / n
-
-    # Get average wins and losses
-    playoff_odds["wins"] /= n
-    playoff_odds["ties"] /= n
-    playoff_odds["losses"] /= n
-    playoff_odds["points_for"] /= n
+    playoff_odds.insert(0, "team_id", [team.team_id for team in league.teams])
+    playoff_odds.insert(1, "team_owner", [team.owner for team in league.teams])
+    playoff_odds.insert(2, "team_name", [team.team_name for team in league.teams])
+    playoff_odds["playoff_odds"] = accumulator.playoff_odds * 100
+    playoff_odds_lower, playoff_odds_upper = accumulator.playoff_odds_interval()
+    playoff_odds["playoff_odds_lower"] = playoff_odds_lower * 100
+    playoff_odds["playoff_odds_upper"] = playoff_odds_upper * 100
+    playoff_odds["playoff_status"] = [
+        PLAYOFF_STATUS_LABELS[status] for status in accumulator.playoff_status
+    ]
 
     # Round estimates
     playoff_odds["wins"] = playoff_odds["wins"].round(decimals=1)
@@ -374,49 +1016,38 @@ def get_playoff_odds_df(final_standings: pd.DataFrame) -> pd.DataFrame:
     return playoff_odds.sort_values(by="playoff_odds", ascending=False)
 
 
-def get_rank_distribution_df(final_standings: pd.DataFrame) -> pd.DataFrame:
-    """This function accepts a dataframe of simulated final standings (pd.concat of simulate_season())
-    and uses it to calculate the distribution of final ranks for each team.
+def get_rank_distribution_df(
+    accumulator: SimulationAccumulator, league: League
+) -> pd.DataFrame:
+    """This function uses the counters of a SimulationAccumulator
+    to calculate the distribution of final ranks for each team.
 
     The dataframe will tell you the percentage of times each team finished in each position.
 
     Args:
-        final_standings (pd.DataFrame): Dataframe of simulated final standings
+        accumulator (SimulationAccumulator): Counters of the simulated seasons
+        league (League): League
 
     Returns:
         pd.DataFrame: Dataframe containing the distribution of final ranks for each team
     """
-    # Extract the number of simulations in the dataframe
-    n = final_standings.groupby(["team_name", "team_id"]).count().max().max()
-
-    # Get the number of times each team finished in each final_rank
-    rank_dist_df = (
-        final_standings.groupby(["team_name", "team_id", "final_rank"])
-        .size()
-        .reset_index()
-        .pivot(index=["team_name", "team_id"], columns="final_rank", values=0)
-        .fillna(0)
-        .astype(int)
+    ranks = list(range(1, len(league.teams) + 1))
+    rank_dist_df = pd.DataFrame(
+        accumulator.rank_counts / max(accumulator.n, 1) * 100, columns=ranks
     )
+    rank_dist_df.insert(0, "team_name", [team.team_name for team in league.teams])
+    rank_dist_df.insert(1, "team_id", [team.team_id for team in league.teams])
+    rank_dist_df["playoff_odds"] = accumulator.playoff_odds * 100
+    rank_dist_df["team_owner"] = [team.owner for team in league.teams]
 
-    # Normalize the values to be percentages
-    rank_dist_df /= n / 100
-
-    # Calculate the playoff odds for each team and join it to the dataframe
-    rank_dist_df = rank_dist_df.join(
-        final_standings.groupby(["team_name", "team_id"])
-        .mean(numeric_only=True)["made_playoffs"]
-        .rename("playoff_odds")
-        * 100
-    )
-
-    ranks = list(final_standings["final_rank"].unique())
     return rank_dist_df.sort_values(ranks + ["playoff_odds"], ascending=False)
 
 
-def get_seeding_outcomes_df(final_standings: pd.DataFrame) -> pd.DataFrame:
-    """This function accepts a dataframe of simulated final standings (pd.concat of simulate_season())
-    and uses it to calculate the odds of different seeding outcomes for each team.
+def get_seeding_outcomes_df(
+    accumulator: SimulationAccumulator, league: League
+) -> pd.DataFrame:
+    """This function uses the counters of a SimulationAccumulator
+    to calculate the odds of different seeding outcomes for each team.
 
     The dataframe will tell you the percentage of times each team finished:
         * First place in the league
@@ -426,50 +1057,26 @@ def get_seeding_outcomes_df(final_standings: pd.DataFrame) -> pd.DataFrame:
         * Last place in the league
 
     Args:
-        final_standings (pd.DataFrame): Dataframe of simulated final standings
+        accumulator (SimulationAccumulator): Counters of the simulated seasons
+        league (League): League
 
     Returns:
         pd.DataFrame: Dataframe containing the distribution of seeding outcomes for each team
     """
-    # Extract the number of simulations in the dataframe
-    n = final_standings.groupby(["team_name", "team_id"]).count().max().max()
-
-    # Add a column to indicate the iteration number
-    final_standings["iteration"] = final_standings.groupby("team_owner").cumcount() + 1
-
-    # Add columns to indicate seeding outcomes
-    final_standings["rank_in_division"] = final_standings.groupby(
-        ["division_id", "iteration"]
-    )["final_rank"].rank()
-    final_standings["first_in_league"] = (final_standings["final_rank"] == 1).astype(
-        int
-    )
-    final_standings["first_in_division"] = (
-        final_standings["rank_in_division"] == 1
-    ).astype(int)
-    final_standings["last_in_division"] = (
-        final_standings["rank_in_division"] == final_standings["rank_in_division"].max()
-    ).astype(
-        int
-    )  # Assumes all divisions have the same number of teams
-    final_standings["last_in_league"] = (
-        final_standings["final_rank"] == final_standings["final_rank"].max()
-    ).astype(int)
-
-    # Aggregate final_standings to indicate how many times each team won the division
-    final_standings_agg = (
-        final_standings.groupby(["team_owner", "team_name"]).agg(
-            first_in_league=("first_in_league", "sum"),
-            first_in_division=("first_in_division", "sum"),
-            make_playoffs=("made_playoffs", "sum"),
-            last_in_division=("last_in_division", "sum"),
-            last_in_league=("last_in_league", "sum"),
-        )
-        / n
-        * 100
+    n = max(accumulator.n, 1)
+    seeding_outcomes = pd.DataFrame(
+        {
+            "team_owner": [team.owner for team in league.teams],
+            "team_name": [team.team_name for team in league.teams],
+            "first_in_league": accumulator.rank_counts[:, 0] / n * 100,
+            "first_in_division": accumulator.first_in_division_counts / n * 100,
+            "make_playoffs": accumulator.playoff_counts / n * 100,
+            "last_in_division": accumulator.last_in_division_counts / n * 100,
+            "last_in_league": accumulator.rank_counts[:, -1] / n * 100,
+        }
     )
 
-    return final_standings_agg.sort_values(
+    return seeding_outcomes.sort_values(
         by=[
             "make_playoffs",
             "first_in_league",
@@ -481,37 +1088,259 @@ def get_seeding_outcomes_df(final_standings: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def simulate_season(
+class SimulationInputs:
+    """Compact encoding of everything the engine needs to simulate the rest of a season.
+
+    Only NumPy arrays and scalars are stored (no espn_api objects), so the inputs are small
+    and cheap to send to worker processes. Teams are ordered like league.teams.
+    """
+
+    def __init__(
+        self,
+        schedule: np.ndarray,
+        score_model: ScoreModel,
+        standings: np.ndarray,
+        h2h_wins: np.ndarray,
+        h2h_games: np.ndarray,
+        division_ids: np.ndarray,
+        playoff_team_count: int,
+        playoff_seed_tie_rule: str,
+    ):
+        self.schedule = schedule
+        self.score_model = score_model
+        self.standings = standings
+        self.h2h_wins = h2h_wins
+        self.h2h_games = h2h_games
+        self.division_ids = division_ids
+        self.playoff_team_count = playoff_team_count
+        self.playoff_seed_tie_rule = playoff_seed_tie_rule
+
+    def __repr__(self):
+        return f"SimulationInputs(teams={len(self.division_ids)}, weeks={len(self.schedule)})"
+
+    def get_state_hash(self) -> str:
+        """Hash of the league state (results so far, remaining schedule, score model, and seeding settings).
+
+        Returns:
+            str: Hex digest
+        """
+        digest = hashlib.sha256()
+        for array in [
+            self.schedule,
+            self.standings,
+            self.h2h_wins,
+            self.h2h_games,
+            self.division_ids,
+        ]:
+            digest.update(str(array.shape).encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(
+            f"{self.playoff_team_count}_{self.playoff_seed_tie_rule}".encode()
+        )
+
+        # Include the fitted parameters of the score model
+        digest.update(type(self.score_model).__name__.encode())
+        for name, value in sorted(vars(self.score_model).items()):
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        return digest.hexdigest()
+
+
+def build_simulation_inputs(
+    league: League,
+    standings: pd.DataFrame,
+    first_week_to_simulate: int,
+    matchups_to_exclude: Dict[int, List[PseudoMatchup]] = {},
+    score_model: Optional[ScoreModel] = None,
+) -> SimulationInputs:
+    """Encode a league as the arrays used by the simulation engine.
+
+    Args:
+        league (League): League
+        standings (pd.DataFrame): Standings dataframe (indexed by team_id) before `first_week_to_simulate`
+        first_week_to_simulate (int): First week to simulate
+        matchups_to_exclude (Dict[int, List[PseudoMatchup]]): Matchups that already have an outcome. Defaults to {}.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores.
+            Defaults to a NormalScoreModel fit on the weeks before `first_week_to_simulate`.
+
+    Returns:
+        SimulationInputs: Inputs of the simulation engine
+    """
+    team_ids = [team.team_id for team in league.teams]
+    schedule = build_remaining_schedule(
+        league, first_week_to_simulate, matchups_to_exclude
+    )
+    if score_model is None:
+        score_model = NormalScoreModel().fit(league, week=first_week_to_simulate - 1)
+    h2h_wins, h2h_games = get_head_to_head(league, week=first_week_to_simulate - 1)
+    h2h_games += count_head_to_head_games(schedule, len(team_ids))
+
+    return SimulationInputs(
+        schedule=schedule,
+        score_model=score_model,
+        standings=standings.loc[team_ids, STANDINGS_COLUMNS].to_numpy().astype(float),
+        h2h_wins=h2h_wins,
+        h2h_games=h2h_games,
+        division_ids=np.array([team.division_id for team in league.teams]),
+        playoff_team_count=league.settings.playoff_team_count,
+        playoff_seed_tie_rule=league.settings.playoff_seed_tie_rule,
+    )
+
+
+def simulate_chunk(
+    inputs: SimulationInputs, n: int, rng: np.random.Generator
+) -> SimulationAccumulator:
+    """Simulate and seed n seasons, and aggregate them into a SimulationAccumulator.
+
+    Args:
+        inputs (SimulationInputs): Inputs from build_simulation_inputs()
+        n (int): Number of seasons to simulate
+        rng (np.random.Generator): Random number generator
+
+    Returns:
+        SimulationAccumulator: Counters of the simulated seasons
+    """
+    simulated_standings, simulated_h2h_wins = simulate_seasons(
+        inputs.schedule,
+        inputs.score_model,
+        inputs.standings,
+        inputs.h2h_wins,
+        n,
+        rng,
+    )
+    final_rank = resolve_seeding(
+        simulated_standings,
+        simulated_h2h_wins,
+        inputs.h2h_games,
+        inputs.division_ids,
+        inputs.playoff_seed_tie_rule,
+        rng,
+    )
+    accumulator = SimulationAccumulator(inputs.division_ids, inputs.playoff_team_count)
+    accumulator.update(simulated_standings, final_rank)
+    return accumulator
+
+
+def get_block_rng(random_state: Optional[int], block: int) -> np.random.Generator:
+    """Get the random number generator of one block of SIMULATION_BLOCK_SIZE simulations.
+
+    Block i is seeded with the i-th child of SeedSequence(random_state) (the same seed
+    SeedSequence.spawn() would give it), so every block has an independent stream that only
+    depends on `random_state` and the block's position.
+
+    Args:
+        random_state (Optional[int]): Random seed of the whole run
+        block (int): Position of the block
+
+    Returns:
+        np.random.Generator: Random number generator
+    """
+    return np.random.default_rng(
+        np.random.SeedSequence(random_state, spawn_key=(block,))
+    )
+
+
+def simulate_blocks(
+    inputs: SimulationInputs, start: int, n: int, random_state: Optional[int]
+) -> List[SimulationAccumulator]:
+    """Simulate seasons `start` to `start + n` of a run, one block at a time.
+
+    The counters of each block are returned separately. Merging them in order gives
+    bit-identical results no matter how a run is split into calls to this function.
+
+    Args:
+        inputs (SimulationInputs): Inputs from build_simulation_inputs()
+        start (int): Position of the first season (a multiple of SIMULATION_BLOCK_SIZE)
+        n (int): Number of seasons to simulate
+        random_state (Optional[int]): Random seed of the whole run
+
+    Returns:
+        List[SimulationAccumulator]: Counters of each block of simulated seasons
+    """
+    return [
+        simulate_chunk(
+            inputs,
+            min(SIMULATION_BLOCK_SIZE, start + n - block_start),
+            get_block_rng(random_state, block_start // SIMULATION_BLOCK_SIZE),
+        )
+        for block_start in range(start, start + n, SIMULATION_BLOCK_SIZE)
+    ]
+
+
+def simulate_blocks_from_payload(
+    payload: bytes, start: int, n: int, random_state: Optional[int]
+) -> List[SimulationAccumulator]:
+    """Worker entry point of simulate_blocks(). The inputs are pickled once by the caller
+    and only the (small) counters are sent back.
+
+    Args:
+        payload (bytes): Pickled SimulationInputs
+        start (int): Position of the first season (a multiple of SIMULATION_BLOCK_SIZE)
+        n (int): Number of seasons to simulate
+        random_state (Optional[int]): Random seed of the whole run
+
+    Returns:
+        List[SimulationAccumulator]: Counters of each block of simulated seasons
+    """
+    return simulate_blocks(pickle.loads(payload), start, n, random_state)
+
+
+def get_simulation_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the process pool shared by all simulations in this process.
+    The pool is created on first use (with `max_workers` workers) and reused afterwards,
+    so concurrent requests share a fixed number of workers instead of each forking their own.
+
+    Args:
+        max_workers (int): Number of worker processes, if the pool has not been created yet
+
+    Returns:
+        ProcessPoolExecutor: Shared process pool
+    """
+    global SIMULATION_POOL
+    with SIMULATION_POOL_LOCK:
+        if SIMULATION_POOL is None:
+            logger.info(f"Starting simulation pool with {max_workers} workers")
+            SIMULATION_POOL = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(shutdown_simulation_pool)
+    return SIMULATION_POOL
+
+
+def shutdown_simulation_pool() -> None:
+    """Shut down the shared simulation pool (it will be re-created on next use)."""
+    global SIMULATION_POOL
+    with SIMULATION_POOL_LOCK:
+        if SIMULATION_POOL is not None:
+            SIMULATION_POOL.shutdown()
+            SIMULATION_POOL = None
+
+
+def prepare_simulation_inputs(
     league: League,
-    n: int = 1000,
     what_if: Optional[bool] = False,
     outcomes: Optional[List[int]] = None,
     first_week_to_simulate: Optional[int] = None,
-    random_state: Optional[int] = 42,
-) -> pd.DataFrame:
+    score_model: Optional[ScoreModel] = None,
+) -> SimulationInputs:
     """
-    This function simulates the rest of a season by running n Monte-Carlo simulations.
-    The `what_if` parameter allows the user to specify the outcomes of the current week (but not the scores) if desired
-    (this can be done to see the effect of an outcome on a team's playoff odds.)
+    This function builds the standings the simulations start from and encodes the league
+    as the inputs of the simulation engine.
+    The `what_if` parameter allows the user to specify the outcomes of the current week (but not the scores) if desired.
 
     Args:
         league (League): League
-        n (int): Number of Monte Carlo simulations to run
         what_if (Optional[bool]): Manually specify the outcomes of the current week? Defaults to False
         outcomes (List[int]): Outcomes passed in as an argument instead of user input. Defaults to None
         first_week_to_simulate (Optional[int]):
             - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
             - If None, the function will use `standings` to imply how many weeks have finished already and simulate the rest
-        random_state (Optional[int]): Random seed. Defaults to 42.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores.
+            Defaults to a NormalScoreModel fit on the weeks before `first_week_to_simulate`.
 
     Returns:
-        pd.DataFrame: Dataframe containing playoff odds for each team
-        pd.DataFrame: Dataframe containing distribution of final ranks for each team
-        pd.DataFrame: Dataframe containing distribution of seeding outcomes for each team
+        SimulationInputs: Inputs of the simulation engine
     """
-    # n = min(n, 2000)
-    np.random.seed(random_state)
-
     # Get current standings
     if first_week_to_simulate is None:
         standings = build_standings(league)
@@ -524,11 +1353,6 @@ def simulate_season(
             first_week_to_simulate = (
                 standings[["wins", "ties", "losses"]].sum(axis=1).iloc[0] + 1
             )
-            current_matchup_period = league.settings.week_to_matchup_period[
-                league.current_week
-            ]
-        else:
-            current_matchup_period = first_week_to_simulate
 
         standings, matchups_to_exclude = input_outcomes(
             league=league,
@@ -539,84 +1363,269 @@ def simulate_season(
     else:
         matchups_to_exclude = {}
 
-    if first_week_to_simulate is not None:
-        print(
-            f"""Simulating from week {first_week_to_simulate} to {league.settings.reg_season_count}"""
-        )
-    else:
-        print(
-            f"""Simulating from week {standings[["wins", "ties", "losses"]].sum(axis=1).iloc[0] + 1} to {league.settings.reg_season_count}"""
+    if first_week_to_simulate is None:
+        first_week_to_simulate = int(
+            standings[["wins", "ties", "losses"]].sum(axis=1).min() + 1
         )
+    print(
+        f"""Simulating from week {first_week_to_simulate} to {league.settings.reg_season_count}"""
+    )
 
-    def simulate_single_season_parallel():
-        return simulate_single_season(
-            league=league,
-            standings=standings.copy(),
-            first_week_to_simulate=first_week_to_simulate,
-            matchups_to_exclude=matchups_to_exclude,
-        )
+    # Encode the league as arrays (ordered like league.teams)
+    return build_simulation_inputs(
+        league, standings, first_week_to_simulate, matchups_to_exclude, score_model
+    )
+
+
+def run_simulations_from_inputs(
+    inputs: SimulationInputs,
+    n: int = 1000,
+    random_state: Optional[int] = 42,
+    tolerance: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+    n_jobs: int = 1,
+    accumulator: Optional[SimulationAccumulator] = None,
+) -> SimulationAccumulator:
+    """
+    This function runs up to n Monte-Carlo simulations of the rest of a season
+    and aggregates the results into a SimulationAccumulator.
+
+    Each block of SIMULATION_BLOCK_SIZE simulations has its own random stream (see get_block_rng()),
+    so the first n simulations are bit-identical for a given `random_state`, regardless of `chunk_size` and `n_jobs`.
 
-    def get_team_info(s):
-        """Using the team_id or team_owner, append other team info to the series"""
-        if "team_id" in s.index:
-            team = get_team(league, team_id=s.team_id)
-        elif "team_owner" in s.index:
-            team = get_team(league, team_owner=s.team_owner)
+    The simulations are run in chunks of `chunk_size` seasons. If `tolerance` or `time_budget` is set,
+    the function runs in "anytime" mode and stops early (after the current chunk) once either:
+        * every team's playoff odds are known within +/- `tolerance` percentage points, or
+        * `time_budget` seconds have elapsed.
+
+    Args:
+        inputs (SimulationInputs): Inputs from prepare_simulation_inputs()
+        n (int): Maximum number of Monte Carlo simulations to run (including those in `accumulator`)
+        random_state (Optional[int]): Random seed. Defaults to 42.
+        tolerance (Optional[float]): Stop once all playoff odds are within +/- this many percentage points. Defaults to None.
+        time_budget (Optional[float]): Stop once this many seconds have elapsed. Defaults to None.
+        chunk_size (Optional[int]): Number of seasons to simulate at once (rounded up to a multiple of SIMULATION_BLOCK_SIZE).
+            Defaults to ANYTIME_CHUNK_SIZE in "anytime" mode, and SIMULATION_CHUNK_SIZE otherwise.
+        n_jobs (int): Number of chunks to simulate at once on the shared worker pool
+            (see get_simulation_pool()). Defaults to 1 (simulate in this process).
+        accumulator (Optional[SimulationAccumulator]): Counters of the first simulations of the same inputs and `random_state`.
+            The run continues from there (accumulator.n must be a multiple of SIMULATION_BLOCK_SIZE). Defaults to None.
+
+    Returns:
+        SimulationAccumulator: Counters of the simulated seasons (accumulator.n is the number of simulations run)
+    """
+    start_time = time.monotonic()
+    if chunk_size is None:
+        if (tolerance is None) and (time_budget is None):
+            chunk_size = SIMULATION_CHUNK_SIZE
         else:
-            raise Exception("Must have team_id or team_name in the series")
-        s["team_owner"] = team.owner
-        s["team_name"] = team.team_name
-        s["division_id"] = team.division_id
-        return s
-
-    # Store box_scores function and set to None so that the League object can be pickled
-    box_scores_func = league.box_scores
-    league.box_scores = None
-
-    try:
-        # Run the simulations in parallel
-        if n > 1:
-            final_standings = pd.concat(
-                Parallel(n_jobs=-1, verbose=1)(
-                    delayed(simulate_single_season_parallel)() for i in range(n)
-                )
+            chunk_size = ANYTIME_CHUNK_SIZE
+    chunk_size = -(-chunk_size // SIMULATION_BLOCK_SIZE) * SIMULATION_BLOCK_SIZE
+
+    # Continue from the previous simulations (without modifying them)
+    previous = accumulator
+    accumulator = SimulationAccumulator(inputs.division_ids, inputs.playoff_team_count)
+    if previous is not None:
+        if (previous.n < n) and (previous.n % SIMULATION_BLOCK_SIZE != 0):
+            raise ValueError(
+                f"Cannot continue from {previous.n} simulations (not a multiple of {SIMULATION_BLOCK_SIZE})."
             )
+        accumulator.merge(previous)
+
+    # Find the teams that have clinched or been eliminated (their odds are known exactly,
+    # so "anytime" runs stop as soon as the remaining teams' odds are precise enough)
+    accumulator.playoff_status = get_playoff_status(
+        inputs.schedule,
+        inputs.standings,
+        inputs.division_ids,
+        inputs.playoff_team_count,
+        inputs.playoff_seed_tie_rule,
+    )
+
+    # Simulate in-process, or on the shared worker pool in waves of `n_jobs` chunks
+    if n_jobs > 1:
+        pool = get_simulation_pool(n_jobs)
+        payload = pickle.dumps(inputs, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Run the simulations in chunks and aggregate them as they finish
+    # (stopping early if the estimates have converged or time has run out)
+    while (accumulator.n < n) and not (
+        (tolerance is not None) and accumulator.is_converged(tolerance)
+    ):
+        if n_jobs > 1:
+            futures = [
+                pool.submit(
+                    simulate_blocks_from_payload,
+                    payload,
+                    start,
+                    min(chunk_size, n - start),
+                    random_state,
+                )
+                for start in range(
+                    accumulator.n,
+                    min(accumulator.n + n_jobs * chunk_size, n),
+                    chunk_size,
+                )
+            ]
+            blocks = [block for future in futures for block in future.result()]
         else:
-            final_standings = simulate_single_season(league, standings)
+            blocks = simulate_blocks(
+                inputs, accumulator.n, min(chunk_size, n - accumulator.n), random_state
+            )
 
-        final_standings = (
-            final_standings.reset_index()
-            .apply(get_team_info, axis=1)
-            .set_index("team_id")
-        )
-    except Exception as e:
-        raise e
-    finally:
-        # Restore the box_scores function
-        league.box_scores = box_scores_func
+        # Merge the blocks in order (so the floating point sums are reproducible)
+        for block in blocks:
+            accumulator.merge(block)
 
-    # Get the playoff odds for each team
-    playoff_odds = get_playoff_odds_df(final_standings)
+        if (time_budget is not None) and (time.monotonic() - start_time >= time_budget):
+            break
 
-    # Get the distribution of final positions for each team
-    rank_dist = get_rank_distribution_df(final_standings)
+    logger.info(
+        f"Ran {accumulator.n - (previous.n if previous else 0)} simulations in {time.monotonic() - start_time:.2f} seconds"
+    )
+    return accumulator
 
-    # Get the distribution of seeding outcomes for each team
-    seeding_outcomes = get_seeding_outcomes_df(final_standings)
 
-    # Append team info to the dataframes
-    playoff_odds = playoff_odds.apply(get_team_info, axis=1).drop(columns="division_id")
+def run_simulations(
+    league: League,
+    n: int = 1000,
+    what_if: Optional[bool] = False,
+    outcomes: Optional[List[int]] = None,
+    first_week_to_simulate: Optional[int] = None,
+    random_state: Optional[int] = 42,
+    tolerance: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+    score_model: Optional[ScoreModel] = None,
+    n_jobs: int = 1,
+) -> SimulationAccumulator:
+    """
+    This function simulates the rest of a season by running up to n Monte-Carlo simulations
+    and aggregates the results into a SimulationAccumulator.
+
+    See prepare_simulation_inputs() and run_simulations_from_inputs() for details.
 
-    rank_dist = (
-        rank_dist.reset_index().apply(get_team_info, axis=1).drop(columns="division_id")
-    )
+    Args:
+        league (League): League
+        n (int): Maximum number of Monte Carlo simulations to run
+        what_if (Optional[bool]): Manually specify the outcomes of the current week? Defaults to False
+        outcomes (List[int]): Outcomes passed in as an argument instead of user input. Defaults to None
+        first_week_to_simulate (Optional[int]):
+            - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+            - If None, the function will use `standings` to imply how many weeks have finished already and simulate the rest
+        random_state (Optional[int]): Random seed. Defaults to 42.
+        tolerance (Optional[float]): Stop once all playoff odds are within +/- this many percentage points. Defaults to None.
+        time_budget (Optional[float]): Stop once this many seconds have elapsed. Defaults to None.
+        chunk_size (Optional[int]): Number of seasons to simulate at once (rounded up to a multiple of SIMULATION_BLOCK_SIZE).
+            Defaults to ANYTIME_CHUNK_SIZE in "anytime" mode, and SIMULATION_CHUNK_SIZE otherwise.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores.
+            Defaults to a NormalScoreModel fit on the weeks before `first_week_to_simulate`.
+        n_jobs (int): Number of chunks to simulate at once on the shared worker pool
+            (see get_simulation_pool()). Defaults to 1 (simulate in this process).
 
-    seeding_outcomes = (
-        seeding_outcomes.reset_index()
-        .apply(get_team_info, axis=1)
-        .drop(columns="division_id")
+    Returns:
+        SimulationAccumulator: Counters of the simulated seasons (accumulator.n is the number of simulations run)
+    """
+    inputs = prepare_simulation_inputs(
+        league,
+        what_if=what_if,
+        outcomes=outcomes,
+        first_week_to_simulate=first_week_to_simulate,
+        score_model=score_model,
+    )
+    return run_simulations_from_inputs(
+        inputs,
+        n=n,
+        random_state=random_state,
+        tolerance=tolerance,
+        time_budget=time_budget,
+        chunk_size=chunk_size,
+        n_jobs=n_jobs,
     )
 
+
+class SimulationStore:
+    """Keeps the counters of past simulations in a cache (e.g. Django's cache), so they can be reused and topped up.
+
+    Entries are keyed by a hash of the simulation inputs (see SimulationInputs.get_state_hash()),
+    so any change to the league's results, remaining schedule, or score model leads to a new entry.
+    """
+
+    def __init__(
+        self, cache, timeout: Optional[int] = None, prefix: str = "simulations"
+    ):
+        self.cache = cache
+        self.timeout = timeout
+        self.prefix = prefix
+
+    def __repr__(self):
+        return f"SimulationStore(prefix={self.prefix!r}, timeout={self.timeout})"
+
+    def get_key(self, inputs: SimulationInputs, random_state: Optional[int]) -> str:
+        return f"{self.prefix}_{inputs.get_state_hash()}_{random_state}"
+
+    def run(
+        self,
+        inputs: SimulationInputs,
+        n: int = 1000,
+        random_state: int = 42,
+        **kwargs,
+    ) -> SimulationAccumulator:
+        """Get the counters of at least n simulations (or fewer, in "anytime" mode).
+        Only the simulations that are not stored yet are run, and the merged counters are stored.
+
+        Args:
+            inputs (SimulationInputs): Inputs from prepare_simulation_inputs()
+            n (int): Number of simulations. Defaults to 1000.
+            random_state (int): Random seed. Defaults to 42.
+            **kwargs: Other arguments of run_simulations_from_inputs()
+
+        Returns:
+            SimulationAccumulator: Counters of the simulated seasons
+        """
+        key = self.get_key(inputs, random_state)
+        stored = self.cache.get(key)
+
+        # Partial blocks cannot be continued
+        if (
+            (stored is not None)
+            and (stored.n < n)
+            and (stored.n % SIMULATION_BLOCK_SIZE)
+        ):
+            stored = None
+
+        accumulator = run_simulations_from_inputs(
+            inputs, n=n, random_state=random_state, accumulator=stored, **kwargs
+        )
+        if (stored is None) or (accumulator.n > stored.n):
+            self.cache.set(key, accumulator, self.timeout)
+        return accumulator
+
+
+def format_simulation_results(
+    accumulator: SimulationAccumulator, league: League
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Build the playoff odds, rank distribution, and seeding outcome dataframes from simulation counters.
+
+    Args:
+        accumulator (SimulationAccumulator): Counters from run_simulations()
+        league (League): League
+
+    Returns:
+        pd.DataFrame: Dataframe containing playoff odds for each team
+        pd.DataFrame: Dataframe containing distribution of final ranks for each team
+        pd.DataFrame: Dataframe containing distribution of seeding outcomes for each team
+    """
+    # Get the playoff odds for each team
+    playoff_odds = get_playoff_odds_df(accumulator, league)
+
+    # Get the distribution of final positions for each team
+    rank_dist = get_rank_distribution_df(accumulator, league)
+
+    # Get the distribution of seeding outcomes for each team
+    seeding_outcomes = get_seeding_outcomes_df(accumulator, league)
+
     return (
         playoff_odds[
             [
@@ -627,6 +1636,9 @@ def simulate_season(
                 "losses",
                 "points_for",
                 "playoff_odds",
+                "playoff_odds_lower",
+                "playoff_odds_upper",
+                "playoff_status",
             ]
         ],
         rank_dist,
@@ -634,6 +1646,56 @@ def simulate_season(
     )
 
 
+def simulate_season(
+    league: League,
+    n: int = 1000,
+    what_if: Optional[bool] = False,
+    outcomes: Optional[List[int]] = None,
+    first_week_to_simulate: Optional[int] = None,
+    random_state: Optional[int] = 42,
+    tolerance: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    score_model: Optional[ScoreModel] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    This function simulates the rest of a season by running n Monte-Carlo simulations.
+    The `what_if` parameter allows the user to specify the outcomes of the current week (but not the scores) if desired
+    (this can be done to see the effect of an outcome on a team's playoff odds.)
+
+    See run_simulations() for the "anytime" mode enabled by `tolerance` and `time_budget`.
+
+    Args:
+        league (League): League
+        n (int): Number of Monte Carlo simulations to run
+        what_if (Optional[bool]): Manually specify the outcomes of the current week? Defaults to False
+        outcomes (List[int]): Outcomes passed in as an argument instead of user input. Defaults to None
+        first_week_to_simulate (Optional[int]):
+            - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+            - If None, the function will use `standings` to imply how many weeks have finished already and simulate the rest
+        random_state (Optional[int]): Random seed. Defaults to 42.
+        tolerance (Optional[float]): Stop once all playoff odds are within +/- this many percentage points. Defaults to None.
+        time_budget (Optional[float]): Stop once this many seconds have elapsed. Defaults to None.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores. Defaults to None (NormalScoreModel).
+
+    Returns:
+        pd.DataFrame: Dataframe containing playoff odds for each team
+        pd.DataFrame: Dataframe containing distribution of final ranks for each team
+        pd.DataFrame: Dataframe containing distribution of seeding outcomes for each team
+    """
+    accumulator = run_simulations(
+        league,
+        n=n,
+        what_if=what_if,
+        outcomes=outcomes,
+        first_week_to_simulate=first_week_to_simulate,
+        random_state=random_state,
+        tolerance=tolerance,
+        time_budget=time_budget,
+        score_model=score_model,
+    )
+    return format_simulation_results(accumulator, league)
+
+
 def get_outcomes_if_team_wins(
     team: Team, week: int, matchups: List[Matchup]
 ) -> List[int]:
@@ -659,293 +1721,304 @@ def get_outcomes_if_team_wins(
     return outcomes
 
 
-def playoff_odds_swing(league: League, week: int, n: int = 100) -> pd.DataFrame:
+class SwingAccumulator:
+    """Fixed-size counters of simulated seasons, split by the outcome of each team's matchup in one week.
+
+    Row 0 of each counter holds the seasons in which the team won its matchup,
+    row 1 holds the seasons in which the team lost its matchup.
+    Teams are ordered like league.teams.
     """
-    This function determines how much a team's playoff odds will change based on if they win or lose their next matchup.
 
-    For each matchup, two simulations are run:
-        - one where the home team wins, and
-        - one where the away team wins
+    def __init__(self, n_teams: int, playoff_team_count: int):
+        self.playoff_team_count = playoff_team_count
+
+        self.n = 0
+        self.outcome_counts = np.zeros((2, n_teams), dtype=np.int64)
+        self.wins_sum = np.zeros((2, n_teams))
+        self.playoff_counts = np.zeros((2, n_teams), dtype=np.int64)
+        self.first_in_league_counts = np.zeros((2, n_teams), dtype=np.int64)
+        self.last_in_league_counts = np.zeros((2, n_teams), dtype=np.int64)
+
+    def __repr__(self):
+        return f"SwingAccumulator(n={self.n})"
+
+    def update(
+        self,
+        week_standings: np.ndarray,
+        simulated_standings: np.ndarray,
+        final_rank: np.ndarray,
+    ) -> None:
+        """Add a batch of simulated seasons to the counters.
+
+        Args:
+            week_standings (np.ndarray): Simulated results of the conditioning week only, shape (n, teams, 5)
+            simulated_standings (np.ndarray): Simulated final standings, shape (n, teams, 5)
+            final_rank (np.ndarray): Final ranks from resolve_seeding(), shape (n, teams)
+        """
+        n, n_teams = final_rank.shape
+        outcome = np.stack([week_standings[:, :, 0] == 1, week_standings[:, :, 2] == 1])
+
+        self.n += n
+        self.outcome_counts += outcome.sum(axis=1)
+        self.wins_sum += (outcome * simulated_standings[None, :, :, 0]).sum(axis=1)
+        self.playoff_counts += (
+            outcome & (final_rank <= self.playoff_team_count)[None]
+        ).sum(axis=1)
+        self.first_in_league_counts += (outcome & (final_rank == 1)[None]).sum(axis=1)
+        self.last_in_league_counts += (outcome & (final_rank == n_teams)[None]).sum(
+            axis=1
+        )
+
+    def merge(self, other: "SwingAccumulator") -> "SwingAccumulator":
+        """Add the counters of another accumulator (for the same league and week) to this one.
+
+        Args:
+            other (SwingAccumulator): Accumulator to merge in
+
+        Returns:
+            SwingAccumulator: self
+        """
+        self.n += other.n
+        self.outcome_counts += other.outcome_counts
+        self.wins_sum += other.wins_sum
+        self.playoff_counts += other.playoff_counts
+        self.first_in_league_counts += other.first_in_league_counts
+        self.last_in_league_counts += other.last_in_league_counts
+        return self
 
-        In each simulation, only the one matchup is pre-determined. All other matchups in that week are simulated.
+    def conditional_mean(self, counts: np.ndarray) -> np.ndarray:
+        """Average of a counter over the seasons in which each team won (row 0) or lost (row 1).
 
-        The difference between the home and away teams' playoff odds in the two simulations is called the "swing".
-            - If the simulated playoff odds for a team is 75% if they win and 50% if they lose, then the "swing" is 25%
+        Args:
+            counts (np.ndarray): One of the counters of this accumulator, shape (2, teams)
 
-    The playoff "swings" for each team is returned as a pandas Series where "team_owner" is the index.
+        Returns:
+            np.ndarray: Conditional averages, shape (2, teams)
+        """
+        return counts / np.maximum(self.outcome_counts, 1)
+
+
+def run_swing_simulations(
+    league: League,
+    week: int,
+    n: int = 1000,
+    random_state: Optional[int] = 42,
+    score_model: Optional[ScoreModel] = None,
+) -> SwingAccumulator:
+    """
+    This function simulates the season from `week` to the end of the regular season n times
+    and splits the simulated seasons by the outcome of each matchup in `week`.
+
+    Every matchup is evaluated on the same set of simulated seasons (common random numbers),
+    so the odds "if a team wins" and "if a team loses" come from a single Monte Carlo run,
+    instead of two runs per matchup.
 
     Args:
         league (League): League
-        week (int): First week to include in the simulation.
-            - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
-        n (int): Number of Monte Carlo simulations to run
+        week (int): Week whose matchups are used to split the simulations
+        n (int): Number of Monte Carlo simulations to run. Defaults to 1000.
+        random_state (Optional[int]): Random seed. Defaults to 42.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores.
+            Defaults to a NormalScoreModel fit on the weeks before `week`.
 
     Returns:
-        pd.DataFrame: Difference in playoff odds for each team if they win vs if they lose
+        SwingAccumulator: Counters of the simulated seasons, split by matchup outcome
     """
-    # Get all matchups for the week.
-    matchups = league.box_scores(week)
-
-    # Instantiate the series
-    odds_diff = pd.DataFrame(dtype=float)
+    start_time = time.monotonic()
+
+    # Encode the league as arrays (ordered like league.teams)
+    inputs = build_simulation_inputs(
+        league,
+        build_standings_for_week(league, week=week - 1),
+        week,
+        score_model=score_model,
+    )
 
-    # Simulate playoff odds based on outcome of each matchup
-    for matchup in matchups:
-        # Simulate season if home team wins
-        home_team = matchup.home_team
-        outcomes_home_win = get_outcomes_if_team_wins(home_team, week, matchups)
-        odds_home_win = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_home_win,
-            first_week_to_simulate=week,
-        )[0].set_index("team_owner")
-
-        # Simulate season if away team wins
-        away_team = matchup.away_team
-        outcomes_away_win = get_outcomes_if_team_wins(away_team, week, matchups)
-        odds_away_win = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_away_win,
-            first_week_to_simulate=week,
-        )[0].set_index("team_owner")
-
-        # Merge results
-        odds = pd.merge(
-            odds_home_win[["playoff_odds"]],
-            odds_away_win[["playoff_odds"]],
-            suffixes=("_if_home_win", "_if_away_win"),
-            left_index=True,
-            right_index=True,
-        )
-        odds["playoff_odds_if_win"], odds["playoff_odds_if_lose"] = (
-            odds.max(axis=1),
-            odds.min(axis=1),
+    accumulator = SwingAccumulator(len(inputs.division_ids), inputs.playoff_team_count)
+    while accumulator.n < n:
+        # Simulate one block at a time (see get_block_rng())
+        chunk_n = min(SIMULATION_BLOCK_SIZE, n - accumulator.n)
+        rng = get_block_rng(random_state, accumulator.n // SIMULATION_BLOCK_SIZE)
+
+        # Simulate the week of interest separately so its outcomes can be used to split the seasons
+        week_standings, week_h2h_wins = simulate_seasons(
+            inputs.schedule[:1],
+            inputs.score_model,
+            np.zeros_like(inputs.standings),
+            np.zeros_like(inputs.h2h_wins),
+            chunk_n,
+            rng,
         )
 
-        # Calculate difference in playoff odds
-        odds["swing"] = odds["playoff_odds_if_win"] - odds["playoff_odds_if_lose"]
-
-        odds_diff = pd.concat(
-            [
-                odds_diff,
-                odds[["playoff_odds_if_win", "playoff_odds_if_lose", "swing"]]
-                .abs()
-                .loc[[home_team.owner, away_team.owner]],
-            ]
+        # Simulate the rest of the season on top of each simulated week
+        simulated_standings, simulated_h2h_wins = simulate_seasons(
+            inputs.schedule[1:],
+            inputs.score_model,
+            inputs.standings + week_standings,
+            inputs.h2h_wins + week_h2h_wins,
+            chunk_n,
+            rng,
         )
+        final_rank = resolve_seeding(
+            simulated_standings,
+            simulated_h2h_wins,
+            inputs.h2h_games,
+            inputs.division_ids,
+            inputs.playoff_seed_tie_rule,
+            rng,
+        )
+        accumulator.update(week_standings, simulated_standings, final_rank)
 
-    return odds_diff
+    logger.info(
+        f"Ran {accumulator.n} swing simulations in {time.monotonic() - start_time:.2f} seconds"
+    )
+    return accumulator
 
 
-def first_place_odds_swing(league: League, week: int, n: int = 100) -> pd.DataFrame:
+def simulate_swings(
+    league: League,
+    week: int,
+    n: int = 1000,
+    random_state: Optional[int] = 42,
+    score_model: Optional[ScoreModel] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
-    This function determines how much a team's odds of finishing in first place will change based on if they win or lose their next matchup.
-
-    For each matchup, two simulations are run:
-        - one where the home team wins, and
-        - one where the away team wins
+    This function determines how much each team's playoff, first place, and last place odds
+    will change based on if they win or lose their matchup in `week`.
 
-        In each simulation, only the one matchup is pre-determined. All other matchups in that week are simulated.
+    The rest of the season is simulated once (see run_swing_simulations()), and every matchup is
+    evaluated by splitting the simulated seasons by its winner. All other matchups in that week are simulated.
 
-        The difference between the home and away teams' first place odds in the two simulations is called the "swing".
-            - If the simulated first place odds for a team is 75% if they win and 50% if they lose, then the "swing" is 25%
+    The difference between a team's odds if they win and if they lose is called the "swing".
+        - If the simulated playoff odds for a team is 75% if they win and 50% if they lose, then the "swing" is 25%
 
-    The first place "swings" for each team is returned as a pandas Series where "team_owner" is the index.
+    Each dataframe has "team_owner" as the index, with the two teams of each matchup in consecutive rows.
+    Teams on a bye are not included.
 
     Args:
         league (League): League
         week (int): First week to include in the simulation.
-            - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
-        n (int): Number of Monte Carlo simulations to run
+            - If week = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+        n (int): Number of Monte Carlo simulations to run. Defaults to 1000.
+        random_state (Optional[int]): Random seed. Defaults to 42.
+        score_model (Optional[ScoreModel]): Fitted model used to simulate scores. Defaults to None (NormalScoreModel).
 
     Returns:
-        pd.DataFrame: Difference in playoff odds for each team if they win vs if they lose
+        pd.DataFrame: Playoff odds (%) for each team if they win vs if they lose
+        pd.DataFrame: Expected win totals and first place odds (fraction) for each team if they win vs if they lose
+        pd.DataFrame: Last place odds (%) for each team if they win vs if they lose
     """
-    # Get all matchups for the week.
-    matchups = league.box_scores(week)
-
-    # Instantiate the series
-    seeding_outcomes_diff = pd.DataFrame(dtype=float)
-
-    # Simulate playoff odds based on outcome of each matchup
-    for matchup in matchups:
-        # Simulate season if home team wins
-        home_team = matchup.home_team
-        outcomes_home_win = get_outcomes_if_team_wins(home_team, week, matchups)
-        (playoff_odds_home_win, _, seeding_outcomes_home_win) = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_home_win,
-            first_week_to_simulate=week,
-        )
-
-        # Simulate season if away team wins
-        away_team = matchup.away_team
-        outcomes_away_win = get_outcomes_if_team_wins(away_team, week, matchups)
-        (playoff_odds_away_win, _, seeding_outcomes_away_win) = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_away_win,
-            first_week_to_simulate=week,
-        )
+    accumulator = run_swing_simulations(
+        league, week, n=n, random_state=random_state, score_model=score_model
+    )
 
-        # Merge team info into seeding outcomes
-        seeding_outcomes_home_win = pd.merge(
-            left=seeding_outcomes_home_win[["team_owner", "first_in_league"]],
-            right=playoff_odds_home_win[["team_owner", "wins"]],
-            on="team_owner",
-        ).set_index("team_owner")
-        seeding_outcomes_away_win = pd.merge(
-            left=seeding_outcomes_away_win[["team_owner", "first_in_league"]],
-            right=playoff_odds_away_win[["team_owner", "wins"]],
-            on="team_owner",
-        ).set_index("team_owner")
-
-        # Merge results
-        seeding_outcomes = pd.merge(
-            seeding_outcomes_home_win[["first_in_league", "wins"]],
-            seeding_outcomes_away_win[["first_in_league", "wins"]],
-            suffixes=("_if_home_win", "_if_away_win"),
-            left_index=True,
-            right_index=True,
-        )
+    # Order the teams by matchup
+    week_schedule = build_remaining_schedule(league, week)[0]
+    team_idx = [i for matchup in week_schedule for i in matchup if i >= 0]
+    index = pd.Index([league.teams[i].owner for i in team_idx], name="team_owner")
+
+    # Playoff odds
+    playoff_odds = accumulator.conditional_mean(accumulator.playoff_counts) * 100
+    playoff_odds_swing = pd.DataFrame(
+        {
+            "playoff_odds_if_win": playoff_odds[0, team_idx],
+            "playoff_odds_if_lose": playoff_odds[1, team_idx],
+        },
+        index=index,
+    )
+    playoff_odds_swing["swing"] = (
+        playoff_odds_swing["playoff_odds_if_win"]
+        - playoff_odds_swing["playoff_odds_if_lose"]
+    ).abs()
+
+    # Expected win totals and first place odds
+    expected_wins = accumulator.conditional_mean(accumulator.wins_sum)
+    first_in_league = accumulator.conditional_mean(accumulator.first_in_league_counts)
+    first_place_odds_swing = pd.DataFrame(
+        {
+            "expected_win_total_if_win": expected_wins[0, team_idx],
+            "expected_win_total_if_lose": expected_wins[1, team_idx],
+            "first_in_league_if_win": first_in_league[0, team_idx],
+            "first_in_league_if_lose": first_in_league[1, team_idx],
+        },
+        index=index,
+    )
+    first_place_odds_swing["swing"] = (
+        first_place_odds_swing["first_in_league_if_win"]
+        - first_place_odds_swing["first_in_league_if_lose"]
+    ).abs()
+
+    # Last place odds
+    last_in_league = (
+        accumulator.conditional_mean(accumulator.last_in_league_counts) * 100
+    )
+    sweater_odds_swing = pd.DataFrame(
+        {
+            "last_in_league_if_win": last_in_league[0, team_idx],
+            "last_in_league_if_lose": last_in_league[1, team_idx],
+        },
+        index=index,
+    )
+    sweater_odds_swing["swing"] = (
+        sweater_odds_swing["last_in_league_if_win"]
+        - sweater_odds_swing["last_in_league_if_lose"]
+    ).abs()
 
-        # Calculate first place odds and expected win totals
-        (
-            seeding_outcomes["first_in_league_if_win"],
-            seeding_outcomes["first_in_league_if_lose"],
-            seeding_outcomes["expected_win_total_if_win"],
-            seeding_outcomes["expected_win_total_if_lose"],
-        ) = (
-            seeding_outcomes[
-                ["first_in_league_if_home_win", "first_in_league_if_away_win"]
-            ].max(axis=1)
-            / 100,
-            seeding_outcomes[
-                ["first_in_league_if_home_win", "first_in_league_if_away_win"]
-            ].min(axis=1)
-            / 100,
-            seeding_outcomes[["wins_if_home_win", "wins_if_away_win"]].max(axis=1),
-            seeding_outcomes[["wins_if_home_win", "wins_if_away_win"]].min(axis=1),
-        )
+    return playoff_odds_swing, first_place_odds_swing, sweater_odds_swing
 
-        # Calculate difference in first place odds
-        seeding_outcomes["swing"] = (
-            seeding_outcomes["first_in_league_if_win"]
-            - seeding_outcomes["first_in_league_if_lose"]
-        )
 
-        seeding_outcomes_diff = pd.concat(
-            [
-                seeding_outcomes_diff,
-                seeding_outcomes[
-                    [
-                        "expected_win_total_if_win",
-                        "expected_win_total_if_lose",
-                        "first_in_league_if_win",
-                        "first_in_league_if_lose",
-                        "swing",
-                    ]
-                ]
-                .abs()
-                .loc[[home_team.owner, away_team.owner]],
-            ]
-        )
+def playoff_odds_swing(league: League, week: int, n: int = 1000) -> pd.DataFrame:
+    """
+    This function determines how much a team's playoff odds will change based on if they win or lose their next matchup.
 
-    return seeding_outcomes_diff
+    The playoff "swings" for each team is returned as a pandas DataFrame where "team_owner" is the index.
+    See simulate_swings() to compute the playoff, first place, and last place swings in one pass.
 
+    Args:
+        league (League): League
+        week (int): First week to include in the simulation.
+            - If week = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+        n (int): Number of Monte Carlo simulations to run
 
-def sweater_odds_swing(league: League, week: int, n: int = 100) -> pd.DataFrame:
+    Returns:
+        pd.DataFrame: Difference in playoff odds for each team if they win vs if they lose
     """
-    This function determines how much a team's odds of finishing in last place will change based on if they win or lose their next matchup.
-
-    For each matchup, two simulations are run:
-        - one where the home team wins, and
-        - one where the away team wins
+    return simulate_swings(league, week, n)[0]
 
-        In each simulation, only the one matchup is pre-determined. All other matchups in that week are simulated.
 
-        The difference between the home and away teams' last place odds in the two simulations is called the "swing".
-            - If the simulated last place odds for a team is 75% if they win and 50% if they lose, then the "swing" is 25%
+def first_place_odds_swing(league: League, week: int, n: int = 1000) -> pd.DataFrame:
+    """
+    This function determines how much a team's odds of finishing in first place will change based on if they win or lose their next matchup.
 
-    The last place "swings" for each team is returned as a pandas Series where "team_owner" is the index.
+    The first place "swings" for each team is returned as a pandas DataFrame where "team_owner" is the index.
+    See simulate_swings() to compute the playoff, first place, and last place swings in one pass.
 
     Args:
         league (League): League
         week (int): First week to include in the simulation.
-            - If first_week_to_simulate = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+            - If week = 10, the function will simulate all matchups from Weeks 10 -> end of season.
         n (int): Number of Monte Carlo simulations to run
 
     Returns:
-        pd.DataFrame: Difference in playoff odds for each team if they win vs if they lose
+        pd.DataFrame: Difference in first place odds for each team if they win vs if they lose
     """
-    # Get all matchups for the week.
-    matchups = league.box_scores(week)
+    return simulate_swings(league, week, n)[1]
 
-    # Instantiate the series
-    seeding_outcomes_diff = pd.DataFrame(dtype=float)
 
-    # Simulate playoff odds based on outcome of each matchup
-    for matchup in matchups:
-        # Simulate season if home team wins
-        home_team = matchup.home_team
-        outcomes_home_win = get_outcomes_if_team_wins(home_team, week, matchups)
-        seeding_outcomes_home_win = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_home_win,
-            first_week_to_simulate=week,
-        )[2].set_index("team_owner")
-
-        # Simulate season if away team wins
-        away_team = matchup.away_team
-        outcomes_away_win = get_outcomes_if_team_wins(away_team, week, matchups)
-        seeding_outcomes_away_win = simulate_season(
-            league,
-            n,
-            what_if=True,
-            outcomes=outcomes_away_win,
-            first_week_to_simulate=week,
-        )[2].set_index("team_owner")
-
-        # Merge results
-        seeding_outcomes = pd.merge(
-            seeding_outcomes_home_win[["last_in_league"]],
-            seeding_outcomes_away_win[["last_in_league"]],
-            suffixes=("_if_home_win", "_if_away_win"),
-            left_index=True,
-            right_index=True,
-        )
-        (
-            seeding_outcomes["last_in_league_if_win"],
-            seeding_outcomes["last_in_league_if_lose"],
-        ) = (
-            seeding_outcomes.min(axis=1),
-            seeding_outcomes.max(axis=1),
-        )
+def sweater_odds_swing(league: League, week: int, n: int = 1000) -> pd.DataFrame:
+    """
+    This function determines how much a team's odds of finishing in last place will change based on if they win or lose their next matchup.
 
-        # Calculate difference in playoff odds
-        seeding_outcomes["swing"] = (
-            seeding_outcomes["last_in_league_if_win"]
-            - seeding_outcomes["last_in_league_if_lose"]
-        )
+    The last place "swings" for each team is returned as a pandas DataFrame where "team_owner" is the index.
+    See simulate_swings() to compute the playoff, first place, and last place swings in one pass.
 
-        seeding_outcomes_diff = pd.concat(
-            [
-                seeding_outcomes,
-                seeding_outcomes[
-                    ["last_in_league_if_win", "last_in_league_if_lose", "swing"]
-                ]
-                .abs()
-                .loc[[home_team.owner, away_team.owner]],
-            ]
-        )
+    Args:
+        league (League): League
+        week (int): First week to include in the simulation.
+            - If week = 10, the function will simulate all matchups from Weeks 10 -> end of season.
+        n (int): Number of Monte Carlo simulations to run
 
-    return seeding_outcomes_diff
+    Returns:
+        pd.DataFrame: Difference in last place odds for each team if they win vs if they lose
+    """
+    return simulate_swings(league, week, n)[2]
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Make concurrent requests for the same key wait on a single computation.
+
+    Within a process, callers of the same key are serialized by a lock.
+    Across processes, the caller that computes holds a lease, which is a key
+    created with `cache.add()` (atomic in Django's cache backends). Other
+    callers poll `load()` until the value appears or the lease is released.
+    If the lease outlives `lease_timeout`, the waiter computes the value
+    itself so that a crashed worker cannot block a key forever.
+
+    `run_in_background()` uses the same lease to refresh a value without
+    making the caller wait (stale-while-revalidate).
+
+    Args:
+        cache: Django-style cache with `add()`, `get()` and `delete()`
+        lease_timeout (float): Max seconds to wait for another worker's computation. Defaults to 120.
+        poll_interval (float): Seconds between checks while waiting. Defaults to 0.25.
+        prefix (str): Prefix of the lease keys. Defaults to "single_flight".
+        background_workers (int): Threads running background computations. Defaults to 2.
+    """
+
+    def __init__(
+        self,
+        cache,
+        lease_timeout: float = 120,
+        poll_interval: float = 0.25,
+        prefix: str = "single_flight",
+        background_workers: int = 2,
+    ):
+        self.cache = cache
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.prefix = prefix
+        self.background_workers = background_workers
+        # key -> [lock, number of threads holding or waiting for it]
+        self._locks: Dict[str, List[Any]] = {}
+        self._locks_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def __repr__(self):
+        return f"SingleFlight(lease_timeout={self.lease_timeout})"
+
+    @contextmanager
+    def hold_lock(self, key: str) -> Iterator[None]:
+        """Hold the lock of `key`, which is discarded once no thread needs it."""
+        with self._locks_lock:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._locks_lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+    def run(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        load: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Get the value of `key`, computing it at most once at a time.
+
+        Args:
+            key (str): Key identifying the computation
+            compute (Callable[[], Any]): Computes (and stores) the value
+            load (Optional[Callable[[], Any]]): Returns the stored value, or None if there is none. Defaults to None, in which case `compute()` runs once the lease is free.
+
+        Returns:
+            Any: The loaded or computed value
+        """
+        lease_key = f"{self.prefix}_{key}"
+        with self.hold_lock(key):
+            deadline = time.monotonic() + self.lease_timeout
+            while True:
+                if load is not None:
+                    value = load()
+                    if value is not None:
+                        return value
+
+                token = uuid.uuid4().hex
+                if self.cache.add(lease_key, token, timeout=self.lease_timeout):
+                    try:
+                        # The previous lease holder may have just stored the value
+                        value = load() if load is not None else None
+                        return value if value is not None else compute()
+                    finally:
+                        if self.cache.get(lease_key) == token:
+                            self.cache.delete(lease_key)
+
+                if time.monotonic() >= deadline:
+                    logger.warning(
+                        f"Gave up waiting for {lease_key} after {self.lease_timeout}s"
+                    )
+                    return compute()
+                time.sleep(self.poll_interval)
+
+    def run_in_background(self, key: str, compute: Callable[[], Any]) -> bool:
+        """Start computing `key` in a background thread, unless it is already being computed.
+
+        Args:
+            key (str): Key identifying the computation
+            compute (Callable[[], Any]): Computes (and stores) the value
+
+        Returns:
+            bool: Whether the computation was started
+        """
+        lease_key = f"{self.prefix}_{key}"
+        token = uuid.uuid4().hex
+        if not self.cache.add(lease_key, token, timeout=self.lease_timeout):
+            return False
+
+        def target():
+            try:
+                compute()
+            except Exception:
+                logger.exception(f"Background computation of {key} failed")
+            finally:
+                if self.cache.get(lease_key) == token:
+                    self.cache.delete(lease_key)
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.background_workers,
+                    thread_name_prefix=self.prefix,
+                )
+        self._executor.submit(target)
+        return True
@@ -0,0 +1,192 @@
+from typing import Any, List, Optional
+
+import pandas as pd
+from django.db import transaction
+from espn_api.football import League, Team
+from espn_api.football.box_score import BoxScore
+
+from backend.fantasy_stats.models import TeamWeekStats
+from backend.src.doritostats.box_score_cache import get_box_scores, get_box_scores_many
+from backend.src.doritostats.row_builder import RowBuilder
+from backend.src.doritostats.scrape_team_stats import (
+    LINEUP_SLOTS,
+    TEAM_STATS_DTYPES,
+    add_matchup_stats_fields,
+    get_matchup_stats,
+    get_week_stats,
+)
+
+# Columns of `get_matchup_stats()` stored in TeamWeekStats.stats, in order
+LINEUP_STATS_COLUMNS = [
+    "weekly_finish",
+    "lineup_efficiency",
+    "best_trio",
+    "bench_points",
+    "team_projection_beat",
+    "n_bye",
+    "n_inactive",
+    "n_touchdowns",
+] + [
+    f"{prefix}{slot.replace('/', '_')}{suffix}"
+    for slot in LINEUP_SLOTS
+    for prefix, suffix in [("", "_pts"), ("best_", ""), ("worst_", "")]
+]
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert numpy scalars to Python scalars so they can be stored as JSON."""
+    return value.item() if hasattr(value, "item") else value
+
+
+def get_ingested_weeks(league_id: int, year: int) -> List[int]:
+    """Get the weeks of a season that have been stored.
+
+    Args:
+        league_id (int): League ID
+        year (int): Year of the league
+
+    Returns:
+        List[int]: Stored weeks, in order
+    """
+    return list(
+        TeamWeekStats.objects.filter(league_id=league_id, year=year)
+        .values_list("week", flat=True)
+        .distinct()
+        .order_by("week")
+    )
+
+
+def ingest_week(
+    league: League, week: int, box_scores: Optional[List[BoxScore]] = None
+) -> int:
+    """Store the stats of every team in a completed week.
+
+    Ingesting a week again replaces its rows, so this is safe to repeat.
+
+    Args:
+        league (League): League object
+        week (int): Week
+        box_scores (Optional[List[BoxScore]]): Box scores of the week. Defaults to None (fetch them).
+
+    Returns:
+        int: Number of rows stored
+    """
+    if box_scores is None:
+        box_scores = get_box_scores(league, week)
+
+    core_columns = list(TEAM_STATS_DTYPES)
+    rows = []
+    for matchup in box_scores:
+        # Skip byes
+        if (type(matchup.home_team) != Team) or (type(matchup.away_team) != Team):
+            continue
+
+        for team, home in [(matchup.home_team, True), (matchup.away_team, False)]:
+            row = get_matchup_stats(league, matchup, week, home=home)
+            rows.append(
+                TeamWeekStats(
+                    league_id=league.league_id,
+                    team_id=team.team_id,
+                    **{
+                        column: to_json_value(row.pop(column))
+                        for column in core_columns
+                    },
+                    stats={
+                        column: to_json_value(value) for column, value in row.items()
+                    },
+                )
+            )
+
+    with transaction.atomic():
+        TeamWeekStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["league_id", "year", "week", "team_id"],
+            update_fields=[
+                field.name
+                for field in TeamWeekStats._meta.concrete_fields
+                if field.name not in ("id", "league_id", "year", "week", "team_id")
+            ],
+        )
+    return len(rows)
+
+
+def ingest_completed_weeks(league: League, force: bool = False) -> List[int]:
+    """Store the stats of every completed week that hasn't been stored yet.
+
+    Args:
+        league (League): League object
+        force (bool): Store every completed week again. Defaults to False.
+
+    Returns:
+        List[int]: Weeks that were stored
+    """
+    ingested = (
+        set() if force else set(get_ingested_weeks(league.league_id, league.year))
+    )
+    weeks = [
+        week for week in range(1, league.n_completed_weeks + 1) if week not in ingested
+    ]
+
+    box_scores_by_week = get_box_scores_many(league, weeks)
+    for week in weeks:
+        ingest_week(league, week, box_scores_by_week[week])
+    return weeks
+
+
+def load_stats_history(league_id: int, year: Optional[int] = None) -> pd.DataFrame:
+    """Load the stored stats of a league, in the format of `get_stats_by_matchup()`
+    (before its calculated fields are added).
+
+    Args:
+        league_id (int): League ID
+        year (Optional[int]): Year of the league. Defaults to None (every year).
+
+    Returns:
+        pd.DataFrame: One row per team per stored week
+    """
+    queryset = TeamWeekStats.objects.filter(league_id=league_id)
+    if year is not None:
+        queryset = queryset.filter(year=year)
+
+    core_columns = list(TEAM_STATS_DTYPES)
+    rows = RowBuilder(TEAM_STATS_DTYPES)
+    for values in queryset.order_by("year", "week", "id").values(
+        *core_columns, "stats"
+    ):
+        stats = values.pop("stats")
+        values.update(
+            {
+                column: stats[column]
+                for column in LINEUP_STATS_COLUMNS
+                if column in stats
+            }
+        )
+        rows.append(values)
+    return rows.to_frame()
+
+
+def get_season_stats(league: League) -> pd.DataFrame:
+    """Get the historical stats dataframe of a season, like `get_stats_by_matchup()`.
+
+    Completed weeks are read from the database (after storing any new ones);
+    only the week in progress is built from its box scores.
+
+    Args:
+        league (League): League object
+
+    Returns:
+        pd.DataFrame: Historical stats dataframe
+    """
+    ingest_completed_weeks(league)
+    df = load_stats_history(league.league_id, league.year)
+
+    # Add the weeks that are still in progress
+    current_matchup_period = league.settings.week_to_matchup_period[league.current_week]
+    live_weeks = range(league.n_completed_weeks + 1, current_matchup_period + 1)
+    rows = RowBuilder(TEAM_STATS_DTYPES)
+    rows.extend(df.to_dict("records"))
+    for week, box_scores in get_box_scores_many(league, live_weeks).items():
+        rows.extend(get_week_stats(league, box_scores, week))
+
+    return add_matchup_stats_fields(rows.to_frame())
@@ -0,0 +1,41 @@
+import django
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
+
+# Tests that use Django run against an in-memory SQLite database and a local
+# memory cache, so they don't need the production database or its credentials
+if not settings.configured:
+    settings.configure(
+        SECRET_KEY="test",
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "backend.fantasy_stats.apps.FantasyStatsConfig",
+        ],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        },
+        DEFAULT_AUTO_FIELD="django.db.models.BigAutoField",
+        USE_TZ=True,
+        LOCAL_CACHE_MAX_MB=16,
+        SIMULATION_WORKERS=1,
+    )
+    django.setup()
+
+
+@pytest.fixture(scope="session")
+def django_db_setup():
+    call_command("migrate", verbosity=0)
+
+
+@pytest.fixture
+def django_db(django_db_setup):
+    """Run the test in a transaction that is rolled back afterwards."""
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
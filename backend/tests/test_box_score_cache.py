@@ -0,0 +1,107 @@
+import time
+from types import SimpleNamespace
+import pytest
+
+import src.doritostats.box_score_cache as box_score_cache  # The code to test
+from src.doritostats.analytic_utils import get_lineup
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    box_score_cache.BOX_SCORE_CACHE.clear()
+
+
+def make_league(league_id: int = 1, n_completed_weeks: int = 2):
+    """Build a fake League with 3 teams (one on bye) that counts its box score requests"""
+    teams = [SimpleNamespace(team_id=i, team_name=f"Team {i}") for i in range(1, 4)]
+    requests = []
+
+    def box_scores(week):
+        requests.append(week)
+        lineups = [
+            [SimpleNamespace(name=f"Player {team.team_id}", points=week)]
+            for team in teams
+        ]
+        return [
+            SimpleNamespace(
+                home_team=teams[0],
+                home_lineup=lineups[0],
+                away_team=teams[1],
+                away_lineup=lineups[1],
+            ),
+            SimpleNamespace(
+                home_team=teams[2], home_lineup=lineups[2], away_team=0, away_lineup=[]
+            ),
+        ]
+
+    return SimpleNamespace(
+        league_id=league_id,
+        year=2023,
+        teams=teams,
+        current_week=n_completed_weeks + 1,
+        n_completed_weeks=n_completed_weeks,
+        box_scores=box_scores,
+        requests=requests,
+    )
+
+
+def test_box_scores_are_cached():
+    league = make_league()
+    box_scores = box_score_cache.get_box_scores(league, 1)
+    cached = box_score_cache.get_box_scores(league, 1)
+
+    assert league.requests == [1]
+    assert cached[0].home_team is league.teams[0]
+    assert cached[0].away_team is league.teams[1]
+    assert cached[1].away_team == 0
+    assert cached[0].home_lineup == box_scores[0].home_lineup
+
+    # Other weeks and leagues are separate entries
+    box_score_cache.get_box_scores(league, 2)
+    box_score_cache.get_box_scores(make_league(league_id=2), 1)
+    assert league.requests == [1, 2]
+
+
+def test_cached_box_scores_use_the_callers_teams():
+    # e.g. two copies of the same league unpickled from the database cache
+    league = make_league()
+    league_copy = make_league()
+    box_score_cache.get_box_scores(league, 1)
+
+    cached = box_score_cache.get_box_scores(league_copy, 1)
+    assert league_copy.requests == []
+    assert cached[0].home_team is league_copy.teams[0]
+    assert (
+        get_lineup(league_copy, league_copy.teams[1], 1, cached)[0].name == "Player 2"
+    )
+
+    # The cached entry still holds team ids
+    assert box_score_cache.get_box_scores(league, 1)[0].home_team is league.teams[0]
+
+
+def test_live_week_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    league = make_league(n_completed_weeks=2)
+    box_score_cache.get_box_scores(league, 2)
+    box_score_cache.get_box_scores(league, 3)
+
+    now[0] += box_score_cache.LIVE_BOX_SCORE_TTL
+    box_score_cache.get_box_scores(league, 2)
+    box_score_cache.get_box_scores(league, 3)
+
+    # Only the week in progress was requested again
+    assert league.requests == [2, 3, 3]
+
+
+def test_get_box_scores_many():
+    league = make_league(n_completed_weeks=5)
+    box_score_cache.get_box_scores(league, 2)
+
+    box_scores = box_score_cache.get_box_scores_many(league, range(1, 5))
+    assert list(box_scores) == [1, 2, 3, 4]
+    assert box_scores[3][0].home_lineup[0].points == 3
+    assert box_scores[4][0].home_team is league.teams[0]
+
+    # Only the uncached weeks were requested
+    assert sorted(league.requests) == [1, 2, 3, 4]
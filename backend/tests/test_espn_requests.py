@@ -0,0 +1,183 @@
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from espn_api.football import League
+from espn_api.requests.espn_requests import ESPNInvalidLeague
+
+import src.doritostats.espn_requests as espn_requests  # The code to test
+import src.doritostats.fetch_utils as fetch
+
+
+class FakeSession:
+    """Records requests and returns a fixed payload"""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.requests = []
+
+    def get(self, endpoint, params=None, headers=None, cookies=None):
+        self.requests.append((endpoint, params))
+        return SimpleNamespace(status_code=self.status_code, json=lambda: self.payload)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = FakeSession({"status": {"isActive": True}, "draftDetail": {}})
+    monkeypatch.setattr(espn_requests, "get_espn_session", lambda: session)
+    return session
+
+
+def get_espn_request(year: int = 2023) -> espn_requests.SessionEspnRequests:
+    league = League(league_id=1, year=year, fetch_league=False)
+    return espn_requests.SessionEspnRequests.from_requests(league.espn_request)
+
+
+def test_get_espn_session_is_shared():
+    assert espn_requests.get_espn_session() is espn_requests.get_espn_session()
+
+
+def test_from_requests_keeps_attributes():
+    league = League(
+        league_id=1, year=2023, espn_s2="s2", swid="swid", fetch_league=False
+    )
+    espn_request = espn_requests.SessionEspnRequests.from_requests(league.espn_request)
+    assert espn_request.LEAGUE_ENDPOINT == league.espn_request.LEAGUE_ENDPOINT
+    assert espn_request.cookies == {"espn_s2": "s2", "SWID": "swid"}
+    assert espn_request.league_data is None
+
+
+def test_league_views_are_fetched_once(session):
+    espn_request = get_espn_request()
+
+    data = espn_request.get_league()
+    assert espn_request.get_league() is data
+    assert espn_request.get_league_draft() is data
+    assert len(session.requests) == 1
+    assert session.requests[0][1] == {"view": espn_requests.LEAGUE_VIEWS}
+
+    # Once cleared, the payload is requested again
+    espn_request.clear()
+    espn_request.get_league_draft()
+    assert len(session.requests) == 2
+    assert session.requests[1][1] == {"view": "mDraftDetail"}
+
+
+def test_old_seasons_return_first_payload(session):
+    session.payload = [{"seasonId": 2016}]
+    assert get_espn_request(year=2016).league_get() == {"seasonId": 2016}
+
+
+def test_request_errors(session):
+    session.status_code = 404
+    with pytest.raises(ESPNInvalidLeague):
+        get_espn_request().get_league()
+
+
+def test_fetch_concurrently():
+    assert espn_requests.fetch_concurrently(lambda x: x**2, range(20)) == [
+        x**2 for x in range(20)
+    ]
+    assert espn_requests.fetch_concurrently(lambda x: x, []) == []
+
+    def invert(x):
+        return 1 / x
+
+    with pytest.raises(ZeroDivisionError):
+        espn_requests.fetch_concurrently(invert, [1, 0, 2])
+
+    results = espn_requests.fetch_concurrently(
+        invert, [1, 0, 2], return_exceptions=True
+    )
+    assert results[0] == 1 and results[2] == 0.5
+    assert isinstance(results[1], ZeroDivisionError)
+
+
+def test_fetch_concurrently_max_workers():
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def work(x):
+        with lock:
+            in_flight.append(x)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.remove(x)
+        return x
+
+    results = espn_requests.fetch_concurrently(work, range(8), max_workers=2)
+
+    assert results == list(range(8))
+    assert max(max_in_flight) <= 2
+
+
+def test_requests_are_bounded(monkeypatch):
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    class SlowSession:
+        def get(self, url, **kwargs):
+            with lock:
+                in_flight.append(url)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(url)
+
+    monkeypatch.setattr(espn_requests, "get_espn_session", lambda: SlowSession())
+    monkeypatch.setattr(
+        espn_requests, "ESPN_REQUEST_SEMAPHORE", threading.BoundedSemaphore(2)
+    )
+
+    # Nested calls share the same bound on requests in flight
+    espn_requests.fetch_concurrently(
+        lambda season: espn_requests.fetch_concurrently(
+            lambda week: espn_requests.espn_get(f"{season}/{week}"), range(5)
+        ),
+        range(4),
+    )
+    assert len(max_in_flight) == 20
+    assert max(max_in_flight) <= 2
+
+
+def test_get_roster_settings_from_payload():
+    data = {
+        "settings": {
+            "name": "Test League",
+            "rosterSettings": {
+                "lineupSlotCounts": {"0": 1, "2": 2, "20": 6, "21": 1, "23": 1, "1": 0}
+            },
+        },
+        "schedule": [{"winner": "HOME"}, {"winner": "UNDECIDED"}],
+    }
+    league = League(league_id=1, year=2023, fetch_league=False)
+    fetch.get_roster_settings(league, data)
+
+    assert league.name == "Test League"
+    assert not league.is_season_complete
+    assert league.roster_settings == {
+        "roster_slots": {"QB": 1, "RB": 2, "BE": 6, "IR": 1, "RB/WR/TE": 1},
+        "starting_roster_slots": {"QB": 1, "RB": 2, "RB/WR/TE": 1},
+    }
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        ({"status": {"isActive": True}}, None),
+        ({"status": {"isActive": False}}, Exception),
+        ({"messages": ["Not Found"]}, fetch.ESPNInvalidLeague),
+        ({}, fetch.ESPNUnknownError),
+    ],
+)
+def test_verify_league_is_active_from_payload(data: dict, error):
+    league = League(league_id=1, year=2023, fetch_league=False)
+    if error is None:
+        fetch.verify_league_is_active(league, data)
+    else:
+        with pytest.raises(error):
+            fetch.verify_league_is_active(league, data)
@@ -0,0 +1,122 @@
+import time
+
+import pytest
+import requests
+
+# fetch_utils uses the shared session of the `backend.` import path
+import backend.src.doritostats.espn_requests as espn_requests
+import src.doritostats.espn_stand_in as espn_stand_in  # The code to test
+from src.doritostats.espn_stand_in import (
+    ESPNStandIn,
+    FixtureResponder,
+    RecordingAdapter,
+    SyntheticLeague,
+)
+from src.doritostats.fetch_utils import fetch_league
+
+
+@pytest.fixture
+def synthetic_stand_in():
+    with ESPNStandIn(SyntheticLeague()) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def stand_in_session(synthetic_stand_in):
+    yield espn_requests.configure_espn_session(stand_in_url=synthetic_stand_in.url)
+    espn_requests.ESPN_SESSION = None
+
+
+def test_get_fixture_key():
+    key = espn_stand_in.get_fixture_key(
+        "/ffl/seasons/2023", "view=mTeam&view=mRoster&scoringPeriodId=3", None
+    )
+    assert key == espn_stand_in.get_fixture_key(
+        "ffl/seasons/2023/", "scoringPeriodId=3&view=mTeam&view=mRoster", None
+    )
+    assert key != espn_stand_in.get_fixture_key(
+        "ffl/seasons/2023", "view=mTeam&view=mRoster&scoringPeriodId=4", None
+    )
+
+    # The x-fantasy-filter header is part of the key, but not its key order
+    filter_a = '{"schedule": {"a": 1, "b": 2}}'
+    filter_b = '{"schedule": {"b": 2, "a": 1}}'
+    assert espn_stand_in.get_fixture_key(
+        "ffl", "", filter_a
+    ) == espn_stand_in.get_fixture_key("ffl", "", filter_b)
+    assert espn_stand_in.get_fixture_key(
+        "ffl", "", filter_a
+    ) != espn_stand_in.get_fixture_key("ffl", "", None)
+
+
+def test_save_and_serve_fixture(tmp_path):
+    espn_stand_in.save_fixture(
+        str(tmp_path), "ffl/seasons/2023", "view=mTeam", None, 200, b'{"teams": []}'
+    )
+    responder = FixtureResponder(str(tmp_path))
+
+    assert responder("ffl/seasons/2023", "view=mTeam", None) == (200, b'{"teams": []}')
+    assert responder("ffl/seasons/2023", "view=mRoster", None) is None
+
+
+def test_record_and_replay(tmp_path, synthetic_stand_in):
+    league_path = SyntheticLeague().league_path
+    session = requests.Session()
+    session.mount(
+        synthetic_stand_in.url,
+        RecordingAdapter(str(tmp_path), base_url=synthetic_stand_in.url),
+    )
+    recorded = session.get(
+        synthetic_stand_in.url + league_path,
+        params={"view": ["mTeam", "mSettings"]},
+    ).json()
+    assert len(recorded["teams"]) == 10
+
+    # The recorded response is served identically, and unknown requests are a 404
+    with ESPNStandIn(FixtureResponder(str(tmp_path))) as replay:
+        r = requests.get(
+            replay.url + league_path, params={"view": ["mTeam", "mSettings"]}
+        )
+        assert r.status_code == 200
+        assert r.json() == recorded
+
+        r = requests.get(replay.url + league_path, params={"view": "mRoster"})
+        assert r.status_code == 404
+
+
+def test_latency():
+    with ESPNStandIn(SyntheticLeague(), latency=0.2) as stand_in:
+        start = time.perf_counter()
+        requests.get(stand_in.url + "ffl/seasons/2023")
+        assert time.perf_counter() - start >= 0.2
+
+
+def test_fetch_league_from_stand_in(stand_in_session):
+    synthetic_league = SyntheticLeague()
+    league = fetch_league(synthetic_league.league_id, synthetic_league.year)
+
+    assert len(league.teams) == synthetic_league.n_teams
+    assert league.current_week == synthetic_league.current_week
+    assert len(league.draft) > 0
+    assert league.espn_request.league_data is None
+
+    box_scores = league.box_scores(1)
+    assert len(box_scores) == synthetic_league.n_teams // 2
+    assert box_scores[0].home_score == synthetic_league.get_score(0, 1)
+
+
+def test_failed_requests_are_retried():
+    responses = [(503, b"{}"), (200, b'{"status": "ok"}')]
+
+    def flaky_responder(path, query, fantasy_filter):
+        return responses.pop(0)
+
+    with ESPNStandIn(flaky_responder) as stand_in:
+        espn_requests.configure_espn_session(stand_in_url=stand_in.url)
+        try:
+            r = espn_requests.espn_get(espn_requests.FANTASY_BASE_ENDPOINT + "ffl")
+        finally:
+            espn_requests.ESPN_SESSION = None
+
+    assert r.status_code == 200
+    assert responses == []
@@ -0,0 +1,45 @@
+import pytest
+import sqlalchemy
+from sqlalchemy.pool import StaticPool
+
+import src.doritostats.fetch_utils as fetch  # The code to test
+
+
+@pytest.fixture
+def league_info_db(monkeypatch):
+    """An in-memory stand-in for the league info table, served by the shared engine"""
+    engine = sqlalchemy.create_engine("sqlite://", poolclass=StaticPool)
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def attach_public_schema(dbapi_conn, _):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS public")
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE public.fantasy_stats_leagueinfo (league_id int, league_year int, swid text, espn_s2 text)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO public.fantasy_stats_leagueinfo VALUES (1, 2023, 'a', 'b'), (1, 2024, 'c', 'd'), (2, 2023, 'e', 'f')"
+        )
+    monkeypatch.setattr(fetch, "POSTGRES_ENGINE", engine)
+    return engine
+
+
+def test_get_league_creds_many(league_info_db):
+    assert fetch.get_league_creds_many([1, 2, 3]) == {
+        1: (1, 2024, "c", "d"),
+        2: (2, 2023, "e", "f"),
+    }
+    assert fetch.get_league_creds_many([1, 2], year=2023) == {
+        1: (1, 2023, "a", "b"),
+        2: (2, 2023, "e", "f"),
+    }
+    assert fetch.get_league_creds_many([]) == {}
+
+    assert fetch.get_league_creds(1) == (1, 2024, "c", "d")
+    assert fetch.get_league_creds(1, 2023) == (1, 2023, "a", "b")
+    with pytest.raises(Exception):
+        fetch.get_league_creds(3)
+
+    # Every query used the same engine
+    assert fetch.get_postgres_engine() is league_info_db
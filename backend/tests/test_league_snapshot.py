@@ -0,0 +1,213 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+import src.doritostats.league_snapshot as snap  # The code to test
+from src.doritostats.fetch_utils import standings_weekly
+from espn_api.football.league import League
+
+
+def make_league(n_teams: int = 6, n_weeks: int = 8, n_completed_weeks: int = 5):
+    """Build a fake League with a round-robin schedule, one bye week and lineups."""
+    rng = np.random.default_rng(0)
+    teams = [
+        SimpleNamespace(
+            team_id=i + 1,
+            team_name=f"Team {i + 1}",
+            owner=f"Owner {i + 1}",
+            division_id=i % 2,
+            division_name=f"Division {i % 2}",
+            standing=i + 1,
+            final_standing=0,
+            schedule=[],
+            scores=[],
+            outcomes=[],
+            mov=[],
+        )
+        for i in range(n_teams)
+    ]
+
+    rotation = list(range(n_teams))
+    for week in range(n_weeks):
+        pairs = [(rotation[i], rotation[n_teams - 1 - i]) for i in range(n_teams // 2)]
+        if week == 0:
+            # Give the first pair a bye
+            bye_pair, pairs = pairs[0], pairs[1:]
+            for team_idx in bye_pair:
+                teams[team_idx].schedule.append(teams[team_idx])
+                teams[team_idx].scores.append(0)
+                teams[team_idx].outcomes.append("U")
+                teams[team_idx].mov.append(0)
+        for home, away in pairs:
+            teams[home].schedule.append(teams[away])
+            teams[away].schedule.append(teams[home])
+            if week < n_completed_weeks:
+                home_score, away_score = rng.normal(100, 20, size=2).round(1)
+            else:
+                home_score, away_score = 0, 0
+            teams[home].scores.append(home_score)
+            teams[away].scores.append(away_score)
+            teams[home].mov.append(home_score - away_score)
+            teams[away].mov.append(away_score - home_score)
+            if week < n_completed_weeks:
+                teams[home].outcomes.append("W" if home_score > away_score else "L")
+                teams[away].outcomes.append("W" if away_score > home_score else "L")
+            else:
+                teams[home].outcomes.append("U")
+                teams[away].outcomes.append("U")
+        rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+
+    def box_scores(week):
+        box_scores, seen = [], set()
+        for team in teams:
+            if team.team_id in seen:
+                continue
+            opponent = team.schedule[week - 1]
+            seen.update([team.team_id, opponent.team_id])
+            lineups = [
+                [
+                    SimpleNamespace(
+                        name=f"{t.team_name} Player {p}",
+                        position="RB",
+                        slot_position="BE" if p == 2 else "RB",
+                        points=float(p),
+                        projected_points=10.0 + p,
+                        active_status="active",
+                        eligibleSlots=["RB", "RB/WR/TE", "BE"],
+                    )
+                    for p in range(3)
+                ]
+                for t in (team, opponent)
+            ]
+            box_scores.append(
+                SimpleNamespace(
+                    home_team=team,
+                    home_lineup=lineups[0],
+                    away_team=opponent if opponent is not team else 0,
+                    away_lineup=lineups[1] if opponent is not team else [],
+                )
+            )
+        return box_scores
+
+    settings = SimpleNamespace(
+        name="Test League",
+        reg_season_count=n_weeks,
+        playoff_team_count=2,
+        playoff_seed_tie_rule="TOTAL_POINTS_SCORED",
+        team_count=n_teams,
+        matchup_periods={str(w): [w] for w in range(1, n_weeks + 1)},
+        week_to_matchup_period={w: w for w in range(1, n_weeks + 1)},
+        division_map={0: "Division 0", 1: "Division 1"},
+    )
+    league = SimpleNamespace(
+        league_id=1234,
+        year=2025,
+        teams=teams,
+        settings=settings,
+        current_week=n_completed_weeks + 1,
+        currentMatchupPeriod=n_completed_weeks + 1,
+        n_completed_weeks=n_completed_weeks,
+        endpoint="https://example.com/",
+        box_scores=box_scores,
+    )
+    league.standings = lambda: League.standings(league)
+    league.standings_weekly = lambda week: standings_weekly(league, week)
+    league.power_rankings = lambda week: League.power_rankings(league, week)
+    return league
+
+
+def test_round_trip():
+    league = make_league()
+    snapshot = snap.LeagueSnapshot.from_league(league, lineup_weeks=[1, 2])
+    loaded = snap.LeagueSnapshot.from_bytes(snapshot.to_bytes(), include_lineups=True)
+
+    assert loaded.meta == snapshot.meta
+    assert loaded.columns.keys() == snapshot.columns.keys()
+    for name, column in snapshot.columns.items():
+        np.testing.assert_array_equal(loaded.columns[name], column)
+
+    # Settings keep their integer keys
+    assert loaded.meta["settings"]["week_to_matchup_period"][3] == 3
+    assert loaded.meta["settings"]["division_map"][1] == "Division 1"
+
+
+def test_lineups_are_optional():
+    league = make_league()
+    data = snap.LeagueSnapshot.from_league(league, lineup_weeks=[1]).to_bytes()
+
+    snapshot = snap.LeagueSnapshot.from_bytes(data)
+    assert not snapshot.has_lineups
+    with pytest.raises(ValueError):
+        snapshot.to_league().box_scores(1)
+
+    assert snap.LeagueSnapshot.from_bytes(data, include_lineups=True).has_lineups
+
+
+def test_version_check():
+    league = make_league()
+    snapshot = snap.LeagueSnapshot.from_league(league)
+    snapshot.meta["version"] = snap.SNAPSHOT_VERSION + 1
+    with pytest.raises(ValueError):
+        snap.LeagueSnapshot.from_bytes(snapshot.to_bytes())
+
+    with pytest.raises(ValueError):
+        snap.LeagueSnapshot.from_bytes(b"not a snapshot")
+
+
+def test_team_attributes():
+    league = make_league()
+    snapshot_league = snap.LeagueSnapshot.from_league(league).to_league()
+
+    assert snapshot_league.current_week == league.current_week
+    assert snapshot_league.n_completed_weeks == league.n_completed_weeks
+    assert snapshot_league.settings.playoff_team_count == 2
+    for team, snapshot_team in zip(league.teams, snapshot_league.teams):
+        assert snapshot_team.team_id == team.team_id
+        assert snapshot_team.owner == team.owner
+        assert snapshot_team.outcomes == team.outcomes
+        assert snapshot_team.scores == pytest.approx(team.scores)
+        assert snapshot_team.mov == pytest.approx(team.mov)
+        assert [t.team_id for t in snapshot_team.schedule] == [
+            t.team_id for t in team.schedule
+        ]
+
+
+def test_standings_match_league():
+    league = make_league()
+    snapshot_league = snap.LeagueSnapshot.from_league(league).to_league()
+
+    assert [t.team_id for t in snapshot_league.standings()] == [
+        t.team_id for t in league.standings()
+    ]
+    for week in range(2, league.n_completed_weeks + 1):
+        assert [t.team_id for t in snapshot_league.standings_weekly(week)] == [
+            t.team_id for t in league.standings_weekly(week)
+        ]
+
+
+def test_power_rankings_match_league():
+    league = make_league()
+    snapshot_league = snap.LeagueSnapshot.from_league(league).to_league()
+
+    for week in range(1, league.n_completed_weeks + 1):
+        expected = league.power_rankings(week)
+        result = snapshot_league.power_rankings(week)
+        assert [p for p, _ in result] == [p for p, _ in expected]
+        assert [t.team_id for _, t in result] == [t.team_id for _, t in expected]
+
+
+def test_box_scores():
+    league = make_league()
+    snapshot = snap.LeagueSnapshot.from_league(league, lineup_weeks=[1, 2])
+    snapshot_league = snapshot.to_league()
+
+    # Two teams have a bye in Week 1
+    box_scores = snapshot_league.box_scores(1)
+    assert len(box_scores) == len(league.box_scores(1))
+    assert sum(1 for b in box_scores if not b.away_team) == 2
+
+    box_score = snapshot_league.box_scores(2)[0]
+    assert len(box_score.home_lineup) == 3
+    assert box_score.home_projected == pytest.approx(21)
+    assert box_score.home_lineup[0].eligibleSlots == ["RB", "RB/WR/TE", "BE"]
+    assert box_score.home_score == box_score.home_team.scores[1]
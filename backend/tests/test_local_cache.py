@@ -0,0 +1,99 @@
+import pytest
+
+import src.doritostats.local_cache as local_cache  # The code to test
+from src.doritostats.local_cache import LocalCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(local_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_and_set():
+    cache = LocalCache(max_bytes=100, ttl=60)
+    assert cache.get("a") is None
+
+    cache.set("a", {"value": 1}, size=10)
+    assert cache.get("a") == {"value": 1}
+    assert cache.n_bytes == 10
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Replacing an entry replaces its size
+    cache.set("a", "new", size=30)
+    assert cache.get("a") == "new"
+    assert cache.n_bytes == 30
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = LocalCache(max_bytes=100, ttl=60)
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.get("a")  # "b" is now the least recently used
+
+    cache.set("c", 3, size=40)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.n_bytes == 80
+
+    # One large entry can evict several small ones
+    cache.set("d", 4, size=100)
+    assert len(cache) == 1
+    assert cache.n_bytes == 100
+
+
+def test_value_larger_than_cache_is_not_stored():
+    cache = LocalCache(max_bytes=100, ttl=60)
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=101)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+
+def test_ttl(clock):
+    cache = LocalCache(max_bytes=100, ttl=60)
+    cache.set("a", 1, size=10)
+
+    clock[0] += 59
+    assert cache.get("a") == 1
+
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert cache.n_bytes == 0
+
+    # Entries can have their own ttl
+    cache.set("b", 2, size=10, ttl=5)
+    cache.set("c", 3, size=10, ttl=float("inf"))
+    clock[0] += 1e6
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_version():
+    cache = LocalCache(max_bytes=100, ttl=60)
+    cache.set("a", 1, size=10, version="v1")
+
+    assert cache.get("a", version="v1") == 1
+    assert cache.get("a") == 1
+
+    # A newer version elsewhere invalidates the local copy
+    assert cache.get("a", version="v2") is None
+    assert "a" not in cache
+    assert cache.n_bytes == 0
+
+
+def test_delete_and_clear():
+    cache = LocalCache(max_bytes=100, ttl=60)
+    cache.set("a", 1, size=10)
+    cache.set("b", 2, size=10)
+
+    cache.delete("a")
+    cache.delete("missing")
+    assert "a" not in cache
+    assert cache.n_bytes == 10
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.n_bytes == 0
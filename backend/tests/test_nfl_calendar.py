@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+import pytz
+
+from src.doritostats import nfl_calendar  # The code to test
+
+EASTERN = pytz.timezone("US/Eastern")
+
+
+def eastern(*args) -> datetime.datetime:
+    return EASTERN.localize(datetime.datetime(*args))
+
+
+@pytest.mark.parametrize(
+    "now, in_progress",
+    [
+        (eastern(2024, 9, 8, 14, 0), True),  # Sunday afternoon
+        (eastern(2024, 9, 8, 8, 0), False),  # Sunday morning
+        (eastern(2024, 9, 9, 21, 0), True),  # Monday night
+        (eastern(2024, 9, 10, 21, 0), False),  # Tuesday night
+        (eastern(2024, 9, 12, 21, 0), True),  # Thursday night
+        (eastern(2024, 11, 28, 13, 0), True),  # Thanksgiving
+        (eastern(2024, 11, 21, 13, 0), False),  # Any other Thursday afternoon
+        (eastern(2024, 12, 21, 14, 0), True),  # Late season Saturday
+        (eastern(2024, 10, 19, 14, 0), False),  # Early season Saturday
+        (eastern(2024, 6, 9, 14, 0), False),  # Offseason Sunday
+        (datetime.datetime(2024, 9, 8, 18, 0, tzinfo=pytz.utc), True),  # 2pm Eastern
+    ],
+)
+def test_is_game_in_progress(now, in_progress):
+    assert nfl_calendar.is_game_in_progress(now) == in_progress
+
+
+def test_get_last_game_end():
+    # Tuesday: the last games ended Monday night
+    assert nfl_calendar.get_last_game_end(eastern(2024, 9, 10, 12, 0)) == eastern(
+        2024, 9, 9, 23, 59
+    )
+
+    # Monday afternoon: the last games ended Sunday night
+    assert nfl_calendar.get_last_game_end(eastern(2024, 9, 9, 12, 0)) == eastern(
+        2024, 9, 8, 23, 59
+    )
+
+    # No games in the offseason
+    assert nfl_calendar.get_last_game_end(eastern(2024, 6, 10, 12, 0)) is None
+
+
+def test_is_stale():
+    # During games, data is refreshed every LIVE_REFRESH_INTERVAL
+    sunday = eastern(2024, 9, 8, 14, 0)
+    assert not nfl_calendar.is_stale(sunday - datetime.timedelta(minutes=5), sunday)
+    assert nfl_calendar.is_stale(sunday - datetime.timedelta(minutes=10), sunday)
+
+    # After games, data fetched before they ended is stale
+    tuesday = eastern(2024, 9, 10, 9, 0)
+    assert nfl_calendar.is_stale(eastern(2024, 9, 9, 22, 0), tuesday)
+    assert not nfl_calendar.is_stale(eastern(2024, 9, 10, 1, 0), tuesday)
+
+    # Otherwise data is refreshed every IDLE_REFRESH_INTERVAL
+    wednesday = eastern(2024, 9, 11, 18, 0)
+    assert nfl_calendar.is_stale(eastern(2024, 9, 11, 1, 0), wednesday)
+    assert not nfl_calendar.is_stale(eastern(2024, 9, 11, 12, 0), wednesday)
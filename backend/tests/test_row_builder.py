@@ -0,0 +1,35 @@
+import numpy as np
+
+from src.doritostats.row_builder import RowBuilder  # The code to test
+
+
+def test_to_frame():
+    rows = RowBuilder({"year": "int64", "score": "float64", "is_playoff": "bool"})
+    rows.append({"score": 100, "year": 2023, "is_playoff": False, "extra": "a"})
+    rows.extend(
+        [
+            {"score": 90.5, "year": 2023, "is_playoff": True, "worst_QB": 3},
+            {"score": 80, "year": 2024, "is_playoff": False},
+        ]
+    )
+    assert len(rows) == 3
+
+    df = rows.to_frame()
+
+    # Typed columns come first, then the others in the order they appear
+    assert list(df.columns) == ["year", "score", "is_playoff", "extra", "worst_QB"]
+    assert df.dtypes["year"] == np.int64
+    assert df.dtypes["score"] == np.float64
+    assert df.dtypes["is_playoff"] == bool
+    assert df.year.tolist() == [2023, 2023, 2024]
+    assert list(df.index) == [0, 1, 2]
+
+    # Columns missing from a row are NaN
+    assert df.worst_QB.isna().tolist() == [True, False, True]
+
+
+def test_empty_frame_has_typed_columns():
+    df = RowBuilder({"year": "int64", "score": "float64"}).to_frame()
+    assert df.empty
+    assert list(df.columns) == ["year", "score"]
+    assert df.dtypes["year"] == np.int64
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+import src.doritostats.score_models as models  # The code to test
+
+
+@pytest.fixture
+def league() -> SimpleNamespace:
+    return SimpleNamespace(
+        teams=[
+            SimpleNamespace(team_id=1, scores=[100, 110, 120, 130, 0, 0]),
+            SimpleNamespace(team_id=2, scores=[80, 90, 100, 70, 0, 0]),
+            SimpleNamespace(team_id=3, scores=[95, 95, 95, 95, 0, 0]),
+        ],
+        league_id=1234,
+        year=2023,
+        current_week=5,
+    )
+
+
+def test_get_past_scores(league: SimpleNamespace):
+    past_scores = models.get_past_scores(league)
+    assert [len(scores) for scores in past_scores] == [4, 4, 4]
+
+    past_scores = models.get_past_scores(league, week=2)
+    np.testing.assert_array_equal(past_scores[0], [100, 110])
+
+
+def test_normal_score_model(league: SimpleNamespace):
+    model = models.NormalScoreModel().fit(league)
+    np.testing.assert_allclose(model.score_mean, [115, 85, 95])
+    np.testing.assert_allclose(
+        model.score_std,
+        [np.std([100, 110, 120, 130]) * 2, np.std([80, 90, 100, 70]) * 2, 0],
+    )
+
+    model = models.NormalScoreModel(n_recent_weeks=2, std_multiplier=1).fit(league)
+    np.testing.assert_allclose(model.score_mean, [125, 85, 95])
+
+    team_idx = np.array([[0, 1], [2, 0]])
+    scores = model.sample(
+        np.broadcast_to(team_idx, (1000, 2, 2)), np.random.default_rng(0)
+    )
+    assert scores.shape == (1000, 2, 2)
+    np.testing.assert_array_equal(scores[:, 1, 0], 95)
+    assert scores.mean() == pytest.approx(107.5, abs=1)
+
+
+def test_empirical_score_model(league: SimpleNamespace):
+    model = models.EmpiricalScoreModel().fit(league, week=3)
+    team_idx = np.array([0, 1, 2])
+    scores = model.sample(
+        np.broadcast_to(team_idx, (1000, 3)), np.random.default_rng(0)
+    )
+    assert scores.shape == (1000, 3)
+
+    # Only past scores are drawn
+    assert set(scores[:, 0]) == {100, 110, 120}
+    assert set(scores[:, 1]) == {80, 90, 100}
+    assert set(scores[:, 2]) == {95}
+
+
+def test_projection_score_model(league: SimpleNamespace):
+    fetched_weeks = []
+
+    def box_scores(week: int):
+        fetched_weeks.append(week)
+        return [
+            SimpleNamespace(
+                home_team=league.teams[0],
+                home_projected=140.5,
+                away_team=league.teams[1],
+                away_projected=0,  # No projection available
+            ),
+            SimpleNamespace(
+                home_team=league.teams[2],
+                home_projected=90,
+                away_team=0,
+                away_projected=0,
+            ),
+        ]
+
+    league.box_scores = box_scores
+    model = models.ProjectionScoreModel().fit(league)
+    np.testing.assert_allclose(model.score_mean, [140.5, 85, 90])
+    np.testing.assert_allclose(
+        model.score_std, models.NormalScoreModel().fit(league).score_std
+    )
+
+    # The box scores of the next week are fetched once, then read from the cache
+    models.ProjectionScoreModel().fit(league)
+    assert fetched_weeks == [5]
@@ -0,0 +1,154 @@
+import os
+
+import pandas as pd
+import pytest
+
+import src.doritostats.scrape_team_stats as scrape
+from src.doritostats.scrape_team_stats import (  # The code to test
+    add_adjusted_scores,
+    append_streaks,
+    extend_streaks,
+    get_median_scores,
+    get_season_checkpoint_path,
+    scrape_team_stats,
+)
+
+
+def test_add_adjusted_scores():
+    df = pd.DataFrame(
+        {
+            "year": [2022, 2022, 2022, 2023, 2023, 2023],
+            "team_score": [80.0, 100.0, 300.0, 100.0, 120.0, 200.0],
+            "opp_score": [100.0, 80.0, 0.0, 120.0, 100.0, 90.0],
+            "is_meaningful_game": [True, True, False, True, True, False],
+        }
+    )
+
+    # Games that are not meaningful don't count towards the median
+    median_scores = get_median_scores(df)
+    assert median_scores.to_dict() == {2022: 90.0, 2023: 110.0}
+
+    df = add_adjusted_scores(df, median_scores, reference_year=2023)
+
+    # Scores of the reference year are unchanged
+    assert df[df.year == 2023].team_score_adj.tolist() == [100.0, 120.0, 200.0]
+    assert df[df.year == 2023].opp_score_adj.tolist() == [120.0, 100.0, 90.0]
+
+    # Scores of other years are scaled by the ratio of the medians
+    assert df[df.year == 2022].team_score_adj.tolist() == pytest.approx(
+        [80 * 110 / 90, 100 * 110 / 90, 300 * 110 / 90]
+    )
+    assert df[df.year == 2022].opp_score_adj.tolist() == pytest.approx(
+        [100 * 110 / 90, 80 * 110 / 90, 0.0]
+    )
+
+
+def make_results(results: dict) -> pd.DataFrame:
+    """Build a historical stats dataframe from each owner's score_dif by year."""
+    return pd.DataFrame(
+        [
+            {"team_owner": owner, "year": year, "week": week, "score_dif": score_dif}
+            for (owner, year), score_difs in results.items()
+            for week, score_dif in enumerate(score_difs, start=1)
+        ]
+    )
+
+
+STREAK_RESULTS = {
+    ("A", 2022): [5, 3, -2, -1, -4, 0, 0, 6],
+    ("A", 2023): [1, -1, 2, 3],
+    ("B", 2022): [0, -3, 0, 2, 2, 2, -1],
+    ("B", 2023): [-1, -1],
+}
+EXPECTED_STREAKS = [
+    # A, 2022
+    *[1, 2, -1, -2, -3, 0, 0, 1],
+    # A, 2023 (streaks don't roll into the next season)
+    *[1, -1, 1, 2],
+    # B, 2022 (a tie in the first game counts as a loss)
+    *[-1, -1, 0, 1, 2, 3, -1],
+    # B, 2023
+    *[-1, -2],
+]
+
+
+def test_append_streaks():
+    df = make_results(STREAK_RESULTS).sample(frac=1, random_state=0)
+
+    df = append_streaks(df)
+
+    assert df.streak.tolist() == EXPECTED_STREAKS
+
+
+@pytest.mark.parametrize("last_week", [1, 2, 4, 6])
+def test_extend_streaks(last_week: int):
+    df = make_results(STREAK_RESULTS)
+    df_prev = append_streaks(df[df.week <= last_week])
+
+    df_new = extend_streaks(df_prev, df[df.week > last_week])
+
+    df = pd.concat([df_prev, df_new]).sort_values(["team_owner", "year", "week"])
+    assert df.streak.tolist() == EXPECTED_STREAKS
+
+
+def test_extend_streaks_new_season():
+    df = make_results(STREAK_RESULTS)
+    df_prev = append_streaks(df[df.year == 2022])
+
+    df_new = extend_streaks(df_prev, df[df.year == 2023])
+
+    df = pd.concat([df_prev, df_new]).sort_values(["team_owner", "year", "week"])
+    assert df.streak.tolist() == EXPECTED_STREAKS
+
+
+def make_season(year: int) -> pd.DataFrame:
+    """Build the (stand-in) scraped stats of one year."""
+    return pd.DataFrame(
+        {
+            "team_owner": ["a", "b"],
+            "year": [year, year],
+            "week": [1, 1],
+            "team_score": [100.0, 90.0],
+            "opp_score": [90.0, 100.0],
+            "score_dif": [10.0, -10.0],
+            "is_meaningful_game": [True, True],
+        }
+    )
+
+
+def test_scrape_team_stats_saves_finished_years(monkeypatch, tmp_path):
+    monkeypatch.setattr(scrape, "SEASON_CHECKPOINT_DIR", str(tmp_path))
+    scraped = []
+    failing_years = {2022}
+
+    def scrape_season_stats(league_id, year, swid, espn_s2):
+        scraped.append(year)
+        if year in failing_years:
+            raise ValueError(f"ESPN is down for {year}")
+        return make_season(year)
+
+    monkeypatch.setattr(scrape, "scrape_season_stats", scrape_season_stats)
+
+    # A failed year doesn't lose the years that were built
+    with pytest.raises(RuntimeError, match=r"\[2022\]"):
+        scrape_team_stats(1, 2021, 2023, None, None)
+    assert sorted(os.listdir(tmp_path)) == ["1_2021.csv", "1_2023.csv"]
+
+    # Running again only fetches the failed year, then removes the saved years
+    scraped.clear()
+    failing_years.clear()
+    df = scrape_team_stats(1, 2021, 2023, None, None)
+
+    assert scraped == [2022]
+    assert sorted(df.year.unique()) == [2021, 2022, 2023]
+    assert os.listdir(tmp_path) == []
+
+
+def test_scrape_team_stats_keeps_given_checkpoints(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        scrape, "scrape_season_stats", lambda league_id, year, *args: make_season(year)
+    )
+
+    scrape_team_stats(1, 2023, 2023, None, None, checkpoint_dir=str(tmp_path))
+
+    assert os.path.exists(get_season_checkpoint_path(str(tmp_path), 1, 2023))
@@ -0,0 +1,502 @@
+import time
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+import src.doritostats.simulation_utils as sim  # The code to test
+from src.doritostats.score_models import EmpiricalScoreModel, NormalScoreModel
+
+
+def make_league(
+    n_teams: int = 4,
+    n_weeks: int = 6,
+    n_completed_weeks: int = 3,
+    playoff_team_count: int = 2,
+    n_divisions: int = 1,
+    seed: int = 0,
+) -> SimpleNamespace:
+    """Build a fake League with a round-robin schedule and random scores for completed weeks."""
+    rng = np.random.default_rng(seed)
+    teams = [
+        SimpleNamespace(
+            team_id=i + 1,
+            team_name=f"Team {i + 1}",
+            owner=f"Owner {i + 1}",
+            division_id=i % n_divisions,
+            division_name=f"Division {i % n_divisions}",
+            schedule=[],
+            scores=[],
+            outcomes=[],
+        )
+        for i in range(n_teams)
+    ]
+
+    # Round-robin (circle method) schedule
+    rotation = list(range(n_teams))
+    for week in range(n_weeks):
+        pairs = [(rotation[i], rotation[n_teams - 1 - i]) for i in range(n_teams // 2)]
+        for home, away in pairs:
+            teams[home].schedule.append(teams[away])
+            teams[away].schedule.append(teams[home])
+            if week < n_completed_weeks:
+                home_score, away_score = rng.normal(100, 20, size=2).round(1)
+                teams[home].scores.append(home_score)
+                teams[away].scores.append(away_score)
+                teams[home].outcomes.append("W" if home_score > away_score else "L")
+                teams[away].outcomes.append("W" if away_score > home_score else "L")
+            else:
+                for team_idx in (home, away):
+                    teams[team_idx].scores.append(0)
+                    teams[team_idx].outcomes.append("U")
+        rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+
+    for team in teams:
+        team.wins = team.outcomes.count("W")
+        team.ties = team.outcomes.count("T")
+        team.losses = team.outcomes.count("L")
+        team.points_for = sum(team.scores)
+        team.points_against = sum(
+            [opp.scores[w] for w, opp in enumerate(team.schedule)]
+        )
+
+    settings = SimpleNamespace(
+        reg_season_count=n_weeks,
+        playoff_team_count=playoff_team_count,
+        playoff_seed_tie_rule="TOTAL_POINTS_SCORED",
+        division_map={d: f"Division {d}" for d in range(n_divisions)},
+    )
+    return SimpleNamespace(
+        teams=teams,
+        settings=settings,
+        current_week=n_weeks,
+        currentMatchupPeriod=n_weeks,
+    )
+
+
+def get_standings_array(league: SimpleNamespace) -> np.ndarray:
+    return np.array(
+        [[getattr(t, col) for col in sim.STANDINGS_COLUMNS] for t in league.teams],
+        dtype=float,
+    )
+
+
+@pytest.mark.parametrize(
+    "n_teams, n_weeks, first_week, shape",
+    [
+        (4, 6, 4, (3, 2, 2)),
+        (10, 14, 1, (14, 5, 2)),
+        (14, 14, 14, (1, 7, 2)),
+    ],
+)
+def test_build_remaining_schedule(n_teams: int, n_weeks: int, first_week: int, shape):
+    league = make_league(n_teams=n_teams, n_weeks=n_weeks)
+    schedule = sim.build_remaining_schedule(league, first_week)
+    assert schedule.shape == shape
+
+    # Every team plays exactly once per week
+    for week in schedule:
+        assert sorted(week.ravel().tolist()) == list(range(n_teams))
+
+
+def test_get_head_to_head():
+    league = make_league(n_teams=4, n_weeks=6, n_completed_weeks=3)
+    h2h_wins, h2h_games = sim.get_head_to_head(league, 3)
+
+    # Each pair of teams has played once (round robin)
+    np.testing.assert_array_equal(h2h_games, 1 - np.eye(4))
+    np.testing.assert_array_equal(h2h_wins + h2h_wins.T, h2h_games)
+    np.testing.assert_array_equal(
+        h2h_wins.sum(axis=1), [team.wins for team in league.teams]
+    )
+
+    # The remaining schedule is the same round robin again
+    schedule = sim.build_remaining_schedule(league, 4)
+    np.testing.assert_array_equal(sim.count_head_to_head_games(schedule, 4), h2h_games)
+
+
+def test_simulate_seasons():
+    league = make_league(n_teams=4, n_weeks=6, n_completed_weeks=3)
+    schedule = sim.build_remaining_schedule(league, 4)
+    standings = get_standings_array(league)
+    h2h_wins, _ = sim.get_head_to_head(league, 3)
+    simulated, simulated_h2h_wins = sim.simulate_seasons(
+        schedule,
+        NormalScoreModel().fit(league, 3),
+        standings,
+        h2h_wins,
+        500,
+        np.random.default_rng(1),
+    )
+
+    assert simulated.shape == (500, 4, 5)
+    assert simulated_h2h_wins.shape == (500, 4, 4)
+
+    # Every team plays every remaining game
+    np.testing.assert_array_equal(simulated[:, :, :3].sum(axis=-1), 6)
+
+    # Every game has exactly one winner and one loser
+    np.testing.assert_array_equal(simulated[:, :, 0].sum(axis=-1), 12)
+    np.testing.assert_array_equal(simulated[:, :, 2].sum(axis=-1), 12)
+
+    # Simulated points are added to the current points
+    assert (simulated[:, :, 3] > standings[None, :, 3]).all()
+    np.testing.assert_allclose(
+        simulated[:, :, 3].sum(axis=-1), simulated[:, :, 4].sum(axis=-1)
+    )
+
+    # Head-to-head wins add up to the total wins
+    np.testing.assert_array_equal(simulated_h2h_wins.sum(axis=-1), simulated[:, :, 0])
+
+
+@pytest.mark.parametrize(
+    "tie_rule", ["TOTAL_POINTS_SCORED", "H2H_RECORD", "INTRA_DIVISION_RECORD"]
+)
+@pytest.mark.parametrize("n_divisions", [1, 2])
+@pytest.mark.parametrize("seed", range(5))
+def test_resolve_seeding_matches_standings_weekly(
+    tie_rule: str, n_divisions: int, seed: int
+):
+    from src.doritostats.fetch_utils import standings_weekly
+
+    league = make_league(
+        n_teams=8, n_weeks=7, n_completed_weeks=7, n_divisions=n_divisions, seed=seed
+    )
+    league.settings.playoff_seed_tie_rule = tie_rule
+    h2h_wins, h2h_games = sim.get_head_to_head(league, 7)
+    final_rank = sim.resolve_seeding(
+        get_standings_array(league)[None],
+        h2h_wins[None],
+        h2h_games,
+        np.array([team.division_id for team in league.teams]),
+        tie_rule,
+        np.random.default_rng(0),
+    )[0]
+
+    expected_order = [team.team_id for team in standings_weekly(league, 7)]
+    order = [league.teams[i].team_id for i in np.argsort(final_rank)]
+    assert order == expected_order
+
+
+def test_resolve_seeding_division_winners_first():
+    # Team 3 wins division 1 with a worse record than both teams in division 0
+    standings = np.array(
+        [
+            [
+                [10, 0, 3, 1500, 1300],
+                [9, 0, 4, 1450, 1350],
+                [6, 0, 7, 1300, 1400],
+                [2, 0, 11, 1200, 1500],
+            ]
+        ],
+        dtype=float,
+    )
+    final_rank = sim.resolve_seeding(
+        standings,
+        np.zeros((1, 4, 4)),
+        np.zeros((4, 4)),
+        np.array([0, 0, 1, 1]),
+        "TOTAL_POINTS_SCORED",
+        np.random.default_rng(0),
+    )
+    np.testing.assert_array_equal(final_rank, [[1, 3, 2, 4]])
+
+
+def test_resolve_seeding_unknown_rule():
+    with pytest.raises(ValueError):
+        sim.resolve_seeding(
+            np.zeros((1, 2, 5)),
+            np.zeros((1, 2, 2)),
+            np.zeros((2, 2)),
+            np.array([0, 0]),
+            "UNKNOWN",
+            np.random.default_rng(0),
+        )
+
+
+def test_simulate_season_is_fast():
+    league = make_league(n_teams=14, n_weeks=14, n_completed_weeks=7)
+    start = time.time()
+    playoff_odds, rank_dist, seeding_outcomes = sim.simulate_season(league, n=10000)
+    assert time.time() - start < 10
+
+    # The league gets `playoff_team_count` playoff teams in every simulation
+    assert playoff_odds.playoff_odds.sum() == pytest.approx(200)
+    assert len(rank_dist) == len(seeding_outcomes) == 14
+
+
+def test_simulation_accumulator():
+    final_rank = np.array([[1, 2, 3, 4], [2, 1, 4, 3], [1, 3, 2, 4]])
+    simulated = np.ones((3, 4, 5))
+    accumulator = sim.SimulationAccumulator(np.array([0, 0, 1, 1]), 2)
+    accumulator.update(simulated, final_rank)
+
+    assert accumulator.n == 3
+    np.testing.assert_array_equal(accumulator.playoff_counts, [3, 2, 1, 0])
+    np.testing.assert_array_equal(accumulator.rank_counts.sum(axis=0), 3)
+    np.testing.assert_array_equal(accumulator.rank_counts.sum(axis=1), 3)
+    np.testing.assert_array_equal(accumulator.rank_counts[:, 0], [2, 1, 0, 0])
+    np.testing.assert_array_equal(accumulator.first_in_division_counts, [2, 1, 2, 1])
+    np.testing.assert_array_equal(accumulator.last_in_division_counts, [1, 2, 1, 2])
+    np.testing.assert_array_equal(accumulator.standings_mean, 1)
+
+    # Merging two accumulators is the same as updating one with both batches
+    merged = sim.SimulationAccumulator(np.array([0, 0, 1, 1]), 2)
+    merged.update(simulated[:1], final_rank[:1])
+    merged.merge(sim.SimulationAccumulator(np.array([0, 0, 1, 1]), 2))
+    other = sim.SimulationAccumulator(np.array([0, 0, 1, 1]), 2)
+    other.update(simulated[1:], final_rank[1:])
+    merged.merge(other)
+    assert merged.n == accumulator.n
+    np.testing.assert_array_equal(merged.rank_counts, accumulator.rank_counts)
+    np.testing.assert_array_equal(merged.playoff_counts, accumulator.playoff_counts)
+
+
+@pytest.mark.parametrize(
+    "n_completed_weeks, tolerance, max_n",
+    [
+        (13, 2, 2000),  # Late in the season, few simulations are needed
+        (7, 2, 10000),
+        (7, 0.01, 1000),  # Tolerance is never reached
+    ],
+)
+def test_run_simulations_anytime(n_completed_weeks: int, tolerance: float, max_n):
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=n_completed_weeks)
+    accumulator = sim.run_simulations(league, n=max_n, tolerance=tolerance)
+    assert accumulator.n <= max_n
+    assert accumulator.n % sim.ANYTIME_CHUNK_SIZE == 0
+    if accumulator.n < max_n:
+        assert accumulator.is_converged(tolerance)
+        # The previous chunk had not converged yet
+        assert not sim.run_simulations(
+            league, n=accumulator.n - sim.ANYTIME_CHUNK_SIZE
+        ).is_converged(tolerance)
+
+    lower, upper = accumulator.playoff_odds_interval()
+    assert (lower <= accumulator.playoff_odds).all()
+    assert (accumulator.playoff_odds <= upper).all()
+
+
+def test_run_simulations_time_budget():
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=7)
+    accumulator = sim.run_simulations(league, n=10000, time_budget=0)
+    assert accumulator.n == sim.ANYTIME_CHUNK_SIZE
+
+
+@pytest.mark.parametrize("week", [8, 14])
+def test_simulate_swings(week: int):
+    from src.doritostats.fetch_utils import standings_weekly
+
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=week - 1)
+    league.standings_weekly = lambda week: standings_weekly(league, week)
+
+    accumulator = sim.run_swing_simulations(league, week, n=2000)
+    assert accumulator.n == 2000
+
+    # Every simulated season is split by the outcome of each team's matchup
+    np.testing.assert_array_equal(accumulator.outcome_counts.sum(axis=0), 2000)
+    assert accumulator.playoff_counts.sum() == 2000 * league.settings.playoff_team_count
+    assert accumulator.first_in_league_counts.sum() == 2000
+
+    # Winning the matchup is worth one more win (on average)
+    expected_wins = accumulator.conditional_mean(accumulator.wins_sum)
+    np.testing.assert_allclose(expected_wins[0] - expected_wins[1], 1, atol=0.15)
+
+    playoff_swing, first_place_swing, sweater_swing = sim.simulate_swings(
+        league, week, n=2000
+    )
+    for swing in [playoff_swing, first_place_swing, sweater_swing]:
+        assert swing.index.name == "team_owner"
+        assert sorted(swing.index) == sorted(team.owner for team in league.teams)
+        assert (swing["swing"] >= 0).all()
+    assert (
+        playoff_swing["playoff_odds_if_win"] >= playoff_swing["playoff_odds_if_lose"]
+    ).all()
+    assert sim.playoff_odds_swing(league, week, n=2000).equals(playoff_swing)
+
+
+@pytest.mark.parametrize("score_model", [NormalScoreModel(), EmpiricalScoreModel()])
+def test_run_simulations_score_model(score_model):
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=7)
+    accumulator = sim.run_simulations(
+        league, n=1000, score_model=score_model.fit(league, 7)
+    )
+    assert accumulator.n == 1000
+    assert accumulator.playoff_counts.sum() == 1000 * 2
+
+    # Fitting the default model on the completed weeks gives the default results
+    if isinstance(score_model, NormalScoreModel):
+        np.testing.assert_array_equal(
+            accumulator.rank_counts, sim.run_simulations(league, n=1000).rank_counts
+        )
+
+
+def test_run_simulations_on_pool():
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=7)
+    try:
+        accumulator = sim.run_simulations(league, n=2500, chunk_size=1000, n_jobs=2)
+        pool = sim.get_simulation_pool(2)
+
+        # The pool is reused by later simulations
+        sim.run_simulations(league, n=100, n_jobs=2)
+        assert sim.get_simulation_pool(2) is pool
+    finally:
+        sim.shutdown_simulation_pool()
+
+    assert accumulator.n == 2500
+    assert accumulator.playoff_counts.sum() == 2500 * 2
+    np.testing.assert_array_equal(accumulator.rank_counts.sum(axis=0), 2500)
+
+
+def test_run_simulations_is_reproducible():
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=7)
+    accumulator = sim.run_simulations(league, n=2600, random_state=7)
+
+    # The results do not depend on how the simulations are split into chunks and workers
+    try:
+        for chunk_size, n_jobs in [(250, 1), (300, 1), (5000, 1), (500, 3)]:
+            other = sim.run_simulations(
+                league, n=2600, random_state=7, chunk_size=chunk_size, n_jobs=n_jobs
+            )
+            np.testing.assert_array_equal(other.rank_counts, accumulator.rank_counts)
+            np.testing.assert_array_equal(
+                other.standings_sum, accumulator.standings_sum
+            )
+    finally:
+        sim.shutdown_simulation_pool()
+
+    # Simulations can be continued by merging the next blocks
+    inputs = sim.build_simulation_inputs(league, sim.build_standings(league), 8)
+    merged = sim.SimulationAccumulator(inputs.division_ids, 2)
+    for block in sim.simulate_blocks(inputs, 0, 1000, 7) + sim.simulate_blocks(
+        inputs, 1000, 1600, 7
+    ):
+        merged.merge(block)
+    np.testing.assert_array_equal(merged.rank_counts, accumulator.rank_counts)
+    np.testing.assert_array_equal(merged.standings_sum, accumulator.standings_sum)
+
+    # A different seed gives different results
+    other = sim.run_simulations(league, n=2600, random_state=8)
+    assert (other.rank_counts != accumulator.rank_counts).any()
+
+
+class DictCache:
+    """Minimal stand-in for Django's cache API"""
+
+    def __init__(self):
+        self.data = {}
+        self.n_sets = 0
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.n_sets += 1
+        self.data[key] = value
+
+
+def test_simulation_store():
+    league = make_league(n_teams=10, n_weeks=14, n_completed_weeks=7)
+    inputs = sim.prepare_simulation_inputs(league)
+    store = sim.SimulationStore(DictCache())
+
+    # The first request runs all simulations, the next ones only top them up
+    accumulator = store.run(inputs, n=1000)
+    assert accumulator.n == 1000
+    accumulator = store.run(inputs, n=3000)
+    np.testing.assert_array_equal(
+        accumulator.rank_counts, sim.run_simulations(league, n=3000).rank_counts
+    )
+
+    # Stored simulations are served as-is if there are enough of them
+    assert store.run(inputs, n=2000).n == 3000
+    assert store.cache.n_sets == 2
+
+    # Partial blocks are re-simulated from scratch
+    assert store.run(inputs, n=3100).n == 3100
+    assert store.run(inputs, n=3300).n == 3300
+
+    # Any change to the league state uses a new entry
+    league.teams[0].scores[0] += 1
+    league.teams[0].points_for += 1
+    other_inputs = sim.prepare_simulation_inputs(league)
+    assert store.get_key(other_inputs, 42) != store.get_key(inputs, 42)
+    assert store.get_key(inputs, 43) != store.get_key(inputs, 42)
+    assert store.run(other_inputs, n=500).n == 500
+    assert len(store.cache.data) == 2
+
+
+def test_get_playoff_status():
+    # Team 0 has clinched and team 3 has been eliminated (2 playoff teams, 1 game left)
+    standings = np.array(
+        [
+            [5, 0, 0, 500, 400],
+            [3, 0, 2, 500, 400],
+            [3, 0, 2, 500, 400],
+            [1, 0, 4, 500, 400],
+        ],
+        dtype=float,
+    )
+    schedule = np.array([[[0, 3], [1, 2]]])
+    status = sim.get_playoff_status(
+        schedule, standings, np.array([0, 0, 0, 0]), 2, "TOTAL_POINTS_SCORED"
+    )
+    np.testing.assert_array_equal(
+        status,
+        [
+            sim.PLAYOFF_CLINCHED,
+            sim.PLAYOFF_ALIVE,
+            sim.PLAYOFF_ALIVE,
+            sim.PLAYOFF_ELIMINATED,
+        ],
+    )
+
+    # The winner of the division is in, no matter its record
+    status = sim.get_playoff_status(
+        schedule, standings, np.array([0, 0, 0, 1]), 2, "TOTAL_POINTS_SCORED"
+    )
+    np.testing.assert_array_equal(
+        status,
+        [
+            sim.PLAYOFF_CLINCHED,
+            sim.PLAYOFF_ELIMINATED,
+            sim.PLAYOFF_ELIMINATED,
+            sim.PLAYOFF_CLINCHED,
+        ],
+    )
+
+    # Nothing is decided when division records come first
+    status = sim.get_playoff_status(
+        schedule, standings, np.array([0, 0, 0, 0]), 2, "INTRA_DIVISION_RECORD"
+    )
+    np.testing.assert_array_equal(status, sim.PLAYOFF_ALIVE)
+
+
+@pytest.mark.parametrize("n_divisions", [1, 2])
+@pytest.mark.parametrize("weeks_left", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(3))
+def test_get_playoff_status_matches_simulations(
+    n_divisions: int, weeks_left: int, seed: int, monkeypatch
+):
+    league = make_league(
+        n_teams=10,
+        n_weeks=14,
+        n_completed_weeks=14 - weeks_left,
+        playoff_team_count=4,
+        n_divisions=n_divisions,
+        seed=seed,
+    )
+    accumulator = sim.run_simulations(league, n=2000)
+    status = accumulator.playoff_status
+
+    # Decided teams always (or never) make the playoffs
+    assert (accumulator.playoff_counts[status == sim.PLAYOFF_CLINCHED] == 2000).all()
+    assert (accumulator.playoff_counts[status == sim.PLAYOFF_ELIMINATED] == 0).all()
+    lower, upper = accumulator.playoff_odds_interval()
+    np.testing.assert_array_equal(lower[status == sim.PLAYOFF_CLINCHED], 1)
+    np.testing.assert_array_equal(upper[status == sim.PLAYOFF_ELIMINATED], 0)
+
+    # Without enumeration, fewer teams are found to be decided, but never the wrong way
+    monkeypatch.setattr(sim, "MAX_ENUMERATED_MATCHUPS", 0)
+    bound_status = sim.run_simulations(league, n=250).playoff_status
+    decided = bound_status != sim.PLAYOFF_ALIVE
+    np.testing.assert_array_equal(bound_status[decided], status[decided])
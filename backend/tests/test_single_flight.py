@@ -0,0 +1,173 @@
+import threading
+import time
+import pytest
+
+from src.doritostats.single_flight import SingleFlight  # The code to test
+
+
+class DictCache:
+    """Minimal stand-in for Django's cache API"""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def add(self, key, value, timeout=None):
+        with self.lock:
+            if key in self.data:
+                return False
+            self.data[key] = value
+            return True
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def run_concurrently(funcs):
+    results = [None] * len(funcs)
+
+    def target(i):
+        results[i] = funcs[i]()
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(len(funcs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def make_computation(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        cache.set("value", "computed")
+        return "computed"
+
+    return compute, (lambda: cache.get("value")), calls
+
+
+def test_concurrent_misses_in_one_process():
+    cache = DictCache()
+    single_flight = SingleFlight(cache, poll_interval=0.01)
+    compute, load, calls = make_computation(cache)
+
+    results = run_concurrently(
+        [lambda: single_flight.run("key", compute, load=load)] * 8
+    )
+    assert results == ["computed"] * 8
+    assert len(calls) == 1
+
+    # The lease is released
+    assert cache.get("single_flight_key") is None
+
+    # The in-process locks are discarded once no thread needs them
+    assert single_flight._locks == {}
+
+
+def test_concurrent_misses_across_processes():
+    # Each SingleFlight stands in for a separate worker process sharing the cache
+    cache = DictCache()
+    compute, load, calls = make_computation(cache)
+
+    results = run_concurrently(
+        [
+            lambda: SingleFlight(cache, poll_interval=0.01).run(
+                "key", compute, load=load
+            )
+            for _ in range(4)
+        ]
+    )
+    assert results == ["computed"] * 4
+    assert len(calls) == 1
+
+
+def test_without_load_computations_do_not_overlap():
+    cache = DictCache()
+    running = []
+    overlaps = []
+
+    def compute():
+        running.append(1)
+        overlaps.append(len(running) > 1)
+        time.sleep(0.05)
+        running.pop()
+        return "computed"
+
+    results = run_concurrently(
+        [
+            lambda: SingleFlight(cache, poll_interval=0.01).run("key", compute)
+            for _ in range(3)
+        ]
+    )
+    assert results == ["computed"] * 3
+    assert not any(overlaps)
+
+
+def test_different_keys_run_in_parallel():
+    cache = DictCache()
+    single_flight = SingleFlight(cache, poll_interval=0.01)
+
+    def compute():
+        time.sleep(0.2)
+        return "computed"
+
+    start = time.monotonic()
+    run_concurrently(
+        [lambda key=key: single_flight.run(key, compute) for key in ["a", "b", "c"]]
+    )
+    assert time.monotonic() - start < 0.5
+    assert single_flight._locks == {}
+
+
+def test_stale_lease_times_out():
+    cache = DictCache()
+    cache.add("single_flight_key", "crashed worker")
+    single_flight = SingleFlight(cache, lease_timeout=0.05, poll_interval=0.01)
+    compute, load, calls = make_computation(cache)
+
+    assert single_flight.run("key", compute, load=load) == "computed"
+    assert len(calls) == 1
+
+
+def test_errors_release_the_lease():
+    cache = DictCache()
+    single_flight = SingleFlight(cache, poll_interval=0.01)
+
+    def compute():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        single_flight.run("key", compute)
+    assert cache.get("single_flight_key") is None
+    assert single_flight._locks == {}
+
+
+def test_run_in_background():
+    cache = DictCache()
+    single_flight = SingleFlight(cache, poll_interval=0.01)
+    compute, load, calls = make_computation(cache)
+
+    # Only one background computation of a key runs at a time
+    assert single_flight.run_in_background("key", compute)
+    assert not single_flight.run_in_background("key", compute)
+
+    # Callers that wait on the key see the new value once it is stored
+    assert single_flight.run("key", lambda: "recomputed", load=load) == "computed"
+    assert len(calls) == 1
+
+    # Errors are logged, and release the lease
+    def fail():
+        raise ValueError("failed")
+
+    assert single_flight.run_in_background("other", fail)
+    single_flight._executor.shutdown(wait=True)
+    assert cache.get("single_flight_other") is None
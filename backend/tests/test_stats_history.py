@@ -0,0 +1,85 @@
+import pytest
+from pandas.testing import assert_frame_equal
+
+# fetch_utils uses the shared session of the `backend.` import path
+import backend.src.doritostats.espn_requests as espn_requests
+import backend.src.doritostats.stats_history as stats_history  # The code to test
+from backend.fantasy_stats.models import TeamWeekStats
+from backend.src.doritostats.espn_stand_in import ESPNStandIn, SyntheticLeague
+from backend.src.doritostats.fetch_utils import fetch_league
+from backend.src.doritostats.scrape_team_stats import (
+    add_matchup_stats_fields,
+    get_stats_by_matchup,
+)
+
+
+@pytest.fixture(scope="module")
+def league():
+    # 10 teams, 10 completed weeks, week 11 in progress
+    with ESPNStandIn(SyntheticLeague()) as stand_in:
+        espn_requests.configure_espn_session(stand_in_url=stand_in.url)
+        yield fetch_league(league_id=1, year=2023)
+    espn_requests.ESPN_SESSION = None
+
+
+@pytest.fixture
+def fetched_weeks(monkeypatch):
+    """Record the weeks whose box scores stats_history fetches."""
+    weeks = []
+    get_box_scores_many = stats_history.get_box_scores_many
+
+    def record(league, requested_weeks):
+        requested_weeks = list(requested_weeks)
+        weeks.extend(requested_weeks)
+        return get_box_scores_many(league, requested_weeks)
+
+    monkeypatch.setattr(stats_history, "get_box_scores_many", record)
+    return weeks
+
+
+def test_ingest_week(league, django_db):
+    assert stats_history.ingest_week(league, 1) == 10
+    rows = TeamWeekStats.objects.filter(league_id=1, year=2023, week=1)
+    stored = {row.team_id: (row.team_score, row.stats) for row in rows}
+    assert len(stored) == 10
+
+    # Ingesting the week again updates its rows in place
+    rows.update(team_score=0, stats={})
+    assert stats_history.ingest_week(league, 1) == 10
+
+    rows = TeamWeekStats.objects.filter(league_id=1, year=2023, week=1)
+    assert {row.team_id: (row.team_score, row.stats) for row in rows} == stored
+    assert stats_history.get_ingested_weeks(1, 2023) == [1]
+
+
+def test_load_stats_history(league, django_db):
+    assert stats_history.ingest_completed_weeks(league) == list(range(1, 11))
+
+    df = add_matchup_stats_fields(stats_history.load_stats_history(1, 2023))
+
+    expected = get_stats_by_matchup(league=league)
+    expected = expected[expected.week <= league.n_completed_weeks]
+    assert_frame_equal(
+        df.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_get_season_stats(league, django_db, fetched_weeks):
+    for week in range(1, 7):
+        stats_history.ingest_week(league, week)
+
+    df = stats_history.get_season_stats(league)
+
+    # Only the completed weeks that weren't stored, and the live week, are fetched
+    assert fetched_weeks == [7, 8, 9, 10, 11]
+    assert stats_history.get_ingested_weeks(1, 2023) == list(range(1, 11))
+    assert_frame_equal(
+        df.reset_index(drop=True),
+        get_stats_by_matchup(league=league).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    # Once every completed week is stored, only the live week is fetched
+    fetched_weeks.clear()
+    stats_history.get_season_stats(league)
+    assert fetched_weeks == [11]
@@ -0,0 +1,271 @@
+import datetime
+import json
+import threading
+import time
+from io import StringIO
+
+import pytest
+import pytz
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory
+
+import backend.fantasy_stats.views as views  # The code to test
+from backend.fantasy_stats.models import LeagueInfo
+
+LEAGUE_ID = 1
+LEAGUE_YEAR = 2023
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear()
+    views.LOCAL_CACHE.clear()
+    yield
+    cache.clear()
+    views.LOCAL_CACHE.clear()
+
+
+def cache_league(league_id: int, league_year: int, refreshed_at: datetime.datetime):
+    """Cache a (stand-in) league and its snapshot as if they were refreshed at `refreshed_at`."""
+    for cache_key, value in [
+        (views.get_league_cache_key(league_id, league_year), "league"),
+        (views.get_league_snapshot_cache_key(league_id, league_year), "snapshot"),
+    ]:
+        views.set_cache_entry(cache_key, b"data", value)
+        cache.set(f"{cache_key}_refreshed_at", refreshed_at)
+
+
+def test_stale_league_is_refreshed_once(monkeypatch):
+    cache_league(LEAGUE_ID, LEAGUE_YEAR, datetime.datetime(2023, 9, 1, tzinfo=pytz.utc))
+
+    calls = []
+    loaded = threading.Event()
+    refreshed = threading.Event()
+
+    def refresh_cached_league(league_id: int, league_year: int):
+        calls.append((league_id, league_year))
+        # Hold the refresh until both the league and its snapshot have been served
+        loaded.wait(timeout=5)
+        refreshed.set()
+
+    monkeypatch.setattr(views, "refresh_cached_league", refresh_cached_league)
+
+    # The stale league and snapshot are served immediately
+    assert views.get_cached_league(LEAGUE_ID, LEAGUE_YEAR) == "league"
+    assert views.get_cached_league_snapshot(LEAGUE_ID, LEAGUE_YEAR) == "snapshot"
+    loaded.set()
+
+    # Both share one background refresh of the league
+    assert refreshed.wait(timeout=5)
+    assert calls == [(LEAGUE_ID, LEAGUE_YEAR)]
+
+
+def test_background_refresh_closes_connections(monkeypatch):
+    cache_league(LEAGUE_ID, LEAGUE_YEAR, datetime.datetime(2023, 9, 1, tzinfo=pytz.utc))
+
+    closed_by = []
+    closed = threading.Event()
+
+    class Connections:
+        def close_all(self):
+            closed_by.append(threading.current_thread())
+            closed.set()
+
+    monkeypatch.setattr(views, "connections", Connections())
+    monkeypatch.setattr(views, "refresh_cached_league", lambda **kwargs: None)
+
+    views.get_cached_league(LEAGUE_ID, LEAGUE_YEAR)
+
+    # The background thread closes its own database connections when it is done
+    assert closed.wait(timeout=5)
+    assert closed_by != [threading.current_thread()]
+
+
+@pytest.fixture
+def refreshed_leagues(monkeypatch):
+    """Record the leagues refreshed from ESPN. League 0 fails to refresh."""
+    refreshed = []
+
+    def refresh_cached_league(league_id: int, league_year: int):
+        if league_id == 0:
+            raise views.InvalidLeagueError(f"League {league_id} ({league_year}) failed")
+        refreshed.append((league_id, league_year))
+
+    monkeypatch.setattr(views, "refresh_cached_league", refresh_cached_league)
+    return refreshed
+
+
+def test_preload_leagues(refreshed_leagues):
+    now = datetime.datetime.now(pytz.utc)
+    cache_league(1, LEAGUE_YEAR, refreshed_at=now)
+    cache_league(2, LEAGUE_YEAR, refreshed_at=now - datetime.timedelta(days=2))
+
+    results = views.preload_leagues(
+        [(0, LEAGUE_YEAR), (1, LEAGUE_YEAR), (2, LEAGUE_YEAR), (3, LEAGUE_YEAR)]
+    )
+
+    # Fresh leagues are skipped, and a failed league doesn't stop the others
+    assert [(result["league_id"], result["status"]) for result in results] == [
+        (0, "failed"),
+        (1, "cached"),
+        (2, "refreshed"),
+        (3, "refreshed"),
+    ]
+    assert "failed" in results[0]["error"]
+    assert sorted(refreshed_leagues) == [(2, LEAGUE_YEAR), (3, LEAGUE_YEAR)]
+
+    # Fresh leagues are refreshed anyway when forced
+    results = views.preload_leagues([(1, LEAGUE_YEAR)], force=True)
+    assert results[0]["status"] == "refreshed"
+
+
+def hold_refresh_lease(league_id: int, league_year: int, seconds: float):
+    """Refresh a league elsewhere: hold its lease, then cache it and release the lease."""
+    lease_key = f"single_flight_{views.get_league_cache_key(league_id, league_year)}"
+    assert cache.add(lease_key, "elsewhere")
+
+    def finish_refresh():
+        time.sleep(seconds)
+        cache_league(league_id, league_year, datetime.datetime.now(pytz.utc))
+        cache.delete(lease_key)
+
+    thread = threading.Thread(target=finish_refresh)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("force", [False, True])
+def test_preload_leagues_waits_for_refresh_elsewhere(refreshed_leagues, force: bool):
+    cache_league(1, LEAGUE_YEAR, datetime.datetime(2023, 9, 1, tzinfo=pytz.utc))
+    thread = hold_refresh_lease(1, LEAGUE_YEAR, seconds=0.3)
+
+    results = views.preload_leagues([(1, LEAGUE_YEAR), (2, LEAGUE_YEAR)], force=force)
+    thread.join()
+
+    # The league being refreshed elsewhere is not fetched a second time
+    assert [result["status"] for result in results] == ["cached", "refreshed"]
+    assert refreshed_leagues == [(2, LEAGUE_YEAR)]
+
+
+def post_preload_leagues(body: str):
+    request = RequestFactory().post(
+        "/api/preload-leagues/", data=body, content_type="application/json"
+    )
+    return views.preload_leagues_view(request)
+
+
+def test_preload_leagues_view(refreshed_leagues):
+    response = post_preload_leagues(
+        json.dumps(
+            {
+                "leagues": [
+                    {"league_id": 0, "league_year": LEAGUE_YEAR},
+                    {"league_id": "1", "league_year": str(LEAGUE_YEAR)},
+                ]
+            }
+        )
+    )
+
+    assert response.status_code == 200
+    data = json.loads(response.content)
+    assert data["n_failed"] == 1
+    assert [league["status"] for league in data["leagues"]] == ["failed", "refreshed"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "not json",
+        "[]",
+        json.dumps({"leagues": "1"}),
+        json.dumps({"leagues": [{"league_id": 1}]}),
+        json.dumps({"leagues": [{"league_id": "abc", "league_year": 2023}]}),
+        json.dumps({"leagues": [{"league_id": None, "league_year": 2023}]}),
+    ],
+)
+def test_preload_leagues_view_invalid_body(refreshed_leagues, body: str):
+    assert post_preload_leagues(body).status_code == 400
+    assert refreshed_leagues == []
+
+
+def test_preload_leagues_view_too_many_leagues(refreshed_leagues):
+    leagues = [
+        {"league_id": league_id, "league_year": LEAGUE_YEAR}
+        for league_id in range(1, views.MAX_LEAGUES_TO_PRELOAD + 2)
+    ]
+
+    response = post_preload_leagues(json.dumps({"leagues": leagues}))
+
+    assert response.status_code == 400
+    assert refreshed_leagues == []
+
+
+def test_preload_leagues_command(django_db, refreshed_leagues):
+    for league_id in [0, 1, 2]:
+        LeagueInfo.objects.create(
+            league_id=league_id, league_year=LEAGUE_YEAR, swid="", espn_s2=""
+        )
+    LeagueInfo.objects.create(league_id=3, league_year=2022, swid="", espn_s2="")
+    cache_league(1, LEAGUE_YEAR, refreshed_at=datetime.datetime.now(pytz.utc))
+
+    stdout = StringIO()
+    call_command("preload_leagues", year=LEAGUE_YEAR, stdout=stdout)
+
+    # Only the leagues of the year are preloaded
+    assert refreshed_leagues == [(2, LEAGUE_YEAR)]
+    assert "1 refreshed, 1 already cached, 1 failed" in stdout.getvalue()
+
+
+def test_refresh_leagues_command(django_db, refreshed_leagues):
+    for league_id in [1, 2, 3]:
+        LeagueInfo.objects.create(
+            league_id=league_id, league_year=LEAGUE_YEAR, swid="", espn_s2=""
+        )
+        cache_league(
+            league_id, LEAGUE_YEAR, datetime.datetime(2023, 9, 1, tzinfo=pytz.utc)
+        )
+    thread = hold_refresh_lease(1, LEAGUE_YEAR, seconds=0.3)
+
+    stdout = StringIO()
+    call_command("refresh_leagues", once=True, year=LEAGUE_YEAR, stdout=stdout)
+    thread.join()
+
+    # The stale league being refreshed elsewhere is not fetched a second time
+    assert sorted(refreshed_leagues) == [(2, LEAGUE_YEAR), (3, LEAGUE_YEAR)]
+    assert f"1 ({LEAGUE_YEAR})" not in stdout.getvalue()
+    assert f"2 ({LEAGUE_YEAR}): refreshed" in stdout.getvalue()
+
+
+@pytest.mark.parametrize(
+    "query, n_simulations, tolerance",
+    [
+        ("week=5", views.MAX_SIMULATIONS, views.SIMULATION_TOLERANCE),
+        ("week=5&n_simulations=100000", views.MAX_SIMULATIONS, None),
+        ("week=5&n_simulations=500&tolerance=1", 500, 1.0),
+    ],
+)
+def test_simulations_are_time_budgeted(monkeypatch, query, n_simulations, tolerance):
+    simulations = []
+
+    def django_simulation(**kwargs):
+        simulations.append(kwargs)
+        return [], [], [], 0
+
+    monkeypatch.setattr(views, "get_cached_league", lambda **kwargs: "league")
+    monkeypatch.setattr(views, "django_simulation", django_simulation)
+
+    request = RequestFactory().get(f"/api/playoff-odds/?{query}")
+    response = views.simulate_playoff_odds_view(request, LEAGUE_ID, LEAGUE_YEAR)
+
+    # Fixed numbers of simulations are also limited by the time budget
+    assert response.status_code == 200
+    assert simulations == [
+        {
+            "league": "league",
+            "n_simulations": n_simulations,
+            "week": 5,
+            "tolerance": tolerance,
+            "time_budget": views.SIMULATION_TIME_BUDGET,
+        }
+    ]